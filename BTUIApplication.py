@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import time
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, '..'))
@@ -7,6 +8,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from PyQt6.QtCore import Qt
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QBrush
 from PyQt6.QtGui import QFont
 from PyQt6.QtGui import QIcon
@@ -27,6 +29,12 @@ from PyQt6.QtWidgets import QWidget
 import style_sheet as styles
 from controller_ui import TestControllerUI
 from host_ui import TestApplication
+from libraries.bluetooth.adapter_manager import MultiAdapterManager
+from libraries.bluetooth.daemon_supervisor import DaemonSupervisor
+from libraries.bluetooth.daemon_supervisor import dbus_name_has_owner
+from libraries.bluetooth.daemon_supervisor import pulseaudio_ready
+from libraries.bluetooth.daemon_supervisor import system_bus_ready
+from libraries.bluetooth.dbus_dispatch import start_dispatcher
 from Utils.logger import Logger
 from Utils.utils import controller_enable
 from Utils.utils import get_controllers_connected
@@ -72,9 +80,13 @@ class CustomDialog(QDialog):
 class BluetoothUIApp(QMainWindow):
     """Main window for the Bluetooth testing UI application.
     Handles controller discovery, logger setup and UI navigation between modules"""
+
+    controller_summary_loaded = pyqtSignal(object, str)
+
     def __init__(self):
         """Initializes the main Bluetooth UI application."""
         super().__init__()
+        self.controller_summary_loaded.connect(self.show_controller_summary)
         self.log = Logger("UI")
         self.controllers_list_layout = None
         self.controllers_list_widget = None
@@ -85,6 +97,8 @@ class BluetoothUIApp(QMainWindow):
         self.interface = None
         self.background_path = None
         self.controllers_list = {}
+        self.adapter_manager = None
+        self.daemon_supervisor = None
 
     def list_controllers(self):
         """Creates and displays the main UI layout to list Bluetooth controllers and
@@ -198,10 +212,38 @@ class BluetoothUIApp(QMainWindow):
             self.controllers_list_widget.takeItem(self.previous_row_selected)
 
         row = self.controllers_list_widget.currentRow()
-        item = QListWidgetItem(get_controller_interface_details(self.log, self.interface, detail_level='basic_info'))
+        item = QListWidgetItem("Loading controller details...")
         item.setTextAlignment(Qt.AlignmentFlag.AlignHCenter)
         self.controllers_list_widget.insertItem(row + 1, item)
         self.previous_row_selected = row + 1
+        threading.Thread(target=self.load_controller_summary, args=(self.interface, item), daemon=True).start()
+
+    def load_controller_summary(self, interface, item):
+        """Read the basic controller details on a worker thread and hand them to the GUI thread.
+
+        Args:
+            interface: Bluetooth adapter interface (e.g., hci0).
+            item: List item showing the details.
+        """
+        try:
+            summary = get_controller_interface_details(self.log, interface, detail_level='basic_info')
+        except Exception as error:
+            self.log.warning("Failed to read controller details of %s: %s", interface, error)
+            summary = "Controller details unavailable"
+        self.controller_summary_loaded.emit(item, summary)
+
+    def show_controller_summary(self, item, summary):
+        """Show the basic controller details if the item is still listed.
+
+        Args:
+            item: List item showing the details.
+            summary: Text returned by the controller tool.
+        """
+        try:
+            if self.controllers_list_widget and self.controllers_list_widget.row(item) >= 0:
+                item.setText(summary)
+        except RuntimeError:
+            pass
 
     def check_controller_selected(self):
         """Checks if a controller is selected before navigating to the controller testing screen.
@@ -232,14 +274,30 @@ class BluetoothUIApp(QMainWindow):
             self.centralWidget().deleteLater()
 
         self.setWindowTitle('Test Host')
-        if not hasattr(self, 'daemons_started') :
-            start_dbus_daemon(log=self.log)
-            start_pulseaudio_daemon(log=self.log)
-            start_bluetooth_daemon(log=self.log)
-            self.daemons_started = True
+        if not self.daemon_supervisor:
+            self.daemon_supervisor = self.create_daemon_supervisor()
+            self.daemon_supervisor.start_all()
+        if not self.adapter_manager:
+            self.adapter_manager = MultiAdapterManager(log=self.log)
 
         self.setWindowTitle('Test Host')
-        self.setCentralWidget(TestApplication(interface=self.interface, back_callback=self.show_main, log=self.log))
+        self.setCentralWidget(TestApplication(interface=self.interface, back_callback=self.show_main, log=self.log,
+                                              bluetooth_device_manager=self.adapter_manager.get(self.interface)))
+
+    def create_daemon_supervisor(self):
+        """Describe the daemons the Test Host needs: dbus first, then PulseAudio and bluetoothd in parallel.
+
+        Returns:
+            DaemonSupervisor ready to start the daemons.
+        """
+        supervisor = DaemonSupervisor(log=self.log)
+        supervisor.add("dbus", lambda: start_dbus_daemon(log=self.log), stop=lambda: stop_daemons(self.log),
+                       ready=system_bus_ready)
+        supervisor.add("pulseaudio", lambda: start_pulseaudio_daemon(log=self.log),
+                       stop=lambda: stop_pulseaudio_daemon(self.log), ready=pulseaudio_ready, depends_on=("dbus",))
+        supervisor.add("bluetoothd", lambda: start_bluetooth_daemon(log=self.log),
+                       ready=lambda: dbus_name_has_owner("org.bluez"), depends_on=("dbus",))
+        return supervisor
 
     def show_main(self):
         """Navigates the UI back to the main controller list screen from test views."""
@@ -249,14 +307,20 @@ class BluetoothUIApp(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app_window = BluetoothUIApp()
+    start_dispatcher(log=app_window.log)
     app_window.setWindowIcon(QIcon('UI/media/app_icon.jpg'))
     app_window.list_controllers()
     app_window.showMaximized()
 
     def stop_logs():
         """Stops hcidump logging processes before application quit"""
-        stop_daemons(app_window.log)
-        stop_pulseaudio_daemon(app_window.log)
+        if app_window.adapter_manager:
+            app_window.adapter_manager.close()
+        if app_window.daemon_supervisor:
+            app_window.daemon_supervisor.stop_all()
+        else:
+            stop_daemons(app_window.log)
+            stop_pulseaudio_daemon(app_window.log)
         stop_dump_logs(app_window.log)
 
     app.aboutToQuit.connect(stop_logs)
@@ -0,0 +1,351 @@
+import ctypes
+import ctypes.util
+import mmap
+import struct
+import threading
+import time
+
+PA_STREAM_PLAYBACK = 1
+PA_SAMPLE_U8 = 0
+PA_SAMPLE_S16LE = 3
+PA_SAMPLE_S24LE = 9
+PA_SAMPLE_S32LE = 7
+SAMPLE_FORMATS = {8: PA_SAMPLE_U8, 16: PA_SAMPLE_S16LE, 24: PA_SAMPLE_S24LE, 32: PA_SAMPLE_S32LE}
+BUFFER_DEFAULT = 0xFFFFFFFF
+
+_libpulse_simple = None
+
+
+class PaSampleSpec(ctypes.Structure):
+    _fields_ = [("format", ctypes.c_int), ("rate", ctypes.c_uint32), ("channels", ctypes.c_uint8)]
+
+
+class PaBufferAttr(ctypes.Structure):
+    _fields_ = [("maxlength", ctypes.c_uint32), ("tlength", ctypes.c_uint32), ("prebuf", ctypes.c_uint32),
+                ("minreq", ctypes.c_uint32), ("fragsize", ctypes.c_uint32)]
+
+
+def _get_libpulse_simple():
+    """Load libpulse-simple once and declare the functions used by the streamer."""
+    global _libpulse_simple
+    if _libpulse_simple is None:
+        name = ctypes.util.find_library("pulse-simple") or "libpulse-simple.so.0"
+        library = ctypes.CDLL(name)
+        library.pa_simple_new.restype = ctypes.c_void_p
+        library.pa_simple_new.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p,
+                                          ctypes.c_char_p, ctypes.POINTER(PaSampleSpec), ctypes.c_void_p,
+                                          ctypes.POINTER(PaBufferAttr), ctypes.POINTER(ctypes.c_int)]
+        library.pa_simple_write.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t,
+                                            ctypes.POINTER(ctypes.c_int)]
+        library.pa_simple_drain.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+        library.pa_simple_flush.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+        library.pa_simple_get_latency.restype = ctypes.c_uint64
+        library.pa_simple_get_latency.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+        library.pa_simple_free.argtypes = [ctypes.c_void_p]
+        library.pa_strerror.restype = ctypes.c_char_p
+        library.pa_strerror.argtypes = [ctypes.c_int]
+        _libpulse_simple = library
+    return _libpulse_simple
+
+
+def get_a2dp_sink_name(address):
+    """Return the PulseAudio sink name of a Bluetooth device (e.g., bluez_sink.AA_BB_CC_DD_EE_FF.a2dp_sink)."""
+    return f"bluez_sink.{address.upper().replace(':', '_')}.a2dp_sink"
+
+
+class WavSource:
+    """PCM WAV file read through a memory map.
+
+    The file is mapped copy-on-write and chunks are ctypes arrays pointing into the
+    mapping, so audio data is never copied into Python buffers before it is handed to
+    PulseAudio.
+    """
+
+    def __init__(self, path):
+        """Open and parse a WAV file.
+
+        Args:
+            path: Path of a PCM WAV file.
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+            self._parse()
+        except Exception:
+            self.file.close()
+            raise
+
+    def _parse(self):
+        """Locate the fmt and data chunks of the RIFF file."""
+        if self.map[0:4] != b"RIFF" or self.map[8:12] != b"WAVE":
+            raise ValueError(f"Not a WAV file: {self.path}")
+        offset = 12
+        self.data_offset = None
+        self.sample_rate = None
+        while offset + 8 <= len(self.map):
+            chunk_id, chunk_size = struct.unpack_from("<4sI", self.map, offset)
+            body = offset + 8
+            if chunk_id == b"fmt ":
+                audio_format, self.channels, self.sample_rate, _, self.block_align, self.bits_per_sample = \
+                    struct.unpack_from("<HHIIHH", self.map, body)
+                if audio_format not in (1, 0xFFFE):
+                    raise ValueError(f"Unsupported WAV encoding {audio_format} in {self.path}")
+            elif chunk_id == b"data":
+                self.data_offset = body
+                self.data_size = min(chunk_size, len(self.map) - body)
+                break
+            offset = body + chunk_size + (chunk_size & 1)
+        if self.sample_rate is None or self.data_offset is None:
+            raise ValueError(f"WAV file without fmt or data chunk: {self.path}")
+        if self.bits_per_sample not in SAMPLE_FORMATS:
+            raise ValueError(f"Unsupported sample width {self.bits_per_sample} in {self.path}")
+
+    @property
+    def audio_format(self):
+        """Tuple (sample rate, channels, bits per sample) identifying the PCM format."""
+        return self.sample_rate, self.channels, self.bits_per_sample
+
+    @property
+    def bytes_per_second(self):
+        """Number of PCM bytes per second of audio."""
+        return self.sample_rate * self.block_align
+
+    def chunks(self, chunk_size):
+        """Yield ctypes arrays over the PCM data, each chunk_size bytes except the last."""
+        end = self.data_offset + self.data_size
+        for start in range(self.data_offset, end, chunk_size):
+            yield (ctypes.c_char * (min(start + chunk_size, end) - start)).from_buffer(self.map, start)
+
+    def close(self):
+        """Unmap and close the file; the mapping is left to the garbage collector while chunks are alive."""
+        try:
+            self.map.close()
+        except BufferError:
+            pass
+        self.file.close()
+
+
+class PulseSimpleStream:
+    """Blocking PulseAudio playback stream to one sink through libpulse-simple."""
+
+    def __init__(self, sink, audio_format, name="Bluetooth Test Host", latency=0.1):
+        """Connect a playback stream.
+
+        Args:
+            sink: PulseAudio sink name, or None for the default sink.
+            audio_format: Tuple (sample rate, channels, bits per sample).
+            name: Application and stream name shown by PulseAudio.
+            latency: Target buffer length in seconds.
+        """
+        self.library = _get_libpulse_simple()
+        rate, channels, bits = audio_format
+        spec = PaSampleSpec(SAMPLE_FORMATS[bits], rate, channels)
+        attributes = PaBufferAttr(BUFFER_DEFAULT, int(rate * channels * bits // 8 * latency), BUFFER_DEFAULT,
+                                  BUFFER_DEFAULT, BUFFER_DEFAULT)
+        error = ctypes.c_int(0)
+        self.handle = self.library.pa_simple_new(None, name.encode(), PA_STREAM_PLAYBACK,
+                                                 sink.encode() if sink else None, b"A2DP stream",
+                                                 ctypes.byref(spec), None, ctypes.byref(attributes),
+                                                 ctypes.byref(error))
+        if not self.handle:
+            raise OSError(f"pa_simple_new failed for sink {sink}: {self._strerror(error)}")
+
+    def _strerror(self, error):
+        """Return the PulseAudio message of an error code."""
+        return self.library.pa_strerror(error.value).decode()
+
+    def write(self, chunk):
+        """Write a chunk, blocking while the server buffer is full.
+
+        Args:
+            chunk: PCM data as bytes or a ctypes array.
+        """
+        error = ctypes.c_int(0)
+        if self.library.pa_simple_write(self.handle, chunk, len(chunk), ctypes.byref(error)) < 0:
+            raise OSError(f"pa_simple_write failed: {self._strerror(error)}")
+
+    def get_latency(self):
+        """Return the playback latency in seconds (audio buffered but not yet played)."""
+        error = ctypes.c_int(0)
+        return self.library.pa_simple_get_latency(self.handle, ctypes.byref(error)) / 1e6
+
+    def drain(self):
+        """Wait until all written audio has been played."""
+        error = ctypes.c_int(0)
+        self.library.pa_simple_drain(self.handle, ctypes.byref(error))
+
+    def flush(self):
+        """Drop buffered audio."""
+        error = ctypes.c_int(0)
+        self.library.pa_simple_flush(self.handle, ctypes.byref(error))
+
+    def close(self):
+        """Free the stream."""
+        if self.handle:
+            self.library.pa_simple_free(self.handle)
+            self.handle = None
+
+
+class A2dpStreamer:
+    """Streams a playlist of WAV files to a Bluetooth sink from a background thread.
+
+    Files are written back to back into one PulseAudio stream, so consecutive files of the
+    same format play gaplessly; a format change reopens the stream. The playlist can be
+    looped for soak tests. Statistics cover bytes written, underruns (the server buffer
+    running dry while audio was still pending) and drift between wall-clock time and the
+    amount of audio played.
+    """
+
+    def __init__(self, sink, playlist, loop=False, chunk_duration=0.02, latency=0.1, underrun_threshold=0.005,
+                 log=None, on_finished=None):
+        """Initialize the streamer.
+
+        Args:
+            sink: PulseAudio sink name, see get_a2dp_sink_name.
+            playlist: List of WAV file paths played in order.
+            loop: True to repeat the playlist until stopped, or the number of passes.
+            chunk_duration: Seconds of audio per write.
+            latency: Target PulseAudio buffer length in seconds.
+            underrun_threshold: Buffered seconds below which a write counts as an underrun.
+            log: Logger instance.
+            on_finished: Callable receiving the streamer once the streaming thread ends.
+        """
+        self.sink = sink
+        self.playlist = list(playlist)
+        self.loop = loop
+        self.chunk_duration = chunk_duration
+        self.latency = latency
+        self.underrun_threshold = underrun_threshold
+        self.log = log
+        self.on_finished = on_finished
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.error = None
+        self.stats = {"bytes_written": 0, "audio_seconds": 0.0, "underruns": 0, "files_played": 0, "passes": 0}
+        self.started = None
+        self.ended = None
+
+    @property
+    def is_running(self):
+        """True while the streaming thread is alive."""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start streaming in a background thread.
+
+        Returns:
+            The streamer itself.
+        """
+        self.started = time.monotonic()
+        self.thread = threading.Thread(target=self._run, name=f"a2dp-{self.sink}", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop streaming and wait for the thread to exit."""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+
+    def wait(self, timeout=None):
+        """Wait until the playlist finished or the stream was stopped.
+
+        Returns:
+            True if the streaming thread has exited.
+        """
+        if self.thread:
+            self.thread.join(timeout)
+        return not self.is_running
+
+    def get_stats(self):
+        """Return bytes written, underruns, files played, passes and wall-clock drift.
+
+        Drift is the wall-clock time elapsed minus the seconds of audio played; a growing
+        positive value means the sink consumes audio slower than real time (gaps).
+        """
+        with self.lock:
+            stats = dict(self.stats)
+        elapsed = ((self.ended or time.monotonic()) - self.started) if self.started else 0.0
+        played = max(0.0, stats["audio_seconds"] - stats.pop("buffered", 0.0))
+        stats.update(elapsed=elapsed, drift=elapsed - played, running=self.is_running, error=self.error)
+        return stats
+
+    def _passes(self):
+        """Yield playlist pass numbers according to the loop setting."""
+        passes = 0
+        while not self.stop_event.is_set():
+            yield passes
+            passes += 1
+            if self.loop is not True and passes >= max(1, int(self.loop or 1)):
+                return
+
+    def _run(self):
+        """Streaming thread."""
+        stream = None
+        stream_format = None
+        try:
+            for _ in self._passes():
+                for path in self.playlist:
+                    if self.stop_event.is_set():
+                        break
+                    source = WavSource(path)
+                    try:
+                        if source.audio_format != stream_format:
+                            if stream:
+                                stream.drain()
+                                stream.close()
+                            stream = PulseSimpleStream(self.sink, source.audio_format, latency=self.latency)
+                            stream_format = source.audio_format
+                            if self.log:
+                                self.log.info("A2DP stream to %s opened: %s Hz, %s channels, %s bits", self.sink,
+                                              *stream_format)
+                        self._write_source(stream, source)
+                    finally:
+                        source.close()
+                    with self.lock:
+                        self.stats["files_played"] += 1
+                with self.lock:
+                    self.stats["passes"] += 1
+            if stream and not self.stop_event.is_set():
+                stream.drain()
+        except Exception as error:
+            self.error = str(error)
+            if self.log:
+                self.log.error("A2DP stream to %s failed: %s", self.sink, error)
+        finally:
+            if stream:
+                if self.stop_event.is_set():
+                    stream.flush()
+                stream.close()
+            self.ended = time.monotonic()
+            with self.lock:
+                self.stats["buffered"] = 0.0
+            if self.log:
+                stats = self.get_stats()
+                self.log.info("A2DP stream to %s ended: %d bytes, %d files, %d underruns, drift %.3fs", self.sink,
+                              stats["bytes_written"], stats["files_played"], stats["underruns"], stats["drift"])
+            if self.on_finished:
+                self.on_finished(self)
+
+    def _write_source(self, stream, source):
+        """Write one file in fixed-size chunks, tracking underruns and buffered audio."""
+        chunk_size = max(source.block_align, int(source.bytes_per_second * self.chunk_duration)
+                         // source.block_align * source.block_align)
+        dry = False
+        for chunk in source.chunks(chunk_size):
+            if self.stop_event.is_set():
+                return
+            stream.write(chunk)
+            buffered = stream.get_latency()
+            with self.lock:
+                self.stats["bytes_written"] += len(chunk)
+                self.stats["audio_seconds"] += len(chunk) / source.bytes_per_second
+                self.stats["buffered"] = buffered
+                if buffered < self.underrun_threshold and self.stats["audio_seconds"] > self.latency:
+                    if not dry:
+                        self.stats["underruns"] += 1
+                    dry = True
+                else:
+                    dry = False
@@ -0,0 +1,134 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import dbus
+
+from libraries.bluetooth import constants
+from libraries.bluetooth.bluez import BluetoothDeviceManager
+from libraries.bluetooth.dbus_dispatch import start_dispatcher
+from libraries.bluetooth.device_index import DeviceIndex
+from libraries.bluetooth.obex import ParallelPush
+
+
+class MultiAdapterManager:
+    """Drives every hciN adapter over one system bus connection and one shared device index.
+
+    Each adapter gets its own BluetoothDeviceManager and its own work queue, so a slow
+    operation on one controller never delays operations queued on another. Adapters that
+    appear or disappear while running (USB dongles) are picked up from the device index.
+    """
+
+    def __init__(self, log=None, workers_per_adapter=1):
+        """Open the shared bus, seed the device index and create a manager per adapter.
+
+        Args:
+            log: Logger instance.
+            workers_per_adapter: Number of operations each adapter queue runs in parallel.
+        """
+        self.log = log
+        self.workers_per_adapter = workers_per_adapter
+        self.dispatcher = start_dispatcher(log=log)
+        self.bus = dbus.SystemBus()
+        self.device_index = DeviceIndex(self.bus, self.log)
+        self.lock = threading.Lock()
+        self.managers = {}
+        self.executors = {}
+        self.device_index.add_listener(self.handle_index_event)
+        for adapter_path in self.device_index.get_adapter_paths():
+            self.add_adapter(adapter_path.rsplit("/", 1)[-1])
+
+    def add_adapter(self, interface):
+        """Create the manager and work queue of an adapter if not present yet.
+
+        Args:
+            interface: Bluetooth adapter interface (e.g., hci0).
+
+        Returns:
+            The BluetoothDeviceManager bound to the adapter.
+        """
+        with self.lock:
+            if interface not in self.managers:
+                self.managers[interface] = BluetoothDeviceManager(log=self.log, interface=interface, bus=self.bus,
+                                                                  device_index=self.device_index)
+                self.executors[interface] = ThreadPoolExecutor(max_workers=self.workers_per_adapter,
+                                                               thread_name_prefix=f"{interface}-queue")
+                self.log.info("Adapter %s added to the multi-adapter manager", interface)
+            return self.managers[interface]
+
+    def remove_adapter(self, interface):
+        """Drop the manager of an adapter and stop its work queue.
+
+        Args:
+            interface: Bluetooth adapter interface (e.g., hci0).
+        """
+        with self.lock:
+            manager = self.managers.pop(interface, None)
+            executor = self.executors.pop(interface, None)
+        if manager:
+            manager.close()
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.log.info("Adapter %s removed from the multi-adapter manager", interface)
+
+    def handle_index_event(self, event, path, interface, properties):
+        """Device index listener tracking adapters that are plugged in or removed."""
+        if interface != constants.adapter_interface:
+            return
+        if event == "added":
+            self.add_adapter(path.rsplit("/", 1)[-1])
+        elif event == "removed":
+            self.remove_adapter(path.rsplit("/", 1)[-1])
+
+    def get_interfaces(self):
+        """Return the names of all managed adapters (e.g., ['hci0', 'hci1'])."""
+        with self.lock:
+            return sorted(self.managers)
+
+    def get(self, interface):
+        """Return the BluetoothDeviceManager of an adapter, creating it on first use.
+
+        Args:
+            interface: Bluetooth adapter interface (e.g., hci0).
+        """
+        with self.lock:
+            manager = self.managers.get(interface)
+        return manager or self.add_adapter(interface)
+
+    def submit(self, interface, method_name, *args, **kwargs):
+        """Queue a manager call on the work queue of one adapter.
+
+        Args:
+            interface: Bluetooth adapter interface (e.g., hci0).
+            method_name: Name of the BluetoothDeviceManager method to call.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            concurrent.futures.Future resolved with the method's return value.
+        """
+        manager = self.get(interface)
+        with self.lock:
+            executor = self.executors[interface]
+        return executor.submit(getattr(manager, method_name), *args, **kwargs)
+
+    def send_file_to_many(self, targets, file_path, parallelism=4, timeout=None):
+        """Push one file to devices reached through different adapters concurrently.
+
+        Args:
+            targets: List of (interface, device address) tuples, e.g. [("hci0", addr1), ("hci1", addr2)].
+            file_path: Path of the file to send.
+            parallelism: Maximum number of concurrent transfers across all adapters.
+            timeout: Maximum number of seconds to wait, or None to wait for every transfer.
+
+        Returns:
+            Report dictionary with per-target status, duration and throughput and the totals.
+        """
+        push = ParallelPush(lambda target: self.get(target[0]).send_file_async(target[1], file_path), targets,
+                            file_path, parallelism=parallelism, log=self.log)
+        return push.start().wait(timeout)
+
+    def close(self):
+        """Stop every adapter queue and release the shared device index."""
+        for interface in self.get_interfaces():
+            self.remove_adapter(interface)
+        self.device_index.close()
@@ -1,36 +1,35 @@
-def pair(self, address):
+def pair(self, address, timeout=30):
     def _pairing_thread():
         device_path = self.find_device_path(address)
         if not device_path:
             self.log.warning("Device path not found for %s", address)
             return
 
-        try:
-            device_proxy = self.bus.get_object(constants.bluez_service, device_path)
-            device = dbus.Interface(device_proxy, constants.device_interface)
-            properties = dbus.Interface(device_proxy, constants.properties_interface)
-
-            paired = properties.Get(constants.device_interface, "Paired")
-            if paired:
-                self.log.info("Device %s is already paired.", address)
-                return
-
-            self.log.info("Initiating pairing with %s", address)
-            device.Pair()
-
-            # Wait a bit for pairing to complete
-            for _ in range(30):  # ~30 seconds max
-                time.sleep(1)
-                paired = properties.Get(constants.device_interface, "Paired")
-                if paired:
-                    self.log.info("Successfully paired with %s", address)
-                    return
+        properties = self.device_index.get_properties(device_path)
+        if properties and properties.get("Paired"):
+            self.log.info("Device %s is already paired.", address)
+            return
 
+        self.log.info("Initiating pairing with %s", address)
+        device = self.proxy_pool.get(device_path).device
+        errors = []
+
+        def on_error(error):
+            errors.append(error)
+            self.device_index.wake_waiters()
+
+        # Completes on the Paired PropertiesChanged signal instead of polling once a second
+        start_time = time.monotonic()
+        device.Pair(reply_handler=lambda: None, error_handler=on_error, timeout=timeout)
+        paired = self.device_index.wait_for(device_path, lambda props: bool(errors) or bool(props and props.get("Paired")), timeout)
+        latency = time.monotonic() - start_time
+        if errors:
+            self.log.error("Pairing failed with %s: %s", address, errors[0])
+        elif paired:
+            self.log.info("Successfully paired with %s in %.3fs", address, latency)
+        else:
             self.log.warning("Pairing not confirmed with %s within timeout.", address)
 
-        except dbus.exceptions.DBusException as error:
-            self.log.error("Pairing failed with %s: %s", address, error)
-
     threading.Thread(target=_pairing_thread, daemon=True).start()
     return True  # Return immediately to keep UI responsive
 
@@ -0,0 +1,113 @@
+import fnmatch
+import threading
+
+
+class AgentRule:
+    """One row of the agent policy table.
+
+    A rule matches on the remote address (shell-style pattern such as "AA:BB:*"), the
+    agent request type and, for AuthorizeService, the service UUID. Matching requests are
+    accepted, answered with a fixed PIN/passkey, or rejected without involving the UI.
+    """
+
+    actions = ("accept", "reject")
+
+    def __init__(self, action, address="*", request_types=None, uuid=None, value=None):
+        """Initialize the rule.
+
+        Args:
+            action: "accept" or "reject".
+            address: Shell-style pattern of Bluetooth addresses the rule applies to.
+            request_types: Request types the rule applies to ("pin", "passkey", "confirm",
+                "authorize", "display_pin", "display_passkey"); None matches all of them.
+            uuid: Service UUID, full or short form, an "authorize" request must carry.
+            value: PIN (string) or passkey (integer) returned when accepting "pin" or
+                "passkey" requests. Without it the rule does not apply to those requests.
+        """
+        if action not in self.actions:
+            raise ValueError(f"Unknown agent rule action: {action}")
+        self.action = action
+        self.address = address.upper()
+        self.request_types = set(request_types) if request_types else None
+        self.uuid = uuid.lower() if uuid else None
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, row):
+        """Build a rule from a table row such as {"address": "*", "type": "pin", "action": "accept", "value": "0000"}."""
+        request_types = row.get("types") or row.get("type")
+        if isinstance(request_types, str):
+            request_types = [request_types]
+        return cls(row["action"], address=row.get("address", "*"), request_types=request_types,
+                   uuid=row.get("uuid"), value=row.get("value"))
+
+    def matches(self, request):
+        """Check whether the rule applies to an AgentRequest."""
+        if self.request_types is not None and request.type not in self.request_types:
+            return False
+        if not fnmatch.fnmatchcase(request.address.upper(), self.address):
+            return False
+        if self.uuid is not None and (request.type != "authorize" or self.uuid not in str(request.value).lower()):
+            return False
+        if self.action == "accept" and request.type in ("pin", "passkey") and self.value is None:
+            return False
+        return True
+
+    def apply(self, request):
+        """Answer an AgentRequest according to the rule."""
+        if self.action == "reject":
+            request.reject("Rejected by agent policy")
+        elif request.type in ("pin", "passkey"):
+            request.reply(self.value)
+        else:
+            request.reply()
+
+
+class AgentPolicy:
+    """Ordered rule table answering agent requests for unattended pairing.
+
+    The first matching rule wins. Requests that no rule matches are left to the UI.
+    """
+
+    def __init__(self, rules=None, log=None):
+        """Initialize the policy.
+
+        Args:
+            rules: Iterable of AgentRule objects or rule dictionaries.
+            log: Logger instance.
+        """
+        self.log = log
+        self.lock = threading.Lock()
+        self.rules = []
+        for rule in rules or []:
+            self.add_rule(rule)
+
+    def add_rule(self, rule):
+        """Append a rule, given as an AgentRule or a dictionary, to the end of the table."""
+        if isinstance(rule, dict):
+            rule = AgentRule.from_dict(rule)
+        with self.lock:
+            self.rules.append(rule)
+
+    def clear(self):
+        """Remove every rule so all requests go to the UI."""
+        with self.lock:
+            self.rules = []
+
+    def handle(self, request):
+        """Answer a request from the rule table.
+
+        Args:
+            request: AgentRequest to answer.
+
+        Returns:
+            True if a rule answered the request, False if it should go to the UI.
+        """
+        with self.lock:
+            rule = next((rule for rule in self.rules if rule.matches(request)), None)
+        if rule is None:
+            return False
+        if self.log:
+            self.log.info("Agent policy %s %s request from %s", rule.action, request.type, request.address)
+        rule.apply(request)
+        return True
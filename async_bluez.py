@@ -0,0 +1,426 @@
+import asyncio
+
+import dbus
+
+from libraries.bluetooth import constants
+from libraries.bluetooth.bluez import BluetoothDeviceManager
+from libraries.bluetooth.dbus_dispatch import start_dispatcher
+from libraries.bluetooth.operations import OperationResult
+
+
+class AsyncBluetoothDeviceManager:
+    """asyncio front-end of BluetoothDeviceManager built on non-blocking dbus-python calls.
+
+    Each coroutine issues its D-Bus calls with reply and error handlers and resolves an asyncio
+    future from the GLib dispatch context, so many devices can be driven from one event loop
+    without a thread per operation. Device lookups share the index and proxy pool of the wrapped
+    synchronous manager.
+    """
+
+    def __init__(self, log=None, interface=None, manager=None, loop=None, run_glib_loop=True):
+        """Initialize the async manager.
+
+        Args:
+            log: Logger instance.
+            interface: Bluetooth adapter interface (e.g., hci0).
+            manager: Existing BluetoothDeviceManager to share the bus, index and proxies with.
+            loop: asyncio event loop the coroutines run on. Defaults to the running loop.
+            run_glib_loop: Make sure D-Bus dispatch is running before the bus is opened; the
+                dispatcher uses a dedicated thread unless a GLib-backed Qt event loop already
+                services the default context. Pass False when dispatch is managed elsewhere.
+        """
+        if run_glib_loop:
+            start_dispatcher(log=log)
+        self.manager = manager or BluetoothDeviceManager(log=log, interface=interface)
+        self.log = log or self.manager.log
+        self.interface = self.manager.interface
+        self.loop = loop
+
+    def _get_loop(self):
+        """Return the event loop the coroutines complete on."""
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        return self.loop
+
+    def _call(self, method, *args, timeout=None):
+        """Issue a non-blocking D-Bus method call and return a future for its reply.
+
+        Args:
+            method: Bound dbus-python proxy method.
+            *args: Method arguments.
+            timeout: Call timeout in seconds, or None for the dbus-python default.
+
+        Returns:
+            asyncio.Future resolved with the reply value (a tuple for multiple values).
+        """
+        loop = self._get_loop()
+        future = loop.create_future()
+
+        def set_result(value):
+            if not future.done():
+                future.set_result(value)
+
+        def set_exception(error):
+            if not future.done():
+                future.set_exception(error)
+
+        def reply_handler(*values):
+            value = values[0] if len(values) == 1 else (values or None)
+            loop.call_soon_threadsafe(set_result, value)
+
+        def error_handler(error):
+            loop.call_soon_threadsafe(set_exception, error)
+
+        kwargs = {"reply_handler": reply_handler, "error_handler": error_handler}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        method(*args, **kwargs)
+        return future
+
+    async def _get_device_property(self, device_path, name):
+        """Read one Device1 property through the pooled properties proxy."""
+        properties = self.manager.proxy_pool.get(device_path).properties
+        return await self._call(properties.Get, constants.device_interface, name)
+
+    def get_paired_devices(self):
+        """Return paired devices from the device index. See BluetoothDeviceManager.get_paired_devices."""
+        return self.manager.get_paired_devices()
+
+    def get_discovered_devices(self):
+        """Return discovered devices from the device index. See BluetoothDeviceManager.get_discovered_devices."""
+        return self.manager.get_discovered_devices()
+
+    async def start_discovery(self, transport=None, rssi=None, uuids=None, duplicate_data=None):
+        """Start scanning for nearby Bluetooth devices. See BluetoothDeviceManager.start_discovery."""
+        try:
+            discovering = await self._call(self.manager.adapter_properties.Get, constants.adapter_interface, "Discovering")
+            if not discovering:
+                discovery_filter = self.manager.build_discovery_filter(transport, rssi, uuids, duplicate_data)
+                await self._call(self.manager.adapter.SetDiscoveryFilter, discovery_filter)
+                await self._call(self.manager.adapter.StartDiscovery)
+                self.log.info("Discovery started.")
+            else:
+                self.log.info("Discovery already in progress.")
+        except dbus.exceptions.DBusException as error:
+            self.log.error("Failed to start discovery: %s", error)
+
+    async def stop_discovery(self):
+        """Stop Bluetooth device discovery, if it's running."""
+        try:
+            discovering = await self._call(self.manager.adapter_properties.Get, constants.adapter_interface, "Discovering")
+            if discovering:
+                await self._call(self.manager.adapter.StopDiscovery)
+                self.log.info("Discovery stopped.")
+            else:
+                self.log.info("Discovery is not running.")
+        except dbus.exceptions.DBusException as error:
+            self.log.error("Failed to stop discovery: %s", error)
+
+    async def _run_device_operation(self, device_path, method, args, predicate, timeout, cancel=None):
+        """Issue a device method and complete on the matching index update or the call reply.
+
+        Mirrors BluetoothDeviceManager._begin_device_operation: nothing is called if the
+        device is already in the target state, and on timeout or cancellation of the
+        coroutine the pending call is dropped and BlueZ is asked to abort the operation.
+
+        Args:
+            device_path: D-Bus object path of the device whose state is awaited.
+            method: Bound dbus-python proxy method to call.
+            args: Positional arguments of the method.
+            predicate: Callable receiving the device properties (None once removed) and
+                returning True when the target state is reached.
+            timeout: Maximum number of seconds to wait for completion.
+            cancel: Callable asking BlueZ to abort the operation, without blocking.
+
+        Returns:
+            OperationResult with the measured completion latency.
+        """
+        loop = self._get_loop()
+        device_index = self.manager.device_index
+        state_reached = loop.create_future()
+
+        def listener(event, path, interface, properties):
+            if path == device_path and interface == constants.device_interface:
+                if predicate(device_index.get_properties(device_path)):
+                    loop.call_soon_threadsafe(lambda: state_reached.done() or state_reached.set_result(True))
+
+        def abort():
+            if not call.done():
+                call.cancel()
+            if cancel:
+                cancel()
+
+        device_index.add_listener(listener)
+        start_time = loop.time()
+        try:
+            if predicate(device_index.get_properties(device_path)):
+                return OperationResult(True, 0.0)
+            call = self._call(method, *args, timeout=timeout)
+            call.add_done_callback(lambda future: future.cancelled() or future.exception())
+            try:
+                done, _ = await asyncio.wait({call, state_reached}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                abort()
+                raise
+        finally:
+            device_index.remove_listener(listener)
+        latency = loop.time() - start_time
+        if call in done and call.exception():
+            return OperationResult(False, latency, call.exception())
+        if not done:
+            abort()
+            return OperationResult(False, latency, f"Timed out after {timeout}s")
+        if not call.done():
+            call.cancel()
+        return OperationResult(True, latency)
+
+    async def pair(self, address, timeout=None):
+        """Pair with a Bluetooth device.
+
+        Args:
+            address: Bluetooth address of remote device.
+            timeout: Seconds to wait for the Paired property, defaults to operation_timeout.
+
+        Returns:
+            OperationResult that is truthy if successfully paired.
+        """
+        device_path = self.manager.find_device_path(address)
+        if not device_path:
+            return OperationResult(False, error="Device path not found")
+        properties = self.manager.device_index.get_properties(device_path)
+        if properties and properties.get("Paired"):
+            self.log.info("Device %s is already paired.", address)
+            return OperationResult(True, 0.0)
+        self.log.info("Initiating pairing with %s", address)
+        device = self.manager.proxy_pool.get(device_path).device
+        result = await self._run_device_operation(device_path, device.Pair, (),
+                                                  lambda props: bool(props and props.get("Paired")),
+                                                  timeout or self.manager.operation_timeout,
+                                                  cancel=self.manager._async_call_ignoring_errors(
+                                                      device.CancelPairing, f"CancelPairing of {address}"))
+        if result:
+            self.log.info("Successfully paired with %s in %.3fs", address, result.latency)
+        else:
+            self.log.error("Pairing failed with %s: %s", address, result.error)
+        return result
+
+    async def connect(self, address, timeout=None):
+        """Establish a connection to the specified Bluetooth device.
+
+        Args:
+            address: Bluetooth address of remote device.
+            timeout: Seconds to wait for the Connected property, defaults to operation_timeout.
+
+        Returns:
+            OperationResult that is truthy if connected.
+        """
+        device_path = self.manager.find_device_path(address)
+        if not device_path:
+            self.log.info("Device path not found for address %s", address)
+            return OperationResult(False, error="Device path not found")
+        device = self.manager.proxy_pool.get(device_path).device
+        result = await self._run_device_operation(device_path, device.Connect, (),
+                                                  lambda props: bool(props and props.get("Connected")),
+                                                  timeout or self.manager.operation_timeout,
+                                                  cancel=self.manager._async_call_ignoring_errors(
+                                                      device.Disconnect, f"Disconnect of {address}"))
+        if result:
+            self.log.info("Connection successful to %s in %.3fs", address, result.latency)
+        else:
+            self.log.info("Connection failed:%s", result.error)
+        return result
+
+    async def disconnect(self, address, timeout=None):
+        """Disconnect a Bluetooth device.
+
+        Args:
+            address: Bluetooth address of the remote device.
+            timeout: Seconds to wait for the Connected property to clear, defaults to operation_timeout.
+
+        Returns:
+            OperationResult that is truthy if disconnected or already disconnected.
+        """
+        device_path = self.manager.find_device_path(address)
+        if not device_path:
+            self.log.warning("Device path not found for address: %s", address)
+            return OperationResult(False, error="Device path not found")
+        properties = self.manager.device_index.get_properties(device_path)
+        if not (properties and properties.get("Connected")):
+            self.log.info("Device %s is already disconnected.", address)
+            return OperationResult(True, 0.0)
+        result = await self._run_device_operation(device_path, self.manager.proxy_pool.get(device_path).device.Disconnect, (),
+                                                  lambda props: not (props and props.get("Connected")),
+                                                  timeout or self.manager.operation_timeout)
+        if result:
+            self.log.info("Disconnected %s in %.3fs", address, result.latency)
+        else:
+            self.log.info("Error disconnecting device %s:%s", address, result.error)
+        return result
+
+    async def unpair_device(self, address, timeout=None):
+        """Remove a paired or known Bluetooth device from the adapter.
+
+        Args:
+            address: The Bluetooth address of the remote device.
+            timeout: Seconds to wait for InterfacesRemoved, defaults to operation_timeout.
+
+        Returns:
+            OperationResult that is truthy if the device was removed or already not present.
+        """
+        target_path = self.manager.find_device_path(address)
+        if not target_path:
+            self.log.info("Device with address %s not found on %s", address, self.interface)
+            return OperationResult(True, 0.0)
+        self.log.info("Requested unpair of device %s at path %s", address, target_path)
+        result = await self._run_device_operation(target_path, self.manager.adapter.RemoveDevice, (target_path,),
+                                                  lambda props: props is None,
+                                                  timeout or self.manager.operation_timeout)
+        if result:
+            self.log.info("Device %s unpaired successfully in %.3fs", address, result.latency)
+        else:
+            self.log.error("Unpairing device %s failed: %s", address, result.error)
+        return result
+
+    async def _run_many(self, operation, addresses, concurrency):
+        """Run a per-device coroutine across many addresses with bounded concurrency.
+
+        Duplicate addresses are dropped so a device never has two operations in flight.
+
+        Args:
+            operation: Coroutine function taking an address and returning an OperationResult.
+            addresses: Iterable of Bluetooth addresses.
+            concurrency: Maximum number of operations in flight on this adapter.
+
+        Yields:
+            (address, OperationResult) tuples in completion order.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(address):
+            async with semaphore:
+                try:
+                    return address, await operation(address)
+                except Exception as error:
+                    self.log.error("Batch operation failed for %s: %s", address, error)
+                    return address, OperationResult(False, error=error)
+
+        for completed in asyncio.as_completed([run(address) for address in dict.fromkeys(addresses)]):
+            yield await completed
+
+    def pair_many(self, addresses, concurrency=None, timeout=None):
+        """Pair with many devices. See BluetoothDeviceManager.pair_many.
+
+        Returns:
+            Async iterator of (address, OperationResult) tuples in completion order.
+        """
+        concurrency = concurrency or self.manager.pair_concurrency
+        return self._run_many(lambda address: self.pair(address, timeout), addresses, concurrency)
+
+    def connect_many(self, addresses, concurrency=None, timeout=None):
+        """Connect to many devices. See BluetoothDeviceManager.connect_many.
+
+        Returns:
+            Async iterator of (address, OperationResult) tuples in completion order.
+        """
+        return self._run_many(lambda address: self.connect(address, timeout), addresses, concurrency or self.manager.batch_concurrency)
+
+    def disconnect_many(self, addresses, concurrency=None, timeout=None):
+        """Disconnect many devices. See BluetoothDeviceManager.disconnect_many.
+
+        Returns:
+            Async iterator of (address, OperationResult) tuples in completion order.
+        """
+        return self._run_many(lambda address: self.disconnect(address, timeout), addresses, concurrency or self.manager.batch_concurrency)
+
+    def unpair_many(self, addresses, concurrency=None, timeout=None):
+        """Unpair many devices. See BluetoothDeviceManager.unpair_many.
+
+        Returns:
+            Async iterator of (address, OperationResult) tuples in completion order.
+        """
+        return self._run_many(lambda address: self.unpair_device(address, timeout), addresses, concurrency or self.manager.batch_concurrency)
+
+    async def is_device_paired(self, device_address):
+        """Check whether the specified device is paired."""
+        device_path = self.manager.find_device_path(device_address)
+        if not device_path:
+            return False
+        try:
+            return bool(await self._get_device_property(device_path, "Paired"))
+        except dbus.exceptions.DBusException as error:
+            self.log.debug("DBusException while checking pairing:%s", error)
+            return False
+
+    async def is_device_connected(self, device_address):
+        """Check whether the specified device is connected."""
+        device_path = self.manager.find_device_path(device_address)
+        if not device_path:
+            return False
+        try:
+            return bool(await self._get_device_property(device_path, "Connected"))
+        except dbus.exceptions.DBusException as error:
+            self.log.debug("DBusException while checking connection:%s", error)
+            return False
+
+    async def media_control(self, command, address=None):
+        """Send an AVRCP media control command to a connected Bluetooth device.
+
+        Args:
+            command: One of "play", "pause", "next", "previous", "rewind".
+            address: Bluetooth address of the target device.
+
+        Returns:
+            True if the command was delivered, False otherwise.
+        """
+        valid_commands = {"play": "Play",
+                          "pause": "Pause",
+                          "next": "Next",
+                          "previous": "Previous",
+                          "rewind": "Rewind"}
+        if command not in valid_commands:
+            self.log.info("Invalid media control command:%s", command)
+            return False
+        media_control_interface = self.manager.get_media_control_interface(address)
+        if not media_control_interface:
+            return False
+        try:
+            await self._call(getattr(media_control_interface, valid_commands[command]))
+            self.log.info("AVRCP %s sent successfully to %s", command, address)
+            return True
+        except dbus.exceptions.DBusException as error:
+            self.log.warning("AVRCP command %s failed with exception:%s", command, error)
+            return False
+
+    async def send_file(self, device_address, file_path, on_progress=None, timeout=None):
+        """Send a file via OBEX OPP and wait for the transfer to finish.
+
+        The transfer goes through the wrapped manager's pooled OBEX sessions; cancelling
+        the coroutine cancels the transfer through Transfer1.Cancel.
+
+        Args:
+            device_address: Bluetooth address of the target device.
+            file_path: Path of the file to send.
+            on_progress: Callable receiving the ObexTransfer on every progress update, on the
+                D-Bus dispatch thread.
+            timeout: Seconds after which the transfer is cancelled, or None for no deadline.
+
+        Returns:
+            Final transfer status ("complete", "error", "cancelled").
+        """
+        loop = self._get_loop()
+        future = loop.create_future()
+
+        def finished(transfer):
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(transfer.status))
+
+        try:
+            transfer = self.manager.send_file_async(device_address, file_path, on_progress=on_progress,
+                                                    on_finished=finished, timeout=timeout)
+        except dbus.exceptions.DBusException as error:
+            self.log.info("OBEX send failed: %s", error)
+            return "error"
+        try:
+            return await future
+        except asyncio.CancelledError:
+            transfer.cancel()
+            raise
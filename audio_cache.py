@@ -0,0 +1,168 @@
+import hashlib
+import os
+import subprocess
+import threading
+
+from libraries.bluetooth.a2dp_stream import WavSource
+
+SBC_CODEC = 0x00
+SBC_SAMPLE_RATES = {0x80: 16000, 0x40: 32000, 0x20: 44100, 0x10: 48000}
+SBC_MONO = 0x08
+DEFAULT_FORMAT = (44100, 2, 16)
+AUDIO_FILE_FILTER = "Audio files (*.wav *.mp3 *.flac *.ogg *.opus *.m4a *.aac *.wma *.aiff *.aif)"
+
+
+def get_transport_format(codec, configuration, bits_per_sample=16):
+    """Derive the PCM format of an A2DP stream from its MediaTransport1 codec configuration.
+
+    Args:
+        codec: MediaTransport1 Codec property.
+        configuration: MediaTransport1 Configuration property (codec capability bytes).
+        bits_per_sample: Sample width of the PCM fed to the sink.
+
+    Returns:
+        Tuple (sample rate, channels, bits per sample), or None for codecs other than SBC.
+    """
+    if int(codec) != SBC_CODEC or not configuration:
+        return None
+    first_byte = int(configuration[0])
+    rate = SBC_SAMPLE_RATES.get(first_byte & 0xF0)
+    if rate is None:
+        return None
+    return rate, 1 if first_byte & SBC_MONO else 2, bits_per_sample
+
+
+class AudioCache:
+    """On-disk cache of audio decoded and resampled to the format of an A2DP sink.
+
+    Entries are keyed by the SHA-256 of the source content plus the target format, so a
+    renamed or copied file is still a hit while an edited one is decoded again. Decoding
+    uses ffmpeg, which lets any format it understands be streamed. The least recently used
+    entries are evicted once the cache exceeds max_bytes; entries pinned by a running
+    stream are never evicted or cleared until they are released.
+    """
+
+    def __init__(self, cache_directory="/tmp/bt_audio_cache", max_bytes=2 * 1024 ** 3, log=None):
+        """Initialize the cache.
+
+        Args:
+            cache_directory: Directory holding the decoded WAV files.
+            max_bytes: Maximum total size of the cache in bytes.
+            log: Logger instance.
+        """
+        self.cache_directory = cache_directory
+        self.max_bytes = max_bytes
+        self.log = log
+        self.lock = threading.Lock()
+        self.digests = {}
+        self.pins = {}
+        os.makedirs(cache_directory, exist_ok=True)
+
+    def get(self, source_path, audio_format=DEFAULT_FORMAT, pin=False):
+        """Return a WAV file of the source audio in the target format, decoding it on a miss.
+
+        Args:
+            source_path: Path of an audio file in any format ffmpeg can decode.
+            audio_format: Tuple (sample rate, channels, bits per sample) of the sink.
+            pin: Keep the returned entry out of evict() and clear() until release() is
+                called with its path.
+
+        Returns:
+            Path of a PCM WAV file ready for streaming; a WAV source already in the target
+            format is returned as is.
+        """
+        if source_path.lower().endswith(".wav"):
+            try:
+                source = WavSource(source_path)
+                matches = source.audio_format == tuple(audio_format)
+                source.close()
+                if matches:
+                    return source_path
+            except ValueError:
+                pass
+        rate, channels, bits = audio_format
+        cached_path = os.path.join(self.cache_directory, f"{self._digest(source_path)}-{rate}-{channels}-{bits}.wav")
+        with self.lock:
+            if pin:
+                self.pins[cached_path] = self.pins.get(cached_path, 0) + 1
+            if os.path.exists(cached_path):
+                os.utime(cached_path)
+                if self.log:
+                    self.log.info("Audio cache hit for %s: %s", source_path, cached_path)
+                return cached_path
+        try:
+            self._decode(source_path, cached_path, audio_format)
+        except Exception:
+            if pin:
+                self.release(cached_path)
+            raise
+        self.evict()
+        return cached_path
+
+    def release(self, path):
+        """Unpin an entry returned by get(pin=True); paths that were never pinned are ignored."""
+        with self.lock:
+            count = self.pins.get(path, 0)
+            if count > 1:
+                self.pins[path] = count - 1
+            else:
+                self.pins.pop(path, None)
+
+    def evict(self):
+        """Remove least recently used unpinned entries until the cache fits in max_bytes."""
+        with self.lock:
+            entries = []
+            for name in os.listdir(self.cache_directory):
+                if name.endswith(".wav"):
+                    stat = os.stat(os.path.join(self.cache_directory, name))
+                    entries.append((stat.st_mtime, stat.st_size, name))
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if os.path.join(self.cache_directory, name) in self.pins:
+                    continue
+                os.remove(os.path.join(self.cache_directory, name))
+                total -= size
+                if self.log:
+                    self.log.info("Evicted %s from the audio cache", name)
+
+    def clear(self):
+        """Remove every cached file that is not pinned by a running stream."""
+        with self.lock:
+            for name in os.listdir(self.cache_directory):
+                path = os.path.join(self.cache_directory, name)
+                if path not in self.pins:
+                    os.remove(path)
+            self.digests = {}
+
+    def _digest(self, source_path):
+        """Return the content hash of a file, memoized by path, size and modification time."""
+        stat = os.stat(source_path)
+        key = (os.path.abspath(source_path), stat.st_size, stat.st_mtime_ns)
+        with self.lock:
+            digest = self.digests.get(key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(source_path, "rb") as source:
+                for block in iter(lambda: source.read(1024 * 1024), b""):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            with self.lock:
+                self.digests[key] = digest
+        return digest
+
+    def _decode(self, source_path, cached_path, audio_format):
+        """Decode and resample a file with ffmpeg into the cache, atomically."""
+        rate, channels, bits = audio_format
+        temporary_path = f"{cached_path}.{threading.get_ident()}.part"
+        command = ["ffmpeg", "-v", "error", "-y", "-i", source_path, "-vn", "-ac", str(channels), "-ar", str(rate),
+                   "-c:a", "pcm_u8" if bits == 8 else f"pcm_s{bits}le", "-f", "wav", temporary_path]
+        if self.log:
+            self.log.info("Decoding %s to %s Hz, %s channels, %s bits", source_path, rate, channels, bits)
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise RuntimeError(f"ffmpeg failed to decode {source_path}: {result.stderr.decode(errors='replace').strip()}")
+        os.replace(temporary_path, cached_path)
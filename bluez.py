@@ -1,33 +1,135 @@
+import os
+import queue
+import subprocess
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 
 import dbus
 import dbus.service
-import dbus.mainloop.glib
-import os
-import subprocess
-import time
-from dbus.mainloop.glib import DBusGMainLoop
-from gi.repository import GLib
 
 from libraries.bluetooth import constants
-#from libraries.bluetooth.agent import Agent
+from libraries.bluetooth.a2dp_stream import A2dpStreamer
+from libraries.bluetooth.a2dp_stream import get_a2dp_sink_name
+from libraries.bluetooth.agent_policy import AgentPolicy
+from libraries.bluetooth.audio_cache import AudioCache
+from libraries.bluetooth.audio_cache import DEFAULT_FORMAT
+from libraries.bluetooth.audio_cache import get_transport_format
+from libraries.bluetooth.dbus_dispatch import start_dispatcher
+from libraries.bluetooth.device_index import DeviceIndex
+from libraries.bluetooth.obex import ObexSessionPool
+from libraries.bluetooth.obex import ObexTransfer
+from libraries.bluetooth.obex import ObexTransferMonitor
+from libraries.bluetooth.obex import ParallelPush
+from libraries.bluetooth.obex import wait_event
+from libraries.bluetooth.operations import OperationHandle
+from libraries.bluetooth.operations import OperationResult
+from libraries.bluetooth.opp_receiver import DEFAULT_SAVE_DIRECTORY
+from libraries.bluetooth.opp_receiver import OppReceiverService
+from libraries.bluetooth.proxy_pool import DeviceProxyPool
+from libraries.bluetooth.signal_coalescer import PropertyCoalescer
 from Utils.utils import run
-from dbus.mainloop.glib import DBusGMainLoop
 
-DBusGMainLoop(set_as_default=True)
+
+class AgentRejected(dbus.DBusException):
+    _dbus_error_name = "org.bluez.Error.Rejected"
+
+
+class AgentCanceled(dbus.DBusException):
+    _dbus_error_name = "org.bluez.Error.Canceled"
+
+
+class AgentRequest:
+    """A pending Agent1 method call that is answered later by the UI or a policy.
+
+    reply(), reject() and cancel() may be called from any thread; only the first
+    answer is sent back to BlueZ.
+    """
+
+    def __init__(self, request_type, device, value, reply_handler, error_handler, finished_callback=None):
+        """Initialize the request.
+
+        Args:
+            request_type: "pin", "passkey", "confirm", "authorize", "display_pin" or "display_passkey".
+            device: D-Bus object path of the remote device.
+            value: Passkey to confirm, service UUID or value to display, if any.
+            reply_handler: dbus-python callback sending the method return.
+            error_handler: dbus-python callback sending an error reply.
+            finished_callback: Called with the request once it has been answered.
+        """
+        self.type = request_type
+        self.device = str(device)
+        self.address = self.device.split("dev_")[-1].replace("_", ":")
+        self.value = value
+        self.reply_handler = reply_handler
+        self.error_handler = error_handler
+        self.finished_callback = finished_callback
+        self.lock = threading.Lock()
+        self.state = "pending"
+
+    @property
+    def is_pending(self):
+        """True until the request has been answered, rejected or cancelled by BlueZ."""
+        return self.state == "pending"
+
+    def _finish(self, state):
+        """Move the request out of the pending state, returning False if it already left it."""
+        with self.lock:
+            if self.state != "pending":
+                return False
+            self.state = state
+        if self.finished_callback:
+            self.finished_callback(self)
+        return True
+
+    def reply(self, response=None):
+        """Answer the request.
+
+        Args:
+            response: PIN string for "pin", integer passkey for "passkey"; ignored otherwise.
+        """
+        if not self._finish("answered"):
+            return
+        if self.type == "pin":
+            self.reply_handler(dbus.String(response))
+        elif self.type == "passkey":
+            self.reply_handler(dbus.UInt32(int(response)))
+        else:
+            self.reply_handler()
+
+    def reject(self, reason="Rejected by user"):
+        """Refuse the request with org.bluez.Error.Rejected."""
+        if self._finish("rejected"):
+            self.error_handler(AgentRejected(reason))
+
+    def cancel(self):
+        """Abort the request with org.bluez.Error.Canceled after BlueZ called Agent1.Cancel."""
+        if self._finish("cancelled"):
+            self.error_handler(AgentCanceled("Request canceled"))
 
 
 class BluetoothDeviceManager:
     """A class for managing Bluetooth devices using the BlueZ D-Bus API."""
 
-    def __init__(self, log=None, interface=None):
+    operation_timeout = 30
+    batch_concurrency = 4
+    pair_concurrency = 1
+    obex_idle_timeout = 30
+    opp_parallelism = 4
+    media_transport_interface = "org.bluez.MediaTransport1"
+
+    def __init__(self, log=None, interface=None, bus=None, device_index=None):
         """Initialize the BluetoothDeviceManager by setting up the system bus and adapter.
 
         Args:
             log: Logger instance.
             interface: Bluetooth adapter interface (e.g., hci0).
+            bus: Shared system bus connection, a new one is opened if not given.
+            device_index: Shared DeviceIndex, a new one is seeded if not given.
         """
-        self.bus = dbus.SystemBus()
+        self.dispatcher = start_dispatcher(log=log)
+        self.bus = bus or dbus.SystemBus()
         self.interface = interface
         self.log = log
         self.adapter_path = f'{constants.bluez_path}/{self.interface}'
@@ -35,58 +137,125 @@ class BluetoothDeviceManager:
         self.adapter_properties = dbus.Interface(self.adapter_proxy, constants.properties_interface)
         self.adapter = dbus.Interface(self.adapter_proxy, constants.adapter_interface)
         self.object_manager = dbus.Interface(self.bus.get_object(constants.bluez_service, "/"), constants.object_manager_interface)
+        self.owns_device_index = device_index is None
+        self.device_index = device_index or DeviceIndex(self.bus, self.log)
+        self.proxy_pool = DeviceProxyPool(self.bus, log=self.log)
+        self.device_index.add_listener(self.proxy_pool.handle_index_event)
+        self.discovery_coalescers = {}
         self.last_session_path = None
-        self.opp_process = None
-        self.stream_process = None
+        self.session_bus = None
+        self.obex_manager = None
+        self.transfer_monitor = None
+        self.obex_sessions = None
+        self.opp_receiver = None
+        self.a2dp_streamer = None
+        self.a2dp_stream_handle = None
+        self.audio_cache = None
+        self.connect_session_bus()
+
+    def close(self):
+        """Detach from the device index, drop pooled proxies and stop OBEX, OPP and A2DP activity."""
+        self.device_index.remove_listener(self.proxy_pool.handle_index_event)
+        self.proxy_pool.clear()
+        if self.obex_sessions:
+            self.obex_sessions.close()
+            self.obex_sessions = None
+        if self.transfer_monitor:
+            self.transfer_monitor.close()
+            self.transfer_monitor = None
+        if self.opp_receiver:
+            self.stop_opp_receiver()
+        if self.a2dp_streamer:
+            self.stop_a2dp_stream()
+        if self.owns_device_index:
+            self.device_index.close()
 
     class Agent(dbus.service.Object):
-        def __init__(self, bus, path, ui_callback, log):
+        """org.bluez.Agent1 implementation replying asynchronously once the UI answers.
+
+        Every request method is registered with async_callbacks, so it returns to the D-Bus
+        dispatcher immediately and the reply is sent later through the request's reply or
+        reject method. No thread is held while a request waits for an answer.
+        """
+
+        def __init__(self, bus, path, ui_callback, log, policy=None):
             super().__init__(bus, path)
             self.bus = bus
             self.ui_callback = ui_callback
+            self.policy = policy
             self.log = log
-
-        @dbus.service.method("org.bluez.Agent1", in_signature="o", out_signature="s")
-        def RequestPinCode(self, device):
-            self.log.info("[Agent] RequestPinCode called for %s", device)
+            self.lock = threading.Lock()
+            self.pending_requests = []
+
+        def _dispatch(self, request_type, device, value, reply_handler, error_handler):
+            """Create an AgentRequest and answer it from the policy or hand it to the UI callback."""
+            request = AgentRequest(request_type, device, value, reply_handler, error_handler, self._request_finished)
+            with self.lock:
+                self.pending_requests.append(request)
             try:
-                threading.Thread(target=self.ui_callback, args=("pin", device), daemon=True).start()
+                if self.policy and self.policy.handle(request):
+                    return
             except Exception:
-                self.log.exception("ui_callback thread failed")
-            # Return a default PIN immediately (so BlueZ doesn’t time out)
-            return "0000"
-
-        @dbus.service.method("org.bluez.Agent1", in_signature="o", out_signature="u")
-        def RequestPasskey(self, device):
-            self.log.info("[Agent] RequestPasskey called for %s", device)
+                self.log.exception("Agent policy failed")
+                if not request.is_pending:
+                    return
+            if not self.ui_callback:
+                request.reject("No agent UI available")
+                return
             try:
-                threading.Thread(target=self.ui_callback, args=("passkey", device), daemon=True).start()
+                self.ui_callback(request)
             except Exception:
-                self.log.exception("ui_callback thread failed")
-            # Return a default numeric passkey (UInt32)
-            return dbus.UInt32(0)
+                self.log.exception("ui_callback failed")
+                request.reject("Agent UI failed")
+
+        def _request_finished(self, request):
+            """Forget a request once it has been answered, rejected or cancelled."""
+            with self.lock:
+                if request in self.pending_requests:
+                    self.pending_requests.remove(request)
+
+        @dbus.service.method("org.bluez.Agent1", in_signature="o", out_signature="s", async_callbacks=("ok", "err"))
+        def RequestPinCode(self, device, ok, err):
+            self.log.info("[Agent] RequestPinCode called for %s", device)
+            self._dispatch("pin", device, None, ok, err)
+
+        @dbus.service.method("org.bluez.Agent1", in_signature="o", out_signature="u", async_callbacks=("ok", "err"))
+        def RequestPasskey(self, device, ok, err):
+            self.log.info("[Agent] RequestPasskey called for %s", device)
+            self._dispatch("passkey", device, None, ok, err)
 
-        @dbus.service.method("org.bluez.Agent1", in_signature="ou", out_signature="")
-        def RequestConfirmation(self, device, passkey):
+        @dbus.service.method("org.bluez.Agent1", in_signature="ou", out_signature="", async_callbacks=("ok", "err"))
+        def RequestConfirmation(self, device, passkey, ok, err):
             self.log.info("[Agent] RequestConfirmation called for %s passkey=%s", device, passkey)
-            try:
-                threading.Thread(target=self.ui_callback, args=("confirm", device, passkey), daemon=True).start()
-            except Exception:
-                self.log.exception("ui_callback thread failed")
-            return  # immediate OK (no exception → confirmation accepted)
+            self._dispatch("confirm", device, int(passkey), ok, err)
 
-        @dbus.service.method("org.bluez.Agent1", in_signature="os", out_signature="")
-        def AuthorizeService(self, device, uuid):
+        @dbus.service.method("org.bluez.Agent1", in_signature="os", out_signature="", async_callbacks=("ok", "err"))
+        def AuthorizeService(self, device, uuid, ok, err):
             self.log.info("[Agent] AuthorizeService called for %s uuid=%s", device, uuid)
-            try:
-                threading.Thread(target=self.ui_callback, args=("authorize", device, uuid), daemon=True).start()
-            except Exception:
-                self.log.exception("ui_callback thread failed")
-            return
+            self._dispatch("authorize", device, str(uuid), ok, err)
+
+        @dbus.service.method("org.bluez.Agent1", in_signature="os", out_signature="")
+        def DisplayPinCode(self, device, pincode):
+            self.log.info("[Agent] DisplayPinCode called for %s pincode=%s", device, pincode)
+            self._dispatch("display_pin", device, str(pincode), lambda *args: None, lambda error: None)
+
+        @dbus.service.method("org.bluez.Agent1", in_signature="ouq", out_signature="")
+        def DisplayPasskey(self, device, passkey, entered):
+            self.log.info("[Agent] DisplayPasskey called for %s passkey=%06d", device, passkey)
+            self._dispatch("display_passkey", device, f"{int(passkey):06d}", lambda *args: None, lambda error: None)
 
         @dbus.service.method("org.bluez.Agent1", in_signature="", out_signature="")
         def Cancel(self):
             self.log.info("[Agent] Cancel called")
+            with self.lock:
+                pending_requests = list(self.pending_requests)
+            for request in pending_requests:
+                request.cancel()
+
+        @dbus.service.method("org.bluez.Agent1", in_signature="", out_signature="")
+        def Release(self):
+            self.log.info("[Agent] Release called")
+            self.Cancel()
 
     def get_paired_devices(self):
         """Retrieves all Bluetooth devices that are currently paired with the adapter.
@@ -95,19 +264,52 @@ class BluetoothDeviceManager:
             paired_devices: A dictionary of paired devices.
         """
         paired_devices = {}
-        for path, interfaces in self.object_manager.GetManagedObjects().items():
-            if constants.device_interface in interfaces:
-                device = interfaces[constants.device_interface]
-                if device.get("Paired") and device.get("Adapter") == self.adapter_path:
-                    address = device.get("Address")
-                    name = device.get("Name", "Unknown")
-                    paired_devices[address] = name
+        for path, device in self.device_index.get_devices(self.adapter_path).items():
+            if device.get("Paired"):
+                address = device.get("Address")
+                name = device.get("Name", "Unknown")
+                paired_devices[address] = name
         return paired_devices
 
-    def start_discovery(self):
-        """Start scanning for nearby Bluetooth devices, if not already discovering."""
+    @staticmethod
+    def build_discovery_filter(transport=None, rssi=None, uuids=None, duplicate_data=None):
+        """Build the argument of Adapter1.SetDiscoveryFilter.
+
+        Args:
+            transport: "auto", "bredr" or "le".
+            rssi: Minimum RSSI in dBm a device must have to be reported.
+            uuids: List of service UUIDs a device must advertise or expose.
+            duplicate_data: Whether to report repeated advertising data (RSSI updates).
+
+        Returns:
+            Dictionary of filter properties; empty to clear any previous filter.
+        """
+        discovery_filter = {}
+        if transport:
+            discovery_filter["Transport"] = dbus.String(transport)
+        if rssi is not None:
+            discovery_filter["RSSI"] = dbus.Int16(rssi)
+        if uuids:
+            discovery_filter["UUIDs"] = dbus.Array(uuids, signature="s")
+        if duplicate_data is not None:
+            discovery_filter["DuplicateData"] = dbus.Boolean(duplicate_data)
+        return discovery_filter
+
+    def start_discovery(self, transport=None, rssi=None, uuids=None, duplicate_data=None):
+        """Start scanning for nearby Bluetooth devices, if not already discovering.
+
+        The filter is applied by bluetoothd, so devices that do not match never reach
+        this process. Calling without filter arguments clears a previously set filter.
+
+        Args:
+            transport: "auto", "bredr" or "le".
+            rssi: Minimum RSSI in dBm a device must have to be reported.
+            uuids: List of service UUIDs a device must advertise or expose.
+            duplicate_data: Whether to report repeated advertising data (RSSI updates).
+        """
         try:
             if not self.adapter_properties.Get(constants.adapter_interface, "Discovering"):
+                self.adapter.SetDiscoveryFilter(self.build_discovery_filter(transport, rssi, uuids, duplicate_data))
                 self.adapter.StartDiscovery()
                 self.log.info("Discovery started.")
             else:
@@ -133,21 +335,160 @@ class BluetoothDeviceManager:
             discovered_devices: List of discovered Bluetooth devices.
         """
         discovered_devices = []
-        for path, interfaces in self.object_manager.GetManagedObjects().items():
-            device = interfaces.get(constants.device_interface)
-            if not device or device.get("Adapter") != self.adapter_path:
-                continue
-            address = device.get("Address")
-            alias = device.get("Alias", "Unknown")
-            if address:
-                discovered_devices.append({
-                    "path": path,
-                    "address": address,
-                    "alias": alias})
+        for path, device in self.device_index.get_devices(self.adapter_path).items():
+            if device.get("Address"):
+                discovered_devices.append(self._device_info(path, device))
             else:
                 self.log.warning("Failed to extract device info from %s", path)
         return discovered_devices
 
+    @staticmethod
+    def _device_info(path, device):
+        """Convert cached Device1 properties into the discovered-device dictionary."""
+        rssi = device.get("RSSI")
+        return {"path": path,
+                "address": str(device.get("Address")),
+                "alias": str(device.get("Alias", "Unknown")),
+                "rssi": int(rssi) if rssi is not None else None}
+
+    def add_discovery_listener(self, callback):
+        """Stream discovery results of this adapter as the device index changes.
+
+        Args:
+            callback: Callable taking (event, device) where event is "added", "changed" or
+                "removed" and device is a dictionary like those of get_discovered_devices().
+                It runs in the D-Bus dispatch context.
+
+        Returns:
+            The index listener, to be passed to remove_discovery_listener.
+        """
+        device_prefix = self.adapter_path + "/"
+
+        def listener(event, path, interface, properties):
+            if interface != constants.device_interface or not path.startswith(device_prefix):
+                return
+            if event == "removed":
+                callback(event, self._device_info(path, properties))
+                return
+            device = self.device_index.get_properties(path)
+            if device and device.get("Address"):
+                callback(event, self._device_info(path, device))
+
+        self.device_index.add_listener(listener)
+        return listener
+
+    def add_coalesced_discovery_listener(self, callback, flush_interval=0.05):
+        """Stream discovery results merged per device and flushed at a fixed rate.
+
+        RSSI and ManufacturerData updates can arrive hundreds of times per second during
+        discovery; consumers registered here receive at most one batch per flush interval
+        holding the latest state of every device that changed.
+
+        Args:
+            callback: Callable receiving a list of (event, device) tuples per flush.
+            flush_interval: Seconds between flushes.
+
+        Returns:
+            The index listener, to be passed to remove_discovery_listener.
+        """
+        coalescer = PropertyCoalescer(callback, flush_interval=flush_interval, log=self.log)
+        listener = self.add_discovery_listener(lambda event, device: coalescer.push(device["address"], event, device))
+        self.discovery_coalescers[listener] = coalescer
+        return listener
+
+    def get_discovery_counters(self, listener):
+        """Return the received, merged, dropped and flushed counters of a coalesced listener."""
+        coalescer = self.discovery_coalescers.get(listener)
+        return coalescer.get_counters() if coalescer else {}
+
+    def remove_discovery_listener(self, listener):
+        """Stop streaming discovery results to a listener returned by add_discovery_listener."""
+        self.device_index.remove_listener(listener)
+        coalescer = self.discovery_coalescers.pop(listener, None)
+        if coalescer:
+            coalescer.close()
+
+    def get_controller_details(self):
+        """Return the adapter name and address from its Adapter1 properties.
+
+        Properties come from the device index, which PropertiesChanged keeps current; a
+        single GetAll is issued only if the adapter is not in the index.
+
+        Returns:
+            Dictionary with Name, BD_ADDR, Powered, Discoverable and Class entries.
+        """
+        properties = self.device_index.get_properties(self.adapter_path, constants.adapter_interface)
+        if properties is None:
+            properties = self.adapter_properties.GetAll(constants.adapter_interface)
+        return {
+            "Name": str(properties.get("Alias") or properties.get("Name", "N/A")),
+            "BD_ADDR": str(properties.get("Address", "N/A")),
+            "Powered": bool(properties.get("Powered", False)),
+            "Discoverable": bool(properties.get("Discoverable", False)),
+            "Class": f"0x{int(properties.get('Class', 0)):06x}",
+        }
+
+    def add_adapter_listener(self, callback):
+        """Call callback(details) with get_controller_details() whenever Adapter1 properties change.
+
+        Args:
+            callback: Callable receiving the details dictionary, on the D-Bus dispatch thread.
+
+        Returns:
+            The registered listener, to pass to remove_adapter_listener.
+        """
+        def listener(event, path, interface, properties):
+            if path == self.adapter_path and interface == constants.adapter_interface and event != "removed":
+                callback(self.get_controller_details())
+
+        self.device_index.add_listener(listener)
+        return listener
+
+    def remove_adapter_listener(self, listener):
+        """Unregister a listener returned by add_adapter_listener."""
+        self.device_index.remove_listener(listener)
+
+    def get_device_state(self, address):
+        """Return the connection and service state of a device from the device index, without D-Bus calls.
+
+        Args:
+            address: Bluetooth address of remote device.
+
+        Returns:
+            Tuple (connected, sorted tuple of UUIDs); (False, ()) for unknown devices.
+        """
+        device_path = self.find_device_path(address)
+        properties = self.device_index.get_properties(device_path) if device_path else None
+        if not properties:
+            return False, ()
+        return bool(properties.get("Connected", False)), tuple(sorted(str(uuid).lower() for uuid in properties.get("UUIDs", [])))
+
+    def add_device_state_listener(self, callback):
+        """Call callback(address) when a device of this adapter is added or removed, or its Connected, Paired or UUIDs property changes.
+
+        Args:
+            callback: Callable receiving the device address, on the D-Bus dispatch thread.
+
+        Returns:
+            The registered listener, to pass to remove_device_state_listener.
+        """
+        def listener(event, path, interface, properties):
+            if interface != constants.device_interface or not path.startswith(self.adapter_path + "/"):
+                return
+            if event == "changed":
+                if not {"Connected", "Paired", "UUIDs"} & set(properties):
+                    return
+                properties = self.device_index.get_properties(path) or {}
+            if properties.get("Address"):
+                callback(str(properties["Address"]))
+
+        self.device_index.add_listener(listener)
+        return listener
+
+    def remove_device_state_listener(self, listener):
+        """Unregister a listener returned by add_device_state_listener."""
+        self.device_index.remove_listener(listener)
+
     def find_device_path(self, address):
         """Find the D-Bus object path of a device by address under the correct adapter.
 
@@ -157,14 +498,7 @@ class BluetoothDeviceManager:
         Returns:
             path: D-Bus object path.
         """
-        formatted_interface_path = f"{constants.bluez_path}/{self.interface}/"
-        for path, interfaces in self.object_manager.GetManagedObjects().items():
-            if constants.device_interface in interfaces and formatted_interface_path in path:
-                    properties = interfaces[constants.device_interface]
-                    if properties.get("Address") == address:
-                        return path
-                    else:
-                        pass
+        return self.device_index.find_device_path(self.adapter_path, address)
 
     '''def register_agent(self, capability=None, ui_callback=None):
         """Register this object as a Bluetooth pairing agent."""
@@ -178,11 +512,20 @@ class BluetoothDeviceManager:
             self.log.error("Failed to register agent:%s", error)
             return False'''
 
-    def register_agent(self, capability=None, ui_callback=None):
-        """Register this object as a Bluetooth pairing agent."""
-        try:
+    def register_agent(self, capability=None, ui_callback=None, policy=None):
+        """Register this object as a Bluetooth pairing agent.
 
-            self.agent = self.Agent(self.bus, constants.agent_path, ui_callback, self.log)
+        Args:
+            capability: Agent IO capability (e.g., "NoInputNoOutput", "KeyboardDisplay").
+            ui_callback: Callable receiving each AgentRequest; it must eventually call the
+                request's reply() or reject(), from any thread.
+            policy: AgentPolicy, or a list of rule dictionaries, answering matching requests
+                without the UI; only unmatched requests reach ui_callback.
+        """
+        try:
+            if policy is not None and not isinstance(policy, AgentPolicy):
+                policy = AgentPolicy(policy, log=self.log)
+            self.agent = self.Agent(self.bus, constants.agent_path, ui_callback, self.log, policy)
             agent_manager = dbus.Interface(
                 self.bus.get_object(constants.bluez_service, constants.bluez_path),
                 constants.agent_interface
@@ -212,122 +555,296 @@ class BluetoothDeviceManager:
             self.log.error("Failed to unregister agent: %s", error)
             raise
 
-    def pair(self, address):
-        """Pairs with a Bluetooth device using the given controller interface.
+    def _begin_device_operation(self, name, device_path, method, args, predicate, timeout, cancel=None):
+        """Issue a device method without blocking and return a handle completed by the matching index update.
+
+        The operation completes as soon as the device index reports the target state
+        (PropertiesChanged or InterfacesRemoved), or when BlueZ replies to the call,
+        whichever comes first. The D-Bus call uses the same timeout as the handle, and the
+        handle is expired on the dispatch thread at its deadline even if nobody waits on it.
+
+        Args:
+            name: Description of the operation used in logs.
+            device_path: D-Bus object path of the device whose state is awaited.
+            method: Bound dbus-python proxy method to call.
+            args: Positional arguments of the method.
+            predicate: Callable receiving the device properties (None once removed) and
+                returning True when the target state is reached.
+            timeout: Seconds until the operation is abandoned.
+            cancel: Callable asking BlueZ to abort the operation, without blocking.
+
+        Returns:
+            OperationHandle of the running operation.
+        """
+        handle = OperationHandle(name, timeout, cancel_callback=cancel, wait=wait_event, log=self.log)
+
+        def listener(event, path, interface, properties):
+            if path == device_path and interface == constants.device_interface:
+                if predicate(self.device_index.get_properties(device_path)):
+                    handle.finish(True)
+
+        self.device_index.add_listener(listener)
+        handle.add_done_callback(lambda _: self.device_index.remove_listener(listener))
+        method(*args, reply_handler=lambda *values: handle.finish(True), error_handler=lambda error: handle.finish(False, error),
+               timeout=timeout)
+        if predicate(self.device_index.get_properties(device_path)):
+            handle.finish(True)
+        self.dispatcher.call_later(timeout, handle.expire)
+        return handle
+
+    def _async_call_ignoring_errors(self, method, description):
+        """Return a callable issuing a D-Bus method without blocking, logging a failure."""
+        def call():
+            method(reply_handler=lambda *values: None,
+                   error_handler=lambda error: self.log.warning("%s failed: %s", description, error))
+
+        return call
+
+    def begin_pair(self, address, timeout=None):
+        """Start pairing with a Bluetooth device without waiting for it.
+
+        Cancelling the handle, or reaching its deadline, calls Device1.CancelPairing.
 
         Args:
             address: Bluetooth address of remote device.
+            timeout: Seconds to wait for the Paired property, defaults to operation_timeout.
 
         Returns:
-            True if successfully paired, False otherwise.
+            OperationHandle whose result is truthy once paired.
         """
+        name = f"pair {address}"
         device_path = self.find_device_path(address)
         if not device_path:
-            # self.log.info("Device path not found for %s on %s", address, self.interface)
-            return False
-        try:
-            device_proxy = self.bus.get_object(constants.bluez_service, device_path)
-            device = dbus.Interface(device_proxy, constants.device_interface)
-            properties = dbus.Interface(device_proxy, constants.properties_interface)
-            paired = properties.Get(constants.device_interface, "Paired")
-            if paired:
-                self.log.info("Device %s is already paired.", address)
-                return True
-            self.log.info("Initiating pairing with %s", address)
-            device.Pair()
-            paired = properties.Get(constants.device_interface, "Paired")
-            if paired:
-                self.log.info("Successfully paired with %s", address)
-                return True
-            self.log.warning("Pairing not confirmed with %s within the timeout period.", address)
-            return False
-        except dbus.exceptions.DBusException as error:
-            self.log.error("Pairing failed with %s: %s", address, error)
+            return OperationHandle.from_result(name, OperationResult(False, error="Device path not found"))
+        properties = self.device_index.get_properties(device_path)
+        if properties and properties.get("Paired"):
+            self.log.info("Device %s is already paired.", address)
+            return OperationHandle.from_result(name, OperationResult(True, 0.0))
+        self.log.info("Initiating pairing with %s", address)
+        device = self.proxy_pool.get(device_path).device
+        handle = self._begin_device_operation(name, device_path, device.Pair, (),
+                                              lambda props: bool(props and props.get("Paired")),
+                                              timeout or self.operation_timeout,
+                                              cancel=self._async_call_ignoring_errors(device.CancelPairing, f"CancelPairing of {address}"))
+        handle.add_done_callback(lambda handle: self.log.info("Successfully paired with %s in %.3fs", address, handle.outcome.latency)
+                                 if handle.outcome else self.log.error("Pairing failed with %s: %s", address, handle.outcome.error))
+        return handle
+
+    def pair(self, address, timeout=None):
+        """Pairs with a Bluetooth device using the given controller interface.
 
-    def connect(self, address):
-        """Establish a  connection to the specified Bluetooth device.
+        Args:
+            address: Bluetooth address of remote device.
+            timeout: Seconds to wait for the Paired property, defaults to operation_timeout.
+
+        Returns:
+            OperationResult that is truthy if successfully paired.
+        """
+        return self.begin_pair(address, timeout).result()
+
+    def begin_connect(self, address, timeout=None):
+        """Start connecting to a Bluetooth device without waiting for it.
+
+        Cancelling the handle, or reaching its deadline, calls Device1.Disconnect, which
+        aborts a pending connection attempt.
 
         Args:
             address: Bluetooth device address of remote device.
+            timeout: Seconds to wait for the Connected property, defaults to operation_timeout.
 
         Returns:
-            True if connected, False otherwise.
+            OperationHandle whose result is truthy once connected.
         """
+        name = f"connect {address}"
         device_path = self.find_device_path(address)
-        if device_path:
-            try:
-                device = dbus.Interface(self.bus.get_object(constants.bluez_service, device_path), constants.device_interface)
-                device.Connect()
-                properties = dbus.Interface(self.bus.get_object(constants.bluez_service, device_path), constants.properties_interface)
-                connected = properties.Get(constants.device_interface, "Connected")
-                if connected:
-                    self.log.info("Connection successful to %s", address)
-                    return True
-            except Exception as error:
-                self.log.info("Connection failed:%s", error)
-                return False
-        else:
+        if not device_path:
             self.log.info("Device path not found for address %s", address)
-            return False
+            return OperationHandle.from_result(name, OperationResult(False, error="Device path not found"))
+        device = self.proxy_pool.get(device_path).device
+        handle = self._begin_device_operation(name, device_path, device.Connect, (),
+                                              lambda props: bool(props and props.get("Connected")),
+                                              timeout or self.operation_timeout,
+                                              cancel=self._async_call_ignoring_errors(device.Disconnect, f"Disconnect of {address}"))
+        handle.add_done_callback(lambda handle: self.log.info("Connection successful to %s in %.3fs", address, handle.outcome.latency)
+                                 if handle.outcome else self.log.info("Connection failed:%s", handle.outcome.error))
+        return handle
+
+    def connect(self, address, timeout=None):
+        """Establish a  connection to the specified Bluetooth device.
 
-    def disconnect(self, address):
-        """Disconnect a Bluetooth  device from the specified adapter.
+        Args:
+            address: Bluetooth device address of remote device.
+            timeout: Seconds to wait for the Connected property, defaults to operation_timeout.
+
+        Returns:
+            OperationResult that is truthy if connected.
+        """
+        return self.begin_connect(address, timeout).result()
+
+    def begin_disconnect(self, address, timeout=None):
+        """Start disconnecting a Bluetooth device without waiting for it.
+
+        BlueZ cannot abort a disconnection; cancelling the handle only stops waiting.
 
         Args:
             address: Bluetooth  address of the remote device.
+            timeout: Seconds to wait for the Connected property to clear, defaults to operation_timeout.
 
         Returns:
-            True if disconnected or already disconnected, False if an error occurred.
+            OperationHandle whose result is truthy once disconnected.
         """
+        name = f"disconnect {address}"
         device_path = self.find_device_path(address)
-        if device_path:
-            try:
-                device = dbus.Interface(self.bus.get_object(constants.bluez_service, device_path), constants.device_interface)
-                properties = dbus.Interface(self.bus.get_object(constants.bluez_service, device_path), constants.properties_interface)
-                connected = properties.Get(constants.device_interface, "Connected")
-                if not connected:
-                    self.log.info("Device %s is already disconnected.", address)
-                    return True
-                device.Disconnect()
-                return True
-            except dbus.exceptions.DBusException as error:
-                self.log.info("Error disconnecting device %s:%s", address, error)
-        else:
+        if not device_path:
             self.log.warning("Device path not found for address: %s", address)
-        self.log.info("Disconnection failed for device: %s", address)
-        return False
+            self.log.info("Disconnection failed for device: %s", address)
+            return OperationHandle.from_result(name, OperationResult(False, error="Device path not found"))
+        properties = self.device_index.get_properties(device_path)
+        if not (properties and properties.get("Connected")):
+            self.log.info("Device %s is already disconnected.", address)
+            return OperationHandle.from_result(name, OperationResult(True, 0.0))
+        handle = self._begin_device_operation(name, device_path, self.proxy_pool.get(device_path).device.Disconnect, (),
+                                              lambda props: not (props and props.get("Connected")),
+                                              timeout or self.operation_timeout)
+        handle.add_done_callback(lambda handle: self.log.info("Disconnected %s in %.3fs", address, handle.outcome.latency)
+                                 if handle.outcome else self.log.info("Error disconnecting device %s:%s", address, handle.outcome.error))
+        return handle
+
+    def disconnect(self, address, timeout=None):
+        """Disconnect a Bluetooth  device from the specified adapter.
+
+        Args:
+            address: Bluetooth  address of the remote device.
+            timeout: Seconds to wait for the Connected property to clear, defaults to operation_timeout.
+
+        Returns:
+            OperationResult that is truthy if disconnected or already disconnected.
+        """
+        return self.begin_disconnect(address, timeout).result()
+
+    def begin_unpair_device(self, address, timeout=None):
+        """Start removing a device without waiting for it.
+
+        BlueZ cannot abort RemoveDevice; cancelling the handle only stops waiting.
+
+        Args:
+            address: The Bluetooth address of the remote device.
+            timeout: Seconds to wait for InterfacesRemoved, defaults to operation_timeout.
 
-    def unpair_device(self, address):
+        Returns:
+            OperationHandle whose result is truthy once the device is removed or if it was not present.
+        """
+        name = f"unpair {address}"
+        target_path = self.find_device_path(address)
+        if not target_path:
+            self.log.info("Device with address %s not found on %s", address, self.interface)
+            return OperationHandle.from_result(name, OperationResult(True, 0.0))
+        self.log.info("Requested unpair of device %s at path %s", address, target_path)
+        handle = self._begin_device_operation(name, target_path, self.adapter.RemoveDevice, (target_path,),
+                                              lambda props: props is None,
+                                              timeout or self.operation_timeout)
+        handle.add_done_callback(lambda handle: self.log.info("Device %s unpaired successfully in %.3fs", address, handle.outcome.latency)
+                                 if handle.outcome else self.log.error("Unpairing device %s failed: %s", address, handle.outcome.error))
+        return handle
+
+    def unpair_device(self, address, timeout=None):
         """Unpairs a paired or known Bluetooth device from the system using BlueZ D-Bus.
 
         Args:
             address: The Bluetooth address of the remote device.
+            timeout: Seconds to wait for InterfacesRemoved, defaults to operation_timeout.
 
         Returns:
-            True if the device was unpaired successfully or already not present,
-            False if the unpairing failed or the device still exists afterward.
+            OperationResult that is truthy if the device was removed or already not present,
+            falsy if the unpairing failed or the device still exists afterward.
         """
-        try:
-            target_path = None
-            for path, interfaces in self.object_manager.GetManagedObjects().items():
-                if constants.device_interface in interfaces and interfaces[constants.device_interface].get("Address") == address and path.startswith(self.adapter_path):
-                    target_path = path
-                    break
-            if not target_path:
-                self.log.info("Device with address %s not found on %s", address, self.interface)
-                return True
-            self.adapter.RemoveDevice(target_path)
-            self.log.info("Requested unpair of device %s at path %s", address, target_path)
-            time.sleep(0.5)
-            for path, interfaces in self.object_manager.GetManagedObjects().items():
-                if constants.device_interface in interfaces and interfaces[constants.device_interface].get("Address") == address:
-                        self.log.warning("Device %s still exists after attempted unpair", address)
-                        return False
-            self.log.info("Device %s unpaired successfully", address)
-            return True
-        except dbus.exceptions.DBusException as error:
-            self.log.error("DBusException while unpairing device %s: %s", address, error)
-            return False
+        return self.begin_unpair_device(address, timeout).result()
+
+    def _run_many(self, operation, addresses, concurrency):
+        """Run a per-device operation across many addresses with bounded concurrency.
+
+        Duplicate addresses are dropped so a device never has two operations in flight.
+
+        Args:
+            operation: Callable taking an address and returning an OperationResult.
+            addresses: Iterable of Bluetooth addresses.
+            concurrency: Maximum number of operations in flight on this adapter.
+
+        Yields:
+            (address, OperationResult) tuples in completion order.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        if not addresses:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(addresses))),
+                                thread_name_prefix=f"{self.interface}-batch") as executor:
+            futures = {executor.submit(operation, address): address for address in addresses}
+            for future in as_completed(futures):
+                address = futures[future]
+                try:
+                    result = future.result()
+                except Exception as error:
+                    self.log.error("Batch operation failed for %s: %s", address, error)
+                    result = OperationResult(False, error=error)
+                yield address, result
+
+    def pair_many(self, addresses, concurrency=None, timeout=None):
+        """Pair with many devices, yielding results as they complete.
+
+        Pairing is serial by default (pair_concurrency is 1). Most controllers run one
+        bonding procedure at a time, and BlueZ answers a second concurrent Pair() with
+        org.bluez.Error.InProgress. Pass a higher concurrency only for adapters known to
+        bond several devices in parallel.
+
+        Args:
+            addresses: Iterable of Bluetooth addresses.
+            concurrency: Maximum parallel pairings, defaults to pair_concurrency.
+            timeout: Per-device timeout in seconds, defaults to operation_timeout.
+
+        Yields:
+            (address, OperationResult) tuples in completion order.
+        """
+        concurrency = concurrency or self.pair_concurrency
+        return self._run_many(lambda address: self.pair(address, timeout), addresses, concurrency)
+
+    def connect_many(self, addresses, concurrency=None, timeout=None):
+        """Connect to many devices, yielding results as they complete.
+
+        Args:
+            addresses: Iterable of Bluetooth addresses.
+            concurrency: Maximum parallel operations, defaults to batch_concurrency.
+            timeout: Per-device timeout in seconds, defaults to operation_timeout.
+
+        Yields:
+            (address, OperationResult) tuples in completion order.
+        """
+        return self._run_many(lambda address: self.connect(address, timeout), addresses, concurrency or self.batch_concurrency)
+
+    def disconnect_many(self, addresses, concurrency=None, timeout=None):
+        """Disconnect many devices, yielding results as they complete.
+
+        Args:
+            addresses: Iterable of Bluetooth addresses.
+            concurrency: Maximum parallel operations, defaults to batch_concurrency.
+            timeout: Per-device timeout in seconds, defaults to operation_timeout.
+
+        Yields:
+            (address, OperationResult) tuples in completion order.
+        """
+        return self._run_many(lambda address: self.disconnect(address, timeout), addresses, concurrency or self.batch_concurrency)
+
+    def unpair_many(self, addresses, concurrency=None, timeout=None):
+        """Unpair many devices, yielding results as they complete.
+
+        Args:
+            addresses: Iterable of Bluetooth addresses.
+            concurrency: Maximum parallel operations, defaults to batch_concurrency.
+            timeout: Per-device timeout in seconds, defaults to operation_timeout.
+
+        Yields:
+            (address, OperationResult) tuples in completion order.
+        """
+        return self._run_many(lambda address: self.unpair_device(address, timeout), addresses, concurrency or self.batch_concurrency)
 
     def is_device_paired(self, device_address):
         """Checks if the specified device is paired.
@@ -341,9 +858,8 @@ class BluetoothDeviceManager:
         device_path = self.find_device_path(device_address)
         if not device_path:
             return False
-        properties = dbus.Interface(self.bus.get_object(constants.bluez_service, device_path), constants.properties_interface)
         try:
-            return properties.Get(constants.device_interface, "Paired")
+            return self.proxy_pool.get(device_path).properties.Get(constants.device_interface, "Paired")
         except dbus.exceptions.DBusException as error:
             self.log.debug("DBusException while checking pairing:%s", error)
             return False
@@ -362,8 +878,7 @@ class BluetoothDeviceManager:
             self.log.debug("Device path not found for %s on %s", device_address, self.interface)
             return False
         try:
-            properties = dbus.Interface(self.bus.get_object(constants.bluez_service, device_path), constants.properties_interface)
-            connected = properties.Get(constants.device_interface, "Connected")
+            connected = self.proxy_pool.get(device_path).properties.Get(constants.device_interface, "Connected")
             if self.interface not in device_path:
                 self.log.debug("Device path %s does not match interface %s", device_path, self.interface)
                 return False
@@ -372,42 +887,138 @@ class BluetoothDeviceManager:
             self.log.debug("DBusException while checking connection:%s", error)
             return False
 
-    def start_a2dp_stream(self, address, filepath=None):
-        """Initiates an A2DP audio stream to a Bluetooth device using PulseAudio.
+    def begin_a2dp_stream(self, address, filepath=None, playlist=None, loop=False, timeout=None):
+        """Start an A2DP audio stream to a Bluetooth device and return a handle to it.
+
+        Audio is written in-process to the device's A2DP sink; a stream already running
+        is stopped first. The handle finishes when the playlist has been played; cancelling
+        it, or reaching its deadline, terminates the stream.
 
         Args:
             address: Bluetooth address of the target device.
             filepath: Path to the audio file.
+            playlist: List of audio files played gaplessly in order, instead of filepath.
+            loop: True to repeat the playlist until stopped, or the number of passes.
+            timeout: Maximum number of seconds to stream, or None to stream until the end.
 
         Returns:
-            True if the stream was started, False otherwise.
+            OperationHandle of the stream; its result is falsy if the stream could not be
+            started or failed.
         """
+        name = f"A2DP stream to {address}"
         device_path = self.find_device_path(address)
         self.log.info("Device path:%s",device_path)
         if not device_path:
             self.log.info("Device path not found")
+        playlist = list(playlist or [filepath])
+        prepared = []
         try:
-            self.log.info("Starting A2DP stream to device path: %s with file: %s", device_path, filepath)
-            self.stream_process = run(self.log, ["paplay", filepath], block=False)
-            return True
+            self.stop_a2dp_stream()
+            playlist = prepared = self.prepare_audio(address, playlist)
+            sink = get_a2dp_sink_name(address)
+            self.log.info("Starting A2DP stream to sink %s with files: %s", sink, playlist)
+            streamer = A2dpStreamer(sink, playlist, loop=loop, log=self.log,
+                                    on_finished=lambda streamer: handle.finish(streamer.error is None, streamer.error))
+            handle = OperationHandle(name, timeout, cancel_callback=streamer.stop, wait=wait_event, log=self.log)
+            self.a2dp_stream_handle = handle
+            self.a2dp_streamer = streamer.start()
+            handle.add_done_callback(lambda _: self.release_audio(prepared))
+            handle.add_done_callback(self._clear_a2dp_stream)
         except Exception as error:
             self.log.error("Stream error:%s", error)
-            return False
+            self.release_audio(prepared)
+            return OperationHandle.from_result(name, OperationResult(False, error=error))
+        if timeout is not None:
+            self.dispatcher.call_later(timeout, handle.expire)
+        return handle
+
+    def start_a2dp_stream(self, address, filepath=None, playlist=None, loop=False):
+        """Initiates an A2DP audio stream to a Bluetooth device using PulseAudio.
+
+        Args:
+            address: Bluetooth address of the target device.
+            filepath: Path to the audio file.
+            playlist: List of audio files played gaplessly in order, instead of filepath.
+            loop: True to repeat the playlist until stopped, or the number of passes.
+
+        Returns:
+            True if the stream was started, False otherwise.
+        """
+        handle = self.begin_a2dp_stream(address, filepath, playlist, loop)
+        return not handle.is_finished or bool(handle.outcome)
+
+    def get_a2dp_transport_format(self, address):
+        """Return the PCM format negotiated on the device's A2DP transport.
+
+        Args:
+            address: Bluetooth address of the device.
+
+        Returns:
+            Tuple (sample rate, channels, bits per sample), or None if no SBC transport is configured.
+        """
+        device_path = self.find_device_path(address)
+        if not device_path:
+            return None
+        for properties in self.device_index.get_objects(self.media_transport_interface, device_path + "/").values():
+            audio_format = get_transport_format(properties.get("Codec", -1), properties.get("Configuration"))
+            if audio_format:
+                return audio_format
+        return None
+
+    def prepare_audio(self, address, paths):
+        """Decode audio files once to the device's sink format through the audio cache.
+
+        The returned files are pinned in the cache, so they are not evicted while being
+        streamed; pass them to release_audio once the stream has ended.
+
+        Args:
+            address: Bluetooth address of the device the audio will be streamed to.
+            paths: Audio files in any format ffmpeg can decode.
+
+        Returns:
+            List of WAV paths ready for streaming, in the same order.
+        """
+        if self.audio_cache is None:
+            self.audio_cache = AudioCache(log=self.log)
+        audio_format = self.get_a2dp_transport_format(address) or DEFAULT_FORMAT
+        prepared = []
+        try:
+            for path in paths:
+                prepared.append(self.audio_cache.get(path, audio_format, pin=True))
+        except Exception:
+            self.release_audio(prepared)
+            raise
+        return prepared
+
+    def release_audio(self, paths):
+        """Unpin files returned by prepare_audio so the cache may evict them again."""
+        if self.audio_cache is not None:
+            for path in paths:
+                self.audio_cache.release(path)
 
     def stop_a2dp_stream(self):
-        """Stop the current A2DP audio stream."""
-        if hasattr(self, 'stream_process') and self.stream_process:
-            if self.stream_process.poll() is None:
-                self.stream_process.terminate()
-                self.stream_process.wait()
-                self.log.info("Stream terminated successfully.")
-            else:
-                self.log.info("Stream was already stopped.")
-            self.stream_process = None
+        """Stop the current A2DP audio stream.
+
+        Returns:
+            True if a stream was stopped, False if none was active.
+        """
+        handle, streamer = self.a2dp_stream_handle, self.a2dp_streamer
+        if handle and handle.cancel("Stopped"):
+            self.log.info("Stream stopped: %s", streamer.get_stats())
             return True
         self.log.info("No active stream to stop.")
         return False
 
+    def _clear_a2dp_stream(self, handle):
+        """Forget the current stream once its handle is finished, however it ended."""
+        if self.a2dp_stream_handle is handle:
+            self.a2dp_stream_handle = None
+            self.a2dp_streamer = None
+
+    def get_a2dp_stream_stats(self):
+        """Return bytes written, underruns and drift of the current stream, or None if no stream is active."""
+        return self.a2dp_streamer.get_stats() if self.a2dp_streamer else None
+
     def media_control(self, command, address=None):
         """Sends AVRCP (Audio/Video Remote Control Profile) media control commands to a connected Bluetooth device.
 
@@ -443,12 +1054,10 @@ class BluetoothDeviceManager:
             The MediaControl1 D-Bus interface if found, otherwise None.
         """
         try:
-            formatted_addr = address.replace(":", "_").upper()
-            for path, interfaces in self.object_manager.GetManagedObjects().items():
-                if constants.media_control_interface in interfaces:
-                    if formatted_addr in path and path.startswith(self.adapter_path):
-                        self.log.info("Found MediaControl1 at %s", path)
-                        return dbus.Interface(self.bus.get_object(constants.bluez_service, path), constants.media_control_interface)
+            path = self.find_device_path(address)
+            if path and self.device_index.has_interface(path, constants.media_control_interface):
+                self.log.info("Found MediaControl1 at %s", path)
+                return self.proxy_pool.get(path).media_control
             self.log.info(" No MediaControl1 interface found for %s under %s", address, self.adapter_path)
         except Exception as error:
             self.log.info(" Exception while getting MediaControl1 interface:%s", error)
@@ -463,105 +1072,253 @@ class BluetoothDeviceManager:
             sink or source
         """
         uuid_map = {"source": "110a", "sink": "110b"}
-        for path, interfaces in self.object_manager.GetManagedObjects().items():
-            if constants.device_interface in interfaces:
-                properties = interfaces[constants.device_interface]
-                if properties.get("Address") == device_address and properties.get("Connected") and properties.get("Adapter") == self.adapter_path:
-                    uuids = properties.get("UUIDs", [])
-                    for role, uuid_role in uuid_map.items():
-                        if any(uuid_role in uuid.lower() for uuid in uuids):
-                            return role
-                        else:
-                            self.log.warning("Unknown A2DP role %s", device_address)
-
-    def send_file(self, device_address, file_path, session_path=None):
-        """Send a file via OBEX OPP and wait for real-time transfer status."""
+        device_path = self.find_device_path(device_address)
+        properties = self.device_index.get_properties(device_path) if device_path else None
+        if properties and properties.get("Connected"):
+            uuids = properties.get("UUIDs", [])
+            for role, uuid_role in uuid_map.items():
+                if any(uuid_role in uuid.lower() for uuid in uuids):
+                    return role
+                else:
+                    self.log.warning("Unknown A2DP role %s", device_address)
+
+    def connect_session_bus(self):
+        """Connect to the session bus obexd lives on.
+
+        Called from __init__, so the blocking connect happens at start-up rather than on
+        the first OPP action from the GUI thread. A missing session bus only disables OBEX.
+
+        Returns:
+            The session bus connection, or None if it is unavailable.
+        """
+        if self.session_bus is None:
+            try:
+                self.session_bus = dbus.SessionBus()
+            except dbus.DBusException as error:
+                self.log.warning("Session bus unavailable, OBEX transfers disabled: %s", error)
+        return self.session_bus
+
+    def get_obex_client(self):
+        """Return the obexd Client1 interface, creating it on first use.
+
+        The session bus is connected at start-up and the proxy is created without
+        introspection, so the first call (often made from the GUI thread) does not block.
+        """
+        if self.obex_manager is None:
+            if self.connect_session_bus() is None:
+                raise dbus.DBusException("Session bus unavailable")
+            self.obex_manager = dbus.Interface(self.session_bus.get_object(constants.obex_service, constants.obex_path,
+                                                                           introspect=False),
+                                               constants.obex_client)
+            self.transfer_monitor = ObexTransferMonitor(self.session_bus, log=self.log)
+            self.obex_sessions = ObexSessionPool(self.session_bus, self.obex_manager, self.transfer_monitor,
+                                                 idle_timeout=self.obex_idle_timeout,
+                                                 call_timeout=self.operation_timeout, log=self.log)
+        return self.obex_manager
+
+    def send_file_async(self, device_address, file_path, on_progress=None, on_finished=None, session_path=None,
+                        timeout=None):
+        """Queue a file for sending via OBEX OPP without waiting for the transfer.
+
+        Files to the same device are pushed back to back over one pooled session in
+        submission order; session creation and SendFile are non-blocking calls and
+        progress arrives through Transfer1 PropertiesChanged signals.
+
+        Args:
+            device_address: Bluetooth address of the receiving device.
+            file_path: Path of the file to send.
+            on_progress: Callable receiving the ObexTransfer on every progress update.
+            on_finished: Callable receiving the ObexTransfer once it is finished.
+            session_path: Existing OBEX session to send on directly, bypassing the pool.
+            timeout: Seconds after which the transfer is cancelled through Transfer1.Cancel
+                if it has not finished, or None for no deadline.
+
+        Returns:
+            ObexTransfer handle of the transfer; its cancel() aborts it.
+        """
+        self.get_obex_client()
+        adapter = self.device_index.get_properties(self.adapter_path, constants.adapter_interface) or {}
+        source = str(adapter["Address"]) if adapter.get("Address") else None
+        transfer = ObexTransfer(self.session_bus, device_address, file_path, on_progress=on_progress, log=self.log,
+                                source=source)
+        if on_finished:
+            transfer.add_done_callback(on_finished)
         if not os.path.exists(file_path):
-            self.log.info("File does not exist: %s", file_path)
-            return "error"
+            transfer.fail(f"File does not exist: {file_path}")
+        elif session_path:
+            self.obex_sessions.send_on_session(session_path, transfer)
+        else:
+            self.obex_sessions.submit(transfer)
+        if timeout is not None and not transfer.is_finished:
+            self.dispatcher.call_later(timeout, self._expire_transfer, transfer, timeout)
+        return transfer
+
+    def _expire_transfer(self, transfer, timeout):
+        """Cancel a transfer still running at its deadline."""
+        if transfer.is_finished:
+            return
+        self.log.warning("Transfer of %s to %s timed out after %ss", transfer.file_path, transfer.device_address, timeout)
+        transfer.error = f"Timed out after {timeout}s"
+        transfer.cancel()
+
+    def send_files(self, device_address, file_paths, on_progress=None, on_finished=None):
+        """Queue several files for one device; they are pushed in order over a single session.
+
+        Args:
+            device_address: Bluetooth address of the receiving device.
+            file_paths: Paths of the files to send.
+            on_progress: Callable receiving each ObexTransfer on every progress update.
+            on_finished: Callable receiving each ObexTransfer once it is finished.
+
+        Returns:
+            List of ObexTransfer handles in queue order.
+        """
+        return [self.send_file_async(device_address, file_path, on_progress, on_finished) for file_path in file_paths]
+
+    def send_file_to_many_async(self, device_addresses, file_path, parallelism=None, on_finished=None):
+        """Start pushing one file to several devices concurrently.
+
+        Args:
+            device_addresses: Bluetooth addresses of the receiving devices.
+            file_path: Path of the file to send.
+            parallelism: Maximum number of concurrent transfers, opp_parallelism if not given.
+            on_finished: Callable receiving the aggregated report once every device is done.
+
+        Returns:
+            Started ParallelPush; its wait() returns the report and cancel() stops the push.
+        """
+        return ParallelPush(lambda address: self.send_file_async(address, file_path), device_addresses, file_path,
+                            parallelism=parallelism or self.opp_parallelism, on_finished=on_finished,
+                            log=self.log).start()
+
+    def send_file_to_many(self, device_addresses, file_path, parallelism=None, timeout=None):
+        """Push one file to several devices concurrently and wait for all of them.
+
+        Args:
+            device_addresses: Bluetooth addresses of the receiving devices.
+            file_path: Path of the file to send.
+            parallelism: Maximum number of concurrent transfers, opp_parallelism if not given.
+            timeout: Maximum number of seconds to wait, or None to wait for every transfer.
+
+        Returns:
+            Report dictionary with per-device status, duration and throughput and the totals.
+        """
+        return self.send_file_to_many_async(device_addresses, file_path, parallelism).wait(timeout)
+
+    def send_file(self, device_address, file_path, session_path=None, timeout=None):
+        """Send a file via OBEX OPP and wait for the final transfer status.
+
+        Args:
+            device_address: Bluetooth address of the receiving device.
+            file_path: Path of the file to send.
+            session_path: Existing OBEX session to use.
+            timeout: Seconds after which the transfer is cancelled, or None to wait for completion.
+
+        Returns:
+            Final Transfer1 status ("complete", "error", "cancelled"), or the current one on timeout.
+        """
         try:
-            if not session_path:
-                session_path = self.create_obex_session(device_address)
-            opp_interface = dbus.Interface(self.session_bus.get_object(constants.obex_service, session_path), constants.obex_object_push)
-            transfer_path, _ = opp_interface.SendFile(file_path)
-            self.log.info("Started transfer: %s", transfer_path)
-            self.transfer_status = {"status": "unknown"}
-            self.session_bus.add_signal_receiver(
-                self.obex_properties_changed,
-                dbus_interface=constants.properties_interface,
-                signal_name="PropertiesChanged",
-                arg0=constants.obex_object_transfer,
-                path=transfer_path,
-                path_keyword="path")
-            self.transfer_loop = GLib.MainLoop()
-            self.transfer_loop.run()
-            status = self.transfer_status["status"]
-            self.remove_obex_session(session_path)
-            return status
+            transfer = self.send_file_async(device_address, file_path, session_path=session_path, timeout=timeout)
         except Exception as error:
             self.log.info("OBEX send failed: %s", error)
             return "error"
+        return transfer.wait(timeout)
 
-    def receive_file(self, save_directory="/tmp", timeout=20, user_confirm_callback=None):
-        """Start an OBEX Object Push server and wait for a file to be received."""
-        try:
-            if not os.path.exists(save_directory):
-                os.makedirs(save_directory)
+    def start_opp_receiver(self, save_directory=DEFAULT_SAVE_DIRECTORY, policy=None):
+        """Start the persistent OBEX Object Push server, or return the one already running.
+
+        Stale obexpushd instances are killed only when the server is first started; later
+        receives reuse it, so back-to-back inbound pushes are never refused.
+
+        Args:
+            save_directory: Directory obexpushd stores received files in; a different
+                directory restarts the server.
+            policy: Callable receiving each ReceivedFile and returning False to reject it.
+
+        Returns:
+            The running OppReceiverService; add_listener() subscribes to accepted and
+            rejected files.
+        """
+        if self.opp_receiver and self.opp_receiver.save_directory != save_directory:
+            self.stop_opp_receiver()
+        if self.opp_receiver is None:
             run(self.log, "killall -9 obexpushd")
             self.log.info("Killed existing obexpushd processes..")
-            existing_files = set(os.listdir(save_directory))
-            self.opp_process = subprocess.Popen(["obexpushd", "-B", "-o", save_directory, "-n"])
-            self.log.info("OPP server started. Waiting for incoming file...")
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                current_files = set(os.listdir(save_directory))
-                new_files = current_files - existing_files
-                if new_files:
-                    received_file = new_files.pop()
-                    full_path = os.path.join(save_directory, received_file)
-                    self.log.info("Incoming file: %s", received_file)
-                    user_accepted = True
-                    if user_confirm_callback:
-                        user_accepted = user_confirm_callback(full_path)
-                    if user_accepted:
-                        self.log.info("User accepted file.")
-                        self.stop_opp_receiver()
-                        return full_path
-                    else:
-                        self.log.info("User rejected file.")
-                        os.remove(full_path)
-                        self.stop_opp_receiver()
+            self.opp_receiver = OppReceiverService(save_directory, policy=policy, log=self.log)
+        elif policy is not None:
+            self.opp_receiver.set_policy(policy)
+        self.opp_receiver.start()
+        return self.opp_receiver
+
+    def receive_files(self, save_directory=DEFAULT_SAVE_DIRECTORY, timeout=20, user_confirm_callback=None, max_files=None):
+        """Collect the files pushed to the OPP server.
+
+        Files are reported once obexpushd has closed them, so they are complete. The
+        server keeps running after the call returns.
+
+        Args:
+            save_directory: Directory obexpushd stores received files in.
+            timeout: Maximum number of seconds to wait for files.
+            user_confirm_callback: Callable receiving the path of each received file and
+                returning False to reject (delete) it.
+            max_files: Number of accepted files after which receiving stops, or None to
+                receive until the timeout.
+
+        Returns:
+            List of accepted ReceivedFile records with size and receive duration.
+        """
+        accepted = []
+        pending = queue.Queue()
+
+        def collect(event, received):
+            if event == "accepted":
+                pending.put(received)
+
+        receiver = None
+        try:
+            receiver = self.start_opp_receiver(save_directory)
+            # One queue for the whole call: files accepted while user_confirm_callback
+            # is showing a dialog are delivered on the next pass, exactly once.
+            receiver.add_listener(collect)
+            self.log.info("OPP server running. Waiting for incoming files...")
+            deadline = time.monotonic() + timeout
+            while max_files is None or len(accepted) < max_files:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    received = pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if user_confirm_callback and not user_confirm_callback(received.path):
+                    self.log.info("User rejected file.")
+                    receiver.reject(received)
+                    continue
+                self.log.info("User accepted file.")
+                accepted.append(received)
         except Exception as error:
-            self.stop_opp_receiver()
-            self.log.error("Error in receive_file:%s", error)
+            self.log.error("Error in receive_files:%s", error)
+        finally:
+            if receiver:
+                receiver.remove_listener(collect)
+        return accepted
+
+    def receive_file(self, save_directory=DEFAULT_SAVE_DIRECTORY, timeout=20, user_confirm_callback=None):
+        """Wait for one file to be pushed to the OPP server.
+
+        Returns:
+            Path of the accepted file, or None if no file was accepted before the timeout.
+        """
+        received = self.receive_files(save_directory, timeout, user_confirm_callback, max_files=1)
+        return received[0].path if received else None
 
     def stop_opp_receiver(self):
         """Stop the OBEX Object Push server if it's currently running."""
-        if self.opp_process and self.opp_process.poll() is None:
-            self.opp_process.terminate()
-            self.opp_process.wait()
-            self.log.info("OPP server stopped.")
+        if self.opp_receiver and self.opp_receiver.is_running:
+            self.opp_receiver.stop()
         else:
             self.log.info("No OPP server running or already stopped.")
-
-    def obex_properties_changed(self, interface, changed, invalidated, path):
-        """Handle the PropertiesChanged signal for an OBEX file transfer.
-
-        Args:
-            interface: The D-Bus interface name where the property change occurred.
-            changed: A dictionary containing the properties that changed and their new values.
-            invalidated: A list of properties that are no longer valid.
-            path: The D-Bus object path for the signal.
-        """
-        if "Status" in changed:
-            status = str(changed["Status"])
-            self.log.info("Signal: Transfer status changed to:%s", status)
-            self.transfer_status["status"] = status
-            if status in ["complete", "error", "cancelled"]:
-                if hasattr(self, "transfer_loop") and self.transfer_loop.is_running():
-                    self.transfer_loop.quit()
-            else:
-                self.log.warning("PropertiesChanged received without 'Status': %s", changed)
+        self.opp_receiver = None
 
     def set_discoverable_mode(self, enable):
         """Enable or disable discoverable mode on the Bluetooth adapter.
@@ -585,10 +1342,8 @@ class BluetoothDeviceManager:
         Returns:
             session_path: The OBEX session path if successful, else return False.
         """
-        DBusGMainLoop(set_as_default=True)
         try:
-            self.session_bus = dbus.SessionBus()
-            self.obex_manager = dbus.Interface(self.session_bus.get_object(constants.obex_service, constants.obex_path), constants.obex_client)
+            self.get_obex_client()
             if getattr(self, "last_session_path", None):
                 self.obex_manager.RemoveSession(self.last_session_path)
                 self.log.info("Removed previous OBEX session: %s", self.last_session_path)
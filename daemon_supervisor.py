@@ -0,0 +1,216 @@
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import dbus
+import dbus.bus
+
+SYSTEM_BUS_SOCKET = "/run/dbus/system_bus_socket"
+
+
+def unix_socket_accepts(path):
+    """Check whether a Unix socket exists and accepts connections.
+
+    Args:
+        path: Filesystem path of the socket.
+    """
+    if not os.path.exists(path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(0.5)
+        try:
+            probe.connect(path)
+            return True
+        except OSError:
+            return False
+
+
+def system_bus_ready():
+    """Readiness probe of the system D-Bus daemon."""
+    return unix_socket_accepts(SYSTEM_BUS_SOCKET)
+
+
+def dbus_name_has_owner(name, bus_type=dbus.bus.BusConnection.TYPE_SYSTEM):
+    """Readiness probe checking that a well-known name (e.g., org.bluez) is owned on the bus.
+
+    A private connection is used so a probe made before the bus is up does not poison the
+    shared dbus.SystemBus() connection.
+
+    Args:
+        name: Well-known bus name.
+        bus_type: dbus.bus.BusConnection.TYPE_SYSTEM or TYPE_SESSION.
+    """
+    try:
+        connection = dbus.bus.BusConnection(bus_type)
+    except dbus.exceptions.DBusException:
+        return False
+    try:
+        return bool(connection.name_has_owner(name))
+    except dbus.exceptions.DBusException:
+        return False
+    finally:
+        connection.close()
+
+
+def pulseaudio_socket_paths():
+    """Return the native socket paths PulseAudio may listen on, in lookup order."""
+    paths = []
+    server = os.environ.get("PULSE_SERVER", "")
+    if server.startswith("unix:"):
+        paths.append(server[len("unix:"):])
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
+    paths.append(os.path.join(runtime_directory, "pulse", "native"))
+    paths.append("/var/run/pulse/native")
+    return paths
+
+
+def pulseaudio_ready():
+    """Readiness probe of PulseAudio: its native socket accepts connections."""
+    return any(unix_socket_accepts(path) for path in pulseaudio_socket_paths())
+
+
+class Daemon:
+    """A supervised daemon: how to start it, stop it and tell that it is ready."""
+
+    def __init__(self, name, start, stop=None, ready=None, depends_on=()):
+        """Initialize the daemon description.
+
+        Args:
+            name: Daemon name used in logs and timings.
+            start: Callable starting the daemon.
+            stop: Callable stopping the daemon.
+            ready: Callable returning True once the daemon serves requests; the daemon is
+                considered ready as soon as start returns if not given.
+            depends_on: Names of daemons that must be ready before this one starts.
+        """
+        self.name = name
+        self.start = start
+        self.stop = stop
+        self.ready = ready
+        self.depends_on = tuple(depends_on)
+
+
+class DaemonSupervisor:
+    """Starts independent daemons in parallel and waits on readiness probes, not fixed delays.
+
+    A daemon starts as soon as the daemons it depends on are ready, so bring-up takes as
+    long as the slowest dependency chain. Start and readiness times are recorded per
+    daemon.
+    """
+
+    def __init__(self, log=None, ready_timeout=20, poll_interval=0.05):
+        """Initialize the supervisor.
+
+        Args:
+            log: Logger instance.
+            ready_timeout: Seconds to wait for a daemon's readiness probe.
+            poll_interval: Seconds between readiness probes.
+        """
+        self.log = log
+        self.ready_timeout = ready_timeout
+        self.poll_interval = poll_interval
+        self.daemons = {}
+        self.timings = {}
+        self.lock = threading.Lock()
+
+    def add(self, name, start, stop=None, ready=None, depends_on=()):
+        """Register a daemon; see Daemon for the arguments."""
+        self.daemons[name] = Daemon(name, start, stop, ready, depends_on)
+
+    def start_all(self):
+        """Start every daemon, each as soon as its dependencies are ready.
+
+        Returns:
+            Dictionary of daemon names to timings (seconds to start, to become ready, and
+            whether it became ready).
+        """
+        began = time.monotonic()
+        events = {name: threading.Event() for name in self.daemons}
+        with ThreadPoolExecutor(max_workers=max(1, len(self.daemons)), thread_name_prefix="daemon") as executor:
+            for daemon in self.daemons.values():
+                executor.submit(self._start_daemon, daemon, events)
+        if self.log:
+            self.log.info("Daemons started in %.2fs: %s", time.monotonic() - began, self.get_timings())
+        return self.get_timings()
+
+    def stop_all(self):
+        """Stop every daemon in reverse dependency order, each once its dependents have stopped.
+
+        Independent daemons stop in parallel, so dbus is torn down only after bluetoothd
+        and pulseaudio are gone.
+        """
+        began = time.monotonic()
+        events = {name: threading.Event() for name in self.daemons}
+        dependents = {name: [] for name in self.daemons}
+        for daemon in self.daemons.values():
+            for dependency in daemon.depends_on:
+                if dependency in dependents:
+                    dependents[dependency].append(daemon.name)
+        with ThreadPoolExecutor(max_workers=max(1, len(self.daemons)), thread_name_prefix="daemon") as executor:
+            for daemon in self.daemons.values():
+                executor.submit(self._stop_daemon, daemon, dependents[daemon.name], events)
+        if self.log:
+            self.log.info("Daemons stopped in %.2fs", time.monotonic() - began)
+
+    def get_timings(self):
+        """Return a copy of the recorded per-daemon timings."""
+        with self.lock:
+            return {name: dict(timing) for name, timing in self.timings.items()}
+
+    def _start_daemon(self, daemon, events):
+        """Worker starting one daemon after its dependencies and waiting for readiness."""
+        try:
+            for dependency in daemon.depends_on:
+                if dependency in events and not events[dependency].wait(self.ready_timeout):
+                    if self.log:
+                        self.log.warning("%s starts without %s being ready", daemon.name, dependency)
+            began = time.monotonic()
+            try:
+                daemon.start()
+            except Exception as error:
+                if self.log:
+                    self.log.error("Failed to start %s: %s", daemon.name, error)
+            started = time.monotonic()
+            ready = self._wait_ready(daemon)
+            finished = time.monotonic()
+            with self.lock:
+                self.timings[daemon.name] = {"start": started - began, "ready": finished - began, "ok": ready}
+            if self.log:
+                if ready:
+                    self.log.info("%s ready after %.2fs", daemon.name, finished - began)
+                else:
+                    self.log.warning("%s not ready after %.2fs", daemon.name, finished - began)
+        finally:
+            events[daemon.name].set()
+
+    def _wait_ready(self, daemon):
+        """Poll a daemon's readiness probe until it succeeds or the timeout expires."""
+        if daemon.ready is None:
+            return True
+        deadline = time.monotonic() + self.ready_timeout
+        while True:
+            try:
+                if daemon.ready():
+                    return True
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
+
+    def _stop_daemon(self, daemon, dependents, events):
+        """Worker stopping one daemon after the daemons depending on it have stopped."""
+        try:
+            for dependent in dependents:
+                if not events[dependent].wait(self.ready_timeout):
+                    if self.log:
+                        self.log.warning("%s stops before %s has stopped", daemon.name, dependent)
+            if daemon.stop:
+                daemon.stop()
+        except Exception as error:
+            if self.log:
+                self.log.warning("Failed to stop %s: %s", daemon.name, error)
+        finally:
+            events[daemon.name].set()
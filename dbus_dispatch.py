@@ -0,0 +1,154 @@
+import threading
+
+import dbus.mainloop.glib
+from gi.repository import GLib
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+class DBusDispatcher:
+    """Services the default GLib main context that dbus-python dispatches on.
+
+    Signal receivers, Agent1 method calls and async call replies are only delivered while
+    something iterates the default GLib main context. The dispatcher makes that explicit
+    and gives every handler a defined thread:
+
+    - "qt": a running Qt application whose event dispatcher is GLib-based (the default on
+      Linux) already iterates the default context; handlers run on the GUI thread.
+    - "thread": a GLib main loop runs on a dedicated daemon thread; handlers run there.
+
+    "auto" picks "qt" when a QCoreApplication with a GLib event dispatcher exists and
+    "thread" otherwise. The two cannot be combined: the default context can only be owned
+    by one thread, and a second loop would stall the Qt dispatcher.
+    """
+
+    def __init__(self, mode="auto", log=None):
+        """Initialize the dispatcher without starting it.
+
+        Args:
+            mode: "auto", "qt" or "thread".
+            log: Logger instance.
+        """
+        if mode not in ("auto", "qt", "thread"):
+            raise ValueError(f"Unknown D-Bus dispatch mode: {mode}")
+        self.requested_mode = mode
+        self.mode = None
+        self.log = log
+        self.loop = None
+        self.thread = None
+        self.thread_ident = None
+
+    @staticmethod
+    def qt_dispatches_glib():
+        """Check whether a Qt application exists whose event dispatcher iterates the default GLib context."""
+        try:
+            from PyQt6.QtCore import QAbstractEventDispatcher
+            from PyQt6.QtCore import QCoreApplication
+        except ImportError:
+            return False
+        application = QCoreApplication.instance()
+        if application is None:
+            return False
+        dispatcher = QAbstractEventDispatcher.instance(application.thread())
+        return dispatcher is not None and "Glib" in dispatcher.metaObject().className()
+
+    def start(self):
+        """Install the GLib main loop integration of dbus-python and start dispatching.
+
+        Must be called before the first bus connection is opened, since dbus-python binds
+        a connection to the default main loop at creation time.
+        """
+        if self.mode is not None:
+            return
+        dbus.mainloop.glib.threads_init()
+        dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+        mode = self.requested_mode
+        if mode == "auto":
+            mode = "qt" if self.qt_dispatches_glib() else "thread"
+        if mode == "qt":
+            if not self.qt_dispatches_glib():
+                raise RuntimeError("Qt event dispatcher does not iterate the GLib main context")
+            self.thread_ident = threading.get_ident()
+        else:
+            ready = threading.Event()
+            self.loop = GLib.MainLoop()
+            self.thread = threading.Thread(target=self._run, args=(ready,), name="dbus-dispatch", daemon=True)
+            self.thread.start()
+            ready.wait()
+        self.mode = mode
+        if self.log:
+            self.log.info("D-Bus dispatch running in %s mode", mode)
+
+    def stop(self):
+        """Stop the dispatch thread; in Qt mode dispatching ends with the Qt event loop."""
+        if self.loop is not None:
+            self.loop.quit()
+            self.thread.join()
+            self.loop = None
+            self.thread = None
+        self.mode = None
+
+    def is_dispatch_thread(self):
+        """True when called from the thread D-Bus handlers run on."""
+        return threading.get_ident() == self.thread_ident
+
+    def call_soon(self, callback, *args):
+        """Run callback(*args) once on the dispatch thread."""
+        def invoke():
+            callback(*args)
+            return False
+
+        GLib.idle_add(invoke)
+
+    def call_later(self, seconds, callback, *args):
+        """Run callback(*args) once on the dispatch thread after a delay.
+
+        Returns:
+            GLib source id, to pass to GLib.source_remove to cancel the call.
+        """
+        def invoke():
+            callback(*args)
+            return False
+
+        return GLib.timeout_add(max(0, int(seconds * 1000)), invoke)
+
+    def _run(self, ready):
+        """Dispatch thread body."""
+        self.thread_ident = threading.get_ident()
+        GLib.idle_add(lambda: ready.set() or False)
+        self.loop.run()
+
+
+def start_dispatcher(mode="auto", log=None):
+    """Start the process-wide D-Bus dispatcher, or return the one already running.
+
+    Args:
+        mode: "auto", "qt" or "thread"; ignored when a dispatcher is already running.
+        log: Logger instance.
+
+    Returns:
+        The running DBusDispatcher.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = DBusDispatcher(mode, log)
+        _dispatcher.start()
+        return _dispatcher
+
+
+def get_dispatcher():
+    """Return the process-wide DBusDispatcher, or None if it was never started."""
+    return _dispatcher
+
+
+def is_dispatch_thread():
+    """True when called from the thread the running dispatcher delivers D-Bus handlers on.
+
+    Only that thread may iterate the default GLib main context; any other thread that
+    iterated it would steal D-Bus replies, Agent1 calls and (in "qt" mode) Qt's own GLib
+    sources from their owner.
+    """
+    dispatcher = _dispatcher
+    return dispatcher is not None and dispatcher.is_dispatch_thread()
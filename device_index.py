@@ -0,0 +1,327 @@
+import threading
+import time
+
+import dbus
+from gi.repository import GLib
+
+from libraries.bluetooth import constants
+from libraries.bluetooth.dbus_dispatch import is_dispatch_thread
+
+
+class DeviceIndex:
+    """In-memory view of the BlueZ object tree kept current through ObjectManager signals.
+
+    The index is seeded with a single GetManagedObjects() call and afterwards only
+    follows InterfacesAdded, InterfacesRemoved and PropertiesChanged, so lookups by
+    object path or by (adapter, address) are plain dictionary hits without bus traffic.
+    """
+
+    def __init__(self, bus, log=None):
+        """Seed the index and subscribe to BlueZ object signals.
+
+        Args:
+            bus: D-Bus system bus connection.
+            log: Logger instance.
+        """
+        self.bus = bus
+        self.log = log
+        self.lock = threading.RLock()
+        self.condition = threading.Condition(self.lock)
+        self.objects = {}
+        self.addresses = {}
+        self.listeners = []
+        self.signal_matches = []
+        self.seeding = False
+        self.pending_signals = []
+        self.replay_thread = None
+        self.object_manager = dbus.Interface(self.bus.get_object(constants.bluez_service, "/"), constants.object_manager_interface)
+        self.subscribe()
+        self.seed()
+
+    def seed(self):
+        """Rebuild the index from a full GetManagedObjects() snapshot.
+
+        Signals delivered while the snapshot is fetched (the dispatch thread keeps running
+        in thread mode) are buffered and replayed in order on top of it, so an update that
+        raced the call is never overwritten by the older snapshot.
+        """
+        with self.lock:
+            self.seeding = True
+            self.pending_signals = []
+        managed_objects = {}
+        try:
+            managed_objects = self.object_manager.GetManagedObjects()
+            with self.lock:
+                self.objects = {}
+                self.addresses = {}
+                for path, interfaces in managed_objects.items():
+                    self._add_interfaces(str(path), interfaces)
+        finally:
+            self._replay_pending_signals()
+        if self.log:
+            self.log.debug("Device index seeded with %d objects", len(managed_objects))
+
+    def subscribe(self):
+        """Register the ObjectManager and PropertiesChanged signal receivers."""
+        self.signal_matches = [
+            self.bus.add_signal_receiver(
+                self.interfaces_added,
+                dbus_interface=constants.object_manager_interface,
+                signal_name="InterfacesAdded",
+                bus_name=constants.bluez_service),
+            self.bus.add_signal_receiver(
+                self.interfaces_removed,
+                dbus_interface=constants.object_manager_interface,
+                signal_name="InterfacesRemoved",
+                bus_name=constants.bluez_service),
+            self.bus.add_signal_receiver(
+                self.properties_changed,
+                dbus_interface=constants.properties_interface,
+                signal_name="PropertiesChanged",
+                bus_name=constants.bluez_service,
+                path_keyword="path")]
+
+    def close(self):
+        """Remove the signal receivers and drop all cached objects."""
+        for match in self.signal_matches:
+            match.remove()
+        self.signal_matches = []
+        with self.lock:
+            self.objects = {}
+            self.addresses = {}
+            self.listeners = []
+
+    def add_listener(self, callback):
+        """Register a callback invoked after every index update.
+
+        Args:
+            callback: Callable taking (event, path, interface, properties) where event is
+                "added", "removed" or "changed". properties holds the new values for "added",
+                the changed values for "changed" and the last known values for "removed".
+        """
+        with self.lock:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregister a callback previously passed to add_listener."""
+        with self.lock:
+            if callback in self.listeners:
+                self.listeners.remove(callback)
+
+    def interfaces_added(self, path, interfaces):
+        """Handle the ObjectManager InterfacesAdded signal.
+
+        Args:
+            path: D-Bus object path of the new object.
+            interfaces: Dictionary of interface names to their properties.
+        """
+        if self._defer(self.interfaces_added, path, interfaces):
+            return
+        path = str(path)
+        with self.lock:
+            self._add_interfaces(path, interfaces)
+        for interface, properties in interfaces.items():
+            self._notify("added", path, str(interface), dict(properties))
+
+    def interfaces_removed(self, path, interfaces):
+        """Handle the ObjectManager InterfacesRemoved signal.
+
+        Args:
+            path: D-Bus object path of the object.
+            interfaces: List of interface names that were removed.
+        """
+        if self._defer(self.interfaces_removed, path, interfaces):
+            return
+        path = str(path)
+        removed = {}
+        with self.lock:
+            entry = self.objects.get(path, {})
+            for interface in interfaces:
+                properties = entry.pop(str(interface), None)
+                removed[str(interface)] = properties or {}
+                if str(interface) == constants.device_interface and properties:
+                    self.addresses.pop((str(properties.get("Adapter")), str(properties.get("Address"))), None)
+            if not entry:
+                self.objects.pop(path, None)
+        for interface, properties in removed.items():
+            self._notify("removed", path, interface, properties)
+
+    def properties_changed(self, interface, changed, invalidated, path=None):
+        """Handle the PropertiesChanged signal for any BlueZ object.
+
+        Args:
+            interface: Interface whose properties changed.
+            changed: Dictionary of changed properties and their new values.
+            invalidated: List of properties that are no longer valid.
+            path: D-Bus object path of the object.
+        """
+        if self._defer(self.properties_changed, interface, changed, invalidated, path):
+            return
+        path = str(path)
+        interface = str(interface)
+        with self.lock:
+            properties = self.objects.get(path, {}).get(interface)
+            if properties is None:
+                return
+            properties.update(changed)
+            for name in invalidated:
+                properties.pop(name, None)
+        self._notify("changed", path, interface, dict(changed))
+
+    def get_properties(self, path, interface=constants.device_interface):
+        """Return a copy of the cached properties of an object interface.
+
+        Args:
+            path: D-Bus object path.
+            interface: Interface name.
+
+        Returns:
+            Dictionary of properties, or None if the object or interface is unknown.
+        """
+        with self.lock:
+            properties = self.objects.get(path, {}).get(interface)
+            return dict(properties) if properties is not None else None
+
+    def has_interface(self, path, interface):
+        """Check whether an object currently exports the given interface."""
+        with self.lock:
+            return interface in self.objects.get(path, {})
+
+    def find_device_path(self, adapter_path, address):
+        """Look up a device object path by adapter and Bluetooth address.
+
+        Args:
+            adapter_path: D-Bus object path of the adapter.
+            address: Bluetooth address of remote device.
+
+        Returns:
+            path: D-Bus object path, or None if unknown.
+        """
+        with self.lock:
+            return self.addresses.get((adapter_path, address))
+
+    def get_devices(self, adapter_path):
+        """Return the cached Device1 properties of every device under an adapter.
+
+        Args:
+            adapter_path: D-Bus object path of the adapter.
+
+        Returns:
+            Dictionary of device object paths to property copies.
+        """
+        with self.lock:
+            return {path: dict(self.objects[path][constants.device_interface])
+                    for (adapter, _), path in self.addresses.items() if adapter == adapter_path}
+
+    def get_objects(self, interface, path_prefix=""):
+        """Return the cached properties of every object exporting an interface.
+
+        Args:
+            interface: Interface name, e.g. org.bluez.MediaTransport1.
+            path_prefix: Only objects whose path starts with this prefix are returned.
+
+        Returns:
+            Dictionary of object paths to property copies.
+        """
+        with self.lock:
+            return {path: dict(interfaces[interface]) for path, interfaces in self.objects.items()
+                    if interface in interfaces and path.startswith(path_prefix)}
+
+    def get_adapter_paths(self):
+        """Return the object paths of every adapter exporting org.bluez.Adapter1."""
+        with self.lock:
+            return sorted(path for path, interfaces in self.objects.items() if constants.adapter_interface in interfaces)
+
+    def wait_for(self, path, predicate, timeout, interface=constants.device_interface):
+        """Block until the cached properties of an object satisfy a predicate.
+
+        On the D-Bus dispatch thread the default GLib main context is iterated here so
+        signals keep arriving while waiting; any other thread sleeps on a condition woken by
+        every index update and never touches the context.
+
+        Args:
+            path: D-Bus object path.
+            predicate: Callable receiving the property dictionary, or None once the object
+                or interface is gone, and returning True when the wait is over.
+            timeout: Maximum number of seconds to wait.
+            interface: Interface whose properties are passed to the predicate.
+
+        Returns:
+            True if the predicate was satisfied, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        dispatching = is_dispatch_thread()
+        context = GLib.MainContext.default()
+        while True:
+            if predicate(self.get_properties(path, interface)):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if dispatching:
+                self._iterate(context, min(remaining, 0.05))
+            else:
+                with self.condition:
+                    self.condition.wait(min(remaining, 0.05))
+
+    def wake_waiters(self):
+        """Wake threads blocked in wait_for so they re-evaluate their predicates."""
+        with self.condition:
+            self.condition.notify_all()
+
+    @staticmethod
+    def _iterate(context, seconds):
+        """Dispatch pending events of a GLib context, blocking for at most the given seconds."""
+        fired = []
+        source_id = GLib.timeout_add(max(1, int(seconds * 1000)), lambda: fired.append(True) or False)
+        context.iteration(True)
+        if not fired:
+            GLib.source_remove(source_id)
+
+    def _defer(self, handler, *args):
+        """Buffer a signal that arrived while seeding, returning True if it was buffered."""
+        with self.lock:
+            if not self.seeding or self.replay_thread == threading.get_ident():
+                return False
+            self.pending_signals.append((handler, args))
+            return True
+
+    def _replay_pending_signals(self):
+        """Apply the signals buffered during seeding in arrival order, then stop buffering.
+
+        Signals arriving on the dispatch thread during the replay are buffered as well and
+        applied by the same loop, so the index sees them in bus order.
+        """
+        self.replay_thread = threading.get_ident()
+        while True:
+            with self.condition:
+                pending = self.pending_signals
+                self.pending_signals = []
+                if not pending:
+                    self.seeding = False
+                    self.replay_thread = None
+                    self.condition.notify_all()
+                    return
+            for handler, args in pending:
+                handler(*args)
+
+    def _add_interfaces(self, path, interfaces):
+        """Merge interfaces and properties of an object into the index. Caller holds the lock."""
+        entry = self.objects.setdefault(path, {})
+        for interface, properties in interfaces.items():
+            entry.setdefault(str(interface), {}).update(properties)
+        device = entry.get(constants.device_interface)
+        if device and device.get("Address"):
+            self.addresses[(str(device.get("Adapter")), str(device.get("Address")))] = path
+
+    def _notify(self, event, path, interface, properties):
+        """Invoke the registered listeners, isolating their failures from the signal handler."""
+        with self.condition:
+            listeners = list(self.listeners)
+            self.condition.notify_all()
+        for callback in listeners:
+            try:
+                callback(event, path, interface, properties)
+            except Exception as error:
+                if self.log:
+                    self.log.warning("Device index listener failed: %s", error)
@@ -0,0 +1,238 @@
+from PyQt6.QtCore import QAbstractTableModel
+from PyQt6.QtCore import QEvent
+from PyQt6.QtCore import QModelIndex
+from PyQt6.QtCore import QRect
+from PyQt6.QtCore import QSortFilterProxyModel
+from PyQt6.QtCore import Qt
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QStyle
+from PyQt6.QtWidgets import QStyleOptionButton
+from PyQt6.QtWidgets import QStyledItemDelegate
+
+NAME_COLUMN = 0
+ADDRESS_COLUMN = 1
+RSSI_COLUMN = 2
+PROCEDURES_COLUMN = 3
+SORT_ROLE = Qt.ItemDataRole.UserRole
+ADDRESS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class DiscoveryTableModel(QAbstractTableModel):
+    """Table model of discovered devices supporting incremental inserts, updates and removals."""
+
+    headers = ["DEVICE NAME", "BD_ADDR", "RSSI", "PROCEDURES"]
+
+    def __init__(self, parent=None):
+        """Initialize an empty model.
+
+        Args:
+            parent: Parent QObject.
+        """
+        super().__init__(parent)
+        self.devices = []
+        self.rows = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.devices)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        device = self.devices[index.row()]
+        column = index.column()
+        if role == ADDRESS_ROLE:
+            return device["address"]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == NAME_COLUMN:
+                return device["alias"]
+            if column == ADDRESS_COLUMN:
+                return device["address"]
+            if column == RSSI_COLUMN:
+                return "" if device["rssi"] is None else str(device["rssi"])
+        if role == SORT_ROLE:
+            if column == RSSI_COLUMN:
+                return -1000 if device["rssi"] is None else device["rssi"]
+            if column == NAME_COLUMN:
+                return (device["alias"] or "").lower()
+            return device["address"]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() == PROCEDURES_COLUMN:
+            flags &= ~Qt.ItemFlag.ItemIsSelectable
+        return flags
+
+    def set_devices(self, devices):
+        """Replace the model contents with a snapshot of discovered devices.
+
+        Args:
+            devices: List of discovered device dictionaries (address, alias, rssi).
+        """
+        self.beginResetModel()
+        self.devices = [dict(device) for device in devices]
+        self.rows = {device["address"]: row for row, device in enumerate(self.devices)}
+        self.endResetModel()
+
+    def upsert_device(self, device):
+        """Insert a newly discovered device or update the row of a known one.
+
+        Args:
+            device: Discovered device dictionary (address, alias, rssi).
+        """
+        row = self.rows.get(device["address"])
+        if row is None:
+            row = len(self.devices)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.devices.append(dict(device))
+            self.rows[device["address"]] = row
+            self.endInsertRows()
+            return
+        if self.devices[row] != device:
+            self.devices[row].update(device)
+            self.dataChanged.emit(self.index(row, NAME_COLUMN), self.index(row, RSSI_COLUMN))
+
+    def apply_updates(self, updates):
+        """Apply a coalesced batch of discovery results with one insert and one change notification.
+
+        Args:
+            updates: List of (event, device) tuples where event is "added", "changed" or "removed".
+        """
+        # Fold the batch into the final state of each address, then apply removals before
+        # collecting changed rows so the rows stay valid for the dataChanged range.
+        final = {}
+        for event, device in updates:
+            address = device["address"]
+            if event == "removed":
+                final[address] = None
+            elif final.get(address):
+                final[address].update(device)
+            else:
+                final[address] = dict(device)
+        for address, device in final.items():
+            if device is None:
+                self.remove_device(address)
+        new_devices = []
+        changed_rows = []
+        for address, device in final.items():
+            if device is None:
+                continue
+            row = self.rows.get(address)
+            if row is None:
+                new_devices.append(device)
+            elif self.devices[row] != device:
+                self.devices[row].update(device)
+                changed_rows.append(row)
+        if changed_rows:
+            self.dataChanged.emit(self.index(min(changed_rows), NAME_COLUMN), self.index(max(changed_rows), RSSI_COLUMN))
+        if new_devices:
+            first_row = len(self.devices)
+            self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_devices) - 1)
+            for row, device in enumerate(new_devices, first_row):
+                self.devices.append(device)
+                self.rows[device["address"]] = row
+            self.endInsertRows()
+
+    def refresh_actions(self, address):
+        """Repaint the action buttons of a device, e.g. after its busy state changed.
+
+        Args:
+            address: Bluetooth address of the device.
+        """
+        row = self.rows.get(address)
+        if row is not None:
+            index = self.index(row, PROCEDURES_COLUMN)
+            self.dataChanged.emit(index, index)
+
+    def remove_device(self, address):
+        """Remove the row of a device that disappeared from BlueZ.
+
+        Args:
+            address: Bluetooth address of the device.
+        """
+        row = self.rows.get(address)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.devices[row]
+        self.rows = {device["address"]: index for index, device in enumerate(self.devices)}
+        self.endRemoveRows()
+
+
+class DiscoveryFilterProxyModel(QSortFilterProxyModel):
+    """Sorts discovered devices by name, address or RSSI and filters them by name or address."""
+
+    def __init__(self, parent=None):
+        """Initialize the proxy with case-insensitive filtering over all columns.
+
+        Args:
+            parent: Parent QObject.
+        """
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setFilterKeyColumn(-1)
+        self.setDynamicSortFilter(True)
+
+
+class DeviceActionDelegate(QStyledItemDelegate):
+    """Paints PAIR and CONNECT buttons in the procedures column without per-row widgets.
+
+    The buttons of a device are drawn disabled and ignore clicks while an action on it runs.
+    """
+
+    action_requested = pyqtSignal(str, str)
+    actions = [("PAIR", "pair"), ("CONNECT", "connect")]
+
+    def __init__(self, parent=None, is_busy=None):
+        """Initialize the delegate.
+
+        Args:
+            parent: Parent QObject.
+            is_busy: Callable receiving a device address and returning True while an action
+                on that device is queued or running.
+        """
+        super().__init__(parent)
+        self.is_busy = is_busy or (lambda address: False)
+
+    def _button_rects(self, rect):
+        """Split a cell rectangle into one rectangle per action button."""
+        spacing = 5
+        width = (rect.width() - spacing * (len(self.actions) - 1)) // len(self.actions)
+        return [QRect(rect.x() + position * (width + spacing), rect.y() + 2, width, rect.height() - 4)
+                for position in range(len(self.actions))]
+
+    def paint(self, painter, option, index):
+        if index.column() != PROCEDURES_COLUMN:
+            super().paint(painter, option, index)
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        state = QStyle.StateFlag.State_Raised
+        if not self.is_busy(index.data(ADDRESS_ROLE)):
+            state |= QStyle.StateFlag.State_Enabled
+        for rect, (text, _) in zip(self._button_rects(option.rect), self.actions):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = text
+            button.state = state
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if index.column() == PROCEDURES_COLUMN and event.type() == QEvent.Type.MouseButtonRelease:
+            if self.is_busy(index.data(ADDRESS_ROLE)):
+                return True
+            position = event.position().toPoint()
+            for rect, (_, action) in zip(self._button_rects(option.rect), self.actions):
+                if rect.contains(position):
+                    self.action_requested.emit(action, index.data(ADDRESS_ROLE))
+                    return True
+        return super().editorEvent(event, model, option, index)
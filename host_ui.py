@@ -1,14 +1,13 @@
 import os
 import re
-import time
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QIntValidator
 from PyQt6.QtWidgets import QComboBox, QInputDialog
-from PyQt6.QtWidgets import QFileDialog
 from PyQt6.QtWidgets import QGridLayout
-from PyQt6.QtWidgets import QGroupBox
 from PyQt6.QtWidgets import QHeaderView
 from PyQt6.QtWidgets import QHBoxLayout
 from PyQt6.QtWidgets import QLabel
@@ -20,31 +19,48 @@ from PyQt6.QtWidgets import QMessageBox
 from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtWidgets import QSizePolicy
 from PyQt6.QtWidgets import QTabWidget
-from PyQt6.QtWidgets import QTableWidget
-from PyQt6.QtWidgets import QTableWidgetItem
+from PyQt6.QtWidgets import QTableView
 from PyQt6.QtWidgets import QVBoxLayout
 from PyQt6.QtWidgets import QWidget
 
 import style_sheet as styles
+from discovery_model import DeviceActionDelegate
+from discovery_model import DiscoveryFilterProxyModel
+from discovery_model import DiscoveryTableModel
+from discovery_model import PROCEDURES_COLUMN
+from discovery_model import RSSI_COLUMN
 from libraries.bluetooth.bluez import BluetoothDeviceManager
+from profile_panels import PROFILE_PANELS
+from profile_panels import ProfilePanelCache
+from ui_workers import UiExecutor
 from Utils.utils import get_controller_interface_details
 from Utils.utils import validate_bluetooth_address
 
-import queue
 import threading
-from PyQt6.QtCore import QTimer
+from collections import deque
 
 
 class TestApplication(QWidget):
     """Main GUI class for the Bluetooth Test Host."""
 
-    def __init__(self, interface=None, back_callback=None, log=None):
+    discovery_batch = pyqtSignal(list)
+    pairing_requests_pending = pyqtSignal()
+    controller_details_loaded = pyqtSignal(dict)
+    device_state_changed = pyqtSignal(str)
+    controller_details_cache = {}
+    controller_detail_fields = [("Name", "Controller Name"), ("BD_ADDR", "Controller Address"),
+                                ("Link mode", "Link Mode"), ("Link policy", "Link Policy"),
+                                ("HCI Version", "HCI Version"), ("LMP Version", "LMP Version"),
+                                ("Manufacturer", "Manufacturer")]
+
+    def __init__(self, interface=None, back_callback=None, log=None, bluetooth_device_manager=None):
         """Initialize the Test Host widget.
 
         Args:
             interface: Bluetooth adapter interface (e.g., hci0).
             back_callback: Optional callback to trigger on back action.
             log: Logger instance.
+            bluetooth_device_manager: Manager of the adapter, e.g. from a shared MultiAdapterManager.
         """
         super().__init__()
         self.back_callback = back_callback
@@ -52,15 +68,27 @@ class TestApplication(QWidget):
         self.log_path = log.log_path
         self.log = log
 
-        # ---- NEW: Pairing queue and timer for UI-safe handling ----
-        self._pairing_queue = queue.Queue()
-        self._pairing_timer = QTimer(self)
-        self._pairing_timer.setInterval(100)  # check every 100 ms
-        self._pairing_timer.timeout.connect(self._process_pairing_queue)
-        self._pairing_timer.start()
-        # -----------------------------------------------------------
-
-        self.bluetooth_device_manager = BluetoothDeviceManager(log=self.log, interface=self.interface)
+        # Agent requests are handed to the GUI event loop through an explicitly queued signal,
+        # so dialogs never open inside the D-Bus method handler, even when (in "qt" dispatch
+        # mode) that handler already runs on the GUI thread. One emission drains every request.
+        self._pairing_queue = deque()
+        self._pairing_lock = threading.Lock()
+        self._pairing_drain_scheduled = False
+        self.pairing_requests_pending.connect(self._process_pairing_queue, Qt.ConnectionType.QueuedConnection)
+        # Profile panels are built on first use and cached per device and tab; they are
+        # rebuilt only when the device's Connected or UUIDs property changes.
+        self.profile_panels = ProfilePanelCache(self)
+        self.device_address = None
+        self.device_view_state = None
+        self.device_state_changed.connect(self.handle_device_state_change)
+        self.controller_detail_labels = {}
+        self.controller_details_loaded.connect(self.update_controller_details)
+        # Blocking manager calls run on a worker pool, serialized per device; their results
+        # come back to the GUI thread through the executor's signal.
+        self.executor = UiExecutor(self, log=self.log)
+        self.destroyed.connect(lambda: self.executor.wait_for_done(1000))
+
+        self.bluetooth_device_manager = bluetooth_device_manager or BluetoothDeviceManager(log=self.log, interface=self.interface)
         self.paired_devices={}
         self.device_tab_widget = None
         self.gap_button = None
@@ -70,72 +98,109 @@ class TestApplication(QWidget):
         self.profile_methods_widget = None
         self.profiles_list_widget = None
         self.refresh_button = None
+        self.discovery_widget = None
+        self.discovery_listener = None
+        self.discovery_model = DiscoveryTableModel(self)
+        self.discovery_proxy_model = DiscoveryFilterProxyModel(self)
+        self.discovery_proxy_model.setSourceModel(self.discovery_model)
+        self.discovery_delegate = DeviceActionDelegate(self, is_busy=self.executor.is_busy)
+        self.discovery_delegate.action_requested.connect(self.handle_discovery_action)
+        self.executor.job_finished.connect(lambda job, result, error: self.discovery_model.refresh_actions(job.key))
+        self.discovery_batch.connect(self.discovery_model.apply_updates)
         self.initialize_host_ui()
 
-    def pairing_ui_callback(self, request_type, device, uuid=None):
-        # just queue and return immediately
-        self.log.info("[DEBUG] Queuing pairing request: %s %s %s", request_type, device, uuid)
-        req = {'type': request_type, 'device': device, 'uuid': uuid}
-        self._pairing_queue.put(req)
-        return  # never waits
+    def pairing_ui_callback(self, request):
+        """Queue an agent request for the GUI thread and return immediately.
+
+        Safe to call from any thread; the GUI is woken once per burst of requests.
+
+        Args:
+            request: AgentRequest to answer through reply() or reject().
+        """
+        self.log.info("Queuing pairing request: %s %s %s", request.type, request.device, request.value)
+        with self._pairing_lock:
+            self._pairing_queue.append(request)
+            schedule_drain = not self._pairing_drain_scheduled
+            self._pairing_drain_scheduled = True
+        if schedule_drain:
+            self.pairing_requests_pending.emit()
 
     def _process_pairing_queue(self):
-        try:
-            req = self._pairing_queue.get_nowait()
-        except queue.Empty:
-            return
+        """Handle every queued agent request in one pass on the GUI thread.
 
-        request_type = req['type']
-        device = req['device']
-        uuid = req['uuid']
-        device_address = device.split("dev_")[-1].replace("_", ":")
+        The drain stays scheduled until the queue is empty, so a request arriving while a
+        modal dialog is open is handled after it instead of opening a nested dialog.
+        """
+        while True:
+            with self._pairing_lock:
+                if not self._pairing_queue:
+                    self._pairing_drain_scheduled = False
+                    return
+                req = self._pairing_queue.popleft()
+            if req.is_pending:
+                self._process_pairing_request(req)
+            else:
+                self.log.info("Skipping %s request for %s, it was %s", req.type, req.address, req.state)
+
+    def _process_pairing_request(self, req):
+        """Prompt the user for a single agent request and send the answer to BlueZ.
+
+        Args:
+            req: AgentRequest to answer.
+        """
+        request_type = req.type
+        uuid = req.value
+        device_address = req.address
 
         if request_type == "pin":
             pin, ok = QInputDialog.getText(self, "Pairing Request",
                                            f"Enter PIN for device {device_address}:")
-            req['resp'] = pin if ok and pin else None
+            if ok and pin:
+                req.reply(pin)
+            else:
+                req.reject()
 
         elif request_type == "passkey":
             passkey, ok = QInputDialog.getInt(self, "Pairing Request",
-                                              f"Enter passkey for device {device_address}:")
-            req['resp'] = int(passkey) if ok else None
-            if req['resp'] is not None:
+                                              f"Enter passkey for device {device_address}:", 0, 0, 999999)
+            if ok:
+                req.reply(passkey)
                 self.add_paired_device_to_list(device_address)
+            else:
+                req.reject()
 
         elif request_type == "confirm":
             reply = QMessageBox.question(self, "Confirm Pairing",
                                          f"Device {device_address} requests to pair "
-                                         f"with passkey: {uuid}\nAccept?",
+                                         f"with passkey: {uuid:06d}\nAccept?",
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.Yes:
+                req.reply()
                 self.add_paired_device_to_list(device_address)
-                req['resp'] = True
             else:
-                req['resp'] = None
+                req.reject()
 
         elif request_type == "authorize":
             reply = QMessageBox.question(self, "Authorize Service",
                                          f"Device {device_address} wants to use service {uuid}\nAllow?",
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-            req['resp'] = True if reply == QMessageBox.StandardButton.Yes else None
-            if req['resp'] is None:
-                self.bluetooth_device_manager.disconnect(device_address)
+            if reply == QMessageBox.StandardButton.Yes:
+                req.reply()
+            else:
+                req.reject()
 
         elif request_type == "display_pin":
+            req.reply()
             QMessageBox.information(self, "Display PIN",
                                     f"Enter this PIN on {device_address}: {uuid}")
-            req['resp'] = None
 
         elif request_type == "display_passkey":
+            req.reply()
             QMessageBox.information(self, "Display Passkey",
                                     f"Enter this passkey on {device_address}: {uuid}")
-            req['resp'] = None
 
         else:
-            req['resp'] = None
-
-        # Signal back to waiting DBus thread
-        req['event'].set()
+            req.reject("Unsupported request")
 
     def load_paired_devices(self):
         """Loads and displays all paired Bluetooth devices into the profiles list widget."""
@@ -156,6 +221,9 @@ class TestApplication(QWidget):
             row: The row index in the grid layout where this entry should be placed.
             label: The text label to describe the data.
             value: The corresponding value to display alongside the label.
+
+        Returns:
+            The QLabel showing the value.
         """
         label_widget = QLabel(label)
         label_widget.setFont(QFont("Arial", 10, QFont.Weight.Bold))
@@ -167,6 +235,31 @@ class TestApplication(QWidget):
         value_widget.setStyleSheet(styles.color_style_sheet)
         self.grid.addWidget(label_widget, row, 0)
         self.grid.addWidget(value_widget, row, 1)
+        return value_widget
+
+    def load_extended_controller_details(self):
+        """Read the HCI/LMP details with the external controller tool; runs on a worker thread."""
+        try:
+            details = get_controller_interface_details(self.log, interface=self.interface, detail_level='extended_info')
+        except Exception as error:
+            self.log.warning("Failed to read controller details of %s: %s", self.interface, error)
+            details = {}
+        details = {key: value for key, value in details.items() if key not in ("Name", "BD_ADDR")}
+        TestApplication.controller_details_cache[self.interface] = details
+        try:
+            self.controller_details_loaded.emit(details)
+        except RuntimeError:
+            pass
+
+    def update_controller_details(self, details):
+        """Fill in controller detail rows as values become available.
+
+        Args:
+            details: Dictionary of detail names to values; missing entries keep their current value.
+        """
+        for key, value_widget in self.controller_detail_labels.items():
+            if key in details:
+                value_widget.setText(str(details[key]))
 
     def set_discoverable_mode(self, enable):
         """Enable or disable discoverable mode on the Bluetooth adapter.
@@ -194,105 +287,101 @@ class TestApplication(QWidget):
             self.log.info("Discoverable mode is set to OFF")
 
     def start_device_discovery(self):
-        """Start device discovery."""
+        """Start device discovery and stream results into the discovery table."""
         self.inquiry_timeout = int(self.inquiry_timeout_input.text()) * 1000
-        if self.inquiry_timeout == 0:
-            self.set_discovery_on_button.setEnabled(False)
-            self.set_discovery_off_button.setEnabled(True)
-            self.bluetooth_device_manager.start_discovery()
-        else:
+        transport = self.discovery_transport_combobox.currentText()
+        rssi_text = self.discovery_rssi_input.text().strip()
+        try:
+            rssi = int(rssi_text) if rssi_text else None
+        except ValueError:
+            QMessageBox.warning(self, "Invalid RSSI", "Min RSSI must be a number of dBm between -127 and 20.")
+            return
+        if self.inquiry_timeout != 0:
             self.timer = QTimer()
+            self.timer.setSingleShot(True)
             self.timer.timeout.connect(self.handle_discovery_timeout)
-            self.timer.timeout.connect(lambda:self.set_discovery_off_button.setEnabled(False))
             self.timer.start(self.inquiry_timeout)
-            self.set_discovery_on_button.setEnabled(False)
-            self.set_discovery_off_button.setEnabled(True)
-            self.bluetooth_device_manager.start_discovery()
+        self.set_discovery_on_button.setEnabled(False)
+        self.set_discovery_off_button.setEnabled(True)
+        self.display_discovered_devices()
+        if not self.discovery_listener:
+            self.discovery_listener = self.bluetooth_device_manager.add_coalesced_discovery_listener(self.discovery_batch.emit)
+        self.bluetooth_device_manager.start_discovery(transport=transport, rssi=rssi, duplicate_data=True)
         self.log.info("Device discovery has started")
 
     def handle_discovery_timeout(self):
         """Handles the Bluetooth discovery timeout event"""
-        self.timer.stop()
-        self.bluetooth_device_manager.stop_discovery()
+        self.finish_device_discovery()
         self.log.info("Discovery stopped due to timeout.")
-        self.display_discovered_devices()
 
     def stop_device_discovery(self):
         """Stops device Discovery"""
+        self.finish_device_discovery()
+        self.log.info("Device discovery has stopped")
+
+    def finish_device_discovery(self):
+        """Stop discovery, the inquiry timer and the streaming of discovery results."""
+        self.release_discovery_listener()
+        self.bluetooth_device_manager.stop_discovery()
+        self.set_discovery_on_button.setEnabled(True)
         self.set_discovery_off_button.setEnabled(False)
-        self.timer = QTimer()
-        if self.inquiry_timeout == 0:
-            self.bluetooth_device_manager.stop_discovery()
-            self.display_discovered_devices()
-        else:
+
+    def release_discovery_listener(self):
+        """Stop the inquiry timer and detach the streaming discovery listener, if any."""
+        if hasattr(self, 'timer') and self.timer:
             self.timer.stop()
-            self.bluetooth_device_manager.stop_discovery()
-            self.display_discovered_devices()
-            self.set_discovery_off_button.setEnabled(False)
-        self.log.info("Device discovery has stopped")
+        if self.discovery_listener:
+            self.log.info("Discovery signal counters: %s",
+                          self.bluetooth_device_manager.get_discovery_counters(self.discovery_listener))
+            self.bluetooth_device_manager.remove_discovery_listener(self.discovery_listener)
+            self.discovery_listener = None
 
     def display_discovered_devices(self):
-        """Display discovered devices in a table with options to pair or connect."""
-        self.timer.stop()
+        """Display discovered devices in a sortable, filterable table with options to pair or connect."""
         bold_font = QFont()
         bold_font.setBold(True)
-        small_font = QFont()
-        small_font.setBold(True)
-        small_font.setPointSize(8)
-        discovered_devices = self.bluetooth_device_manager.get_discovered_devices()
+        self.discovery_model.set_devices(self.bluetooth_device_manager.get_discovered_devices())
         self.clear_device_discovery_results()
-        self.table_widget = QTableWidget(0, 3)
-        self.table_widget.setHorizontalHeaderLabels(["DEVICE NAME", "BD_ADDR", "PROCEDURES"])
-        self.table_widget.setFont(bold_font)
-        header = self.table_widget.horizontalHeader()
+        self.discovery_widget = QWidget()
+        discovery_layout = QVBoxLayout(self.discovery_widget)
+        discovery_layout.setContentsMargins(0, 0, 0, 0)
+        discovery_filter_input = QLineEdit()
+        discovery_filter_input.setPlaceholderText("Filter by name or address")
+        discovery_filter_input.textChanged.connect(self.discovery_proxy_model.setFilterFixedString)
+        discovery_layout.addWidget(discovery_filter_input)
+        table_view = QTableView()
+        table_view.setModel(self.discovery_proxy_model)
+        table_view.setItemDelegateForColumn(PROCEDURES_COLUMN, self.discovery_delegate)
+        table_view.setFont(bold_font)
+        table_view.setSortingEnabled(True)
+        table_view.sortByColumn(RSSI_COLUMN, Qt.SortOrder.DescendingOrder)
+        table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        table_view.setWordWrap(False)
+        header = table_view.horizontalHeader()
         header.setStyleSheet(styles.horizontal_header_style_sheet)
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        vertical_header = self.table_widget.verticalHeader()
+        vertical_header = table_view.verticalHeader()
         vertical_header.setStyleSheet(styles.vertical_header_style_sheet)
-        row = 0
-        for device in discovered_devices:
-            device_address = device["address"]
-            device_name = device["alias"]
-            device_path = device["path"]
-            self.table_widget.insertRow(row)
-            self.table_widget.setItem(row, 0, QTableWidgetItem(device_name))
-            self.table_widget.setItem(row, 1, QTableWidgetItem(device_address))
-            button_widget = QWidget()
-            button_layout = QHBoxLayout()
-            button_layout.setContentsMargins(0, 0, 0, 0)
-            button_layout.setSpacing(5)
-            pair_button = QPushButton("PAIR")
-            pair_button.setObjectName("PairButton")
-            pair_button.setFont(small_font)
-            pair_button.setStyleSheet(styles.color_style_sheet)
-            pair_button.clicked.connect(lambda _, addr = device_address: self.perform_device_action('pair', addr, load_profiles=False))
-            button_layout.addWidget(pair_button)
-            connect_button = QPushButton("CONNECT")
-            connect_button.setObjectName("ConnectButton")
-            connect_button.setFont(small_font)
-            connect_button.setStyleSheet(styles.color_style_sheet)
-            connect_button.clicked.connect(lambda _, addr = device_address: self.perform_device_action('connect', addr, load_profiles=False))
-            button_layout.addWidget(connect_button)
-            button_widget.setLayout(button_layout)
-            self.table_widget.setCellWidget(row, 2, button_widget)
-            row += 1
-        self.profile_methods_layout.insertWidget(self.profile_methods_layout.count() - 1, self.table_widget)
-        self.table_widget.show()
-        self.set_discovery_off_button.setEnabled(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(28)
+        discovery_layout.addWidget(table_view)
+        self.profile_methods_layout.insertWidget(self.profile_methods_layout.count() - 1, self.discovery_widget)
+        self.discovery_widget.show()
 
     def clear_device_discovery_results(self):
         """Removes the discovery table if it exists to avoid stacking."""
-        if hasattr(self, 'table_widget') and self.table_widget:
-            self.profile_methods_layout.removeWidget(self.table_widget)
-            self.table_widget.deleteLater()
-            self.table_widget = None
+        if self.discovery_widget:
+            self.profile_methods_layout.removeWidget(self.discovery_widget)
+            self.discovery_widget.deleteLater()
+            self.discovery_widget = None
 
     def refresh_discovery_ui(self):
         """Refresh and clear the device discovery table."""
-        if hasattr(self, 'table_widget') and self.table_widget:
-            self.profile_methods_layout.removeWidget(self.table_widget)
-            self.table_widget.deleteLater()
-            self.table_widget = None
+        if self.discovery_widget:
+            self.profile_methods_layout.removeWidget(self.discovery_widget)
+            self.discovery_widget.deleteLater()
+            self.discovery_widget = None
+            self.discovery_model.set_devices([])
             self.inquiry_timeout_input.setText("0")
             self.refresh_button.setEnabled(False)
             self.set_discovery_on_button.setEnabled(True)
@@ -340,15 +429,13 @@ class TestApplication(QWidget):
             selected_item_text = selected_item.text().strip()
         else:
             selected_item_text = profile_name.strip()
+        if self.discovery_listener:
+            self.release_discovery_listener()
+            self.bluetooth_device_manager.stop_discovery()
         self.clear_device_discovery_results()
+        self.device_address = None
+        self.release_device_tabs()
         self.clear_layout(self.profile_methods_layout)
-        if hasattr(self, 'device_tab_widget') and self.device_tab_widget:
-            self.device_tab_widget.currentChanged.disconnect(self.handle_profile_tab_change)
-            self.profile_methods_layout.removeWidget(self.device_tab_widget)
-            self.device_tab_widget.hide()
-            self.device_tab_widget.setParent(None)
-            self.device_tab_widget.deleteLater()
-            self.device_tab_widget = None
         QTimer.singleShot(0, lambda:(self.load_device_profile_tabs(selected_item_text)
         if validate_bluetooth_address(selected_item_text)else
         self.create_gap_profile_ui() if selected_item_text == "GAP"
@@ -404,6 +491,25 @@ class TestApplication(QWidget):
         inquiry_timeout_layout.addWidget(inquiry_timeout_label)
         inquiry_timeout_layout.addWidget(self.inquiry_timeout_input)
         self.profile_methods_layout.addLayout(inquiry_timeout_layout)
+        discovery_filter_layout = QHBoxLayout()
+        transport_label = QLabel("Transport:")
+        transport_label.setObjectName("TransportLabel")
+        transport_label.setFont(bold_font)
+        transport_label.setStyleSheet(styles.color_style_sheet)
+        self.discovery_transport_combobox = QComboBox()
+        self.discovery_transport_combobox.addItems(["auto", "bredr", "le"])
+        rssi_label = QLabel("Min RSSI:")
+        rssi_label.setObjectName("RssiLabel")
+        rssi_label.setFont(bold_font)
+        rssi_label.setStyleSheet(styles.color_style_sheet)
+        self.discovery_rssi_input = QLineEdit()
+        self.discovery_rssi_input.setPlaceholderText("dBm")
+        self.discovery_rssi_input.setValidator(QIntValidator(-127, 20, self.discovery_rssi_input))
+        discovery_filter_layout.addWidget(transport_label)
+        discovery_filter_layout.addWidget(self.discovery_transport_combobox)
+        discovery_filter_layout.addWidget(rssi_label)
+        discovery_filter_layout.addWidget(self.discovery_rssi_input)
+        self.profile_methods_layout.addLayout(discovery_filter_layout)
         discovery_buttons_layout = QHBoxLayout()
         self.set_discovery_on_button = QPushButton("START")
         self.set_discovery_on_button.setObjectName("SetDiscoveryOnButton")
@@ -423,20 +529,20 @@ class TestApplication(QWidget):
         self.capability_combobox.setFont(QFont("Arial", 10))
         self.capability_combobox.addItems(["DisplayOnly", "DisplayYesNo", "KeyboardOnly", "NoInputNoOutput", "KeyboardDisplay"])
         self.capability_combobox.setCurrentText("NoInputNoOutput")
-        register_agent_button = QPushButton("Register Agent")
-        register_agent_button.setObjectName("RegisterAgent")
-        register_agent_button.setFont(bold_font)
-        register_agent_button.setStyleSheet(styles.color_style_sheet)
-        register_agent_button.clicked.connect(self.register_bluetooth_agent)
+        self.register_agent_button = QPushButton("Register Agent")
+        self.register_agent_button.setObjectName("RegisterAgent")
+        self.register_agent_button.setFont(bold_font)
+        self.register_agent_button.setStyleSheet(styles.color_style_sheet)
+        self.register_agent_button.clicked.connect(self.register_bluetooth_agent)
         self.profile_methods_layout.addWidget(capability_label)
         self.profile_methods_layout.addWidget(self.capability_combobox)
-        self.profile_methods_layout.addWidget(register_agent_button)
-        unregister_agent_button = QPushButton("Unregister Agent")
-        unregister_agent_button.setObjectName("UnregisterAgent")
-        unregister_agent_button.setFont(bold_font)
-        unregister_agent_button.setStyleSheet(styles.color_style_sheet)
-        unregister_agent_button.clicked.connect(self.unregister_bluetooth_agent)
-        self.profile_methods_layout.addWidget(unregister_agent_button)
+        self.profile_methods_layout.addWidget(self.register_agent_button)
+        self.unregister_agent_button = QPushButton("Unregister Agent")
+        self.unregister_agent_button.setObjectName("UnregisterAgent")
+        self.unregister_agent_button.setFont(bold_font)
+        self.unregister_agent_button.setStyleSheet(styles.color_style_sheet)
+        self.unregister_agent_button.clicked.connect(self.unregister_bluetooth_agent)
+        self.profile_methods_layout.addWidget(self.unregister_agent_button)
         discovery_ui_refresh_button = QPushButton("REFRESH")
         discovery_ui_refresh_button.setObjectName("RefreshButton")
         discovery_ui_refresh_button.setStyleSheet(styles.color_style_sheet)
@@ -445,312 +551,85 @@ class TestApplication(QWidget):
         self.profile_methods_layout.addStretch(1)
 
     def unregister_bluetooth_agent(self):
-        """Unregister bluetooth pairing agent"""
+        """Unregister bluetooth pairing agent on a worker thread."""
         self.log.info("Attempting to unregister the Bluetooth agent...")
-        try:
-            self.bluetooth_device_manager.unregister_agent()
-            QMessageBox.information(self, "Agent Unregistered", "Bluetooth agent was successfully unregistered.")
-        except Exception as error:
+
+        def handle_error(error):
             self.log.error("Failed to unregister agent: %s", error)
             QMessageBox.critical(self, "Unregistration Failed", f"Could not unregister agent.")
 
-    def create_a2dp_profile_ui(self, device_address):
-        """Builds a single A2DP panel combining source streaming and sink media control, based on the device's A2DP roles."""
-        bold_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        layout = QVBoxLayout()
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(15)
-        a2dp_label = QLabel("<b>A2DP Functionality</b>")
-        a2dp_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        a2dp_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        layout.addWidget(a2dp_label)
-        is_connected = self.bluetooth_device_manager.is_device_connected(device_address)
-        if not is_connected:
-            warning_label = QLabel("Device is not connected. Connect to enable A2DP profile.")
-            warning_label.setObjectName("WarningLabel")
-            warning_label.setFont(bold_font)
-            warning_label.setStyleSheet(styles.color_style_sheet)
-            layout.addWidget(warning_label)
-            layout.addStretch(1)
-            widget = QWidget()
-            widget.setLayout(layout)
-            return widget
-        self.device_address_source = device_address
-        self.device_address_sink = device_address
-        role = self.bluetooth_device_manager.get_a2dp_role_for_device(device_address)
-        if role == "sink":
-            streaming_group = QGroupBox("Streaming Audio (A2DP Source)")
-            streaming_group.setStyleSheet(styles.bluetooth_profiles_groupbox_style)
-            streaming_layout = QVBoxLayout()
-            streaming_layout.setSpacing(10)
-            streaming_layout.setContentsMargins(10, 10, 10, 10)
-            audio_layout = QHBoxLayout()
-            audio_label = QLabel("Audio File:")
-            audio_label.setFont(bold_font)
-            audio_layout.addWidget(audio_label)
-            self.audio_location_input = QLineEdit()
-            self.audio_location_input.setReadOnly(True)
-            self.audio_location_input.setFixedHeight(28)
-            audio_layout.addWidget(self.audio_location_input)
-            self.browse_audio_button = QPushButton("Browse... ")
-            self.browse_audio_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.browse_audio_button.clicked.connect(self.select_audio_file)
-            audio_layout.addWidget(self.browse_audio_button)
-            streaming_layout.addLayout(audio_layout)
-            streaming_buttons_layout = QHBoxLayout()
-            streaming_buttons_layout.setSpacing(12)
-            self.start_streaming_button = QPushButton("Start Streaming")
-            self.start_streaming_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.start_streaming_button.clicked.connect(self.start_a2dp_streaming)
-            streaming_buttons_layout.addWidget(self.start_streaming_button)
-            self.stop_streaming_button = QPushButton("Stop Streaming")
-            self.stop_streaming_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.stop_streaming_button.clicked.connect(self.stop_a2dp_streaming)
-            self.stop_streaming_button.setEnabled(False)
-            streaming_buttons_layout.addWidget(self.stop_streaming_button)
-            streaming_layout.addLayout(streaming_buttons_layout)
-            streaming_group.setLayout(streaming_layout)
-            layout.addWidget(streaming_group)
-        elif role == "source":
-            media_control_group = QGroupBox("Media Control (A2DP Sink)")
-            media_control_group.setFont(bold_font)
-            media_control_group.setStyleSheet(styles.bluetooth_profiles_groupbox_style)
-            media_control_layout = QVBoxLayout()
-            media_control_layout.setSpacing(12)
-            media_control_layout.setContentsMargins(10, 10, 10, 10)
-            control_buttons = QHBoxLayout()
-            control_buttons.setSpacing(12)
-            self.play_button = QPushButton("Play")
-            self.play_button.setFont(bold_font)
-            self.play_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.play_button.clicked.connect(lambda: self.send_media_control_command("play"))
-            control_buttons.addWidget(self.play_button)
-            self.pause_button = QPushButton("Pause")
-            self.pause_button.setFont(bold_font)
-            self.pause_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.pause_button.clicked.connect(lambda: self.send_media_control_command("pause"))
-            control_buttons.addWidget(self.pause_button)
-            self.next_button = QPushButton("Next")
-            self.next_button.setFont(bold_font)
-            self.next_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.next_button.clicked.connect(lambda: self.send_media_control_command("next"))
-            control_buttons.addWidget(self.next_button)
-            self.previous_button = QPushButton("Previous")
-            self.previous_button.setFont(bold_font)
-            self.previous_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.previous_button.clicked.connect(lambda: self.send_media_control_command("previous"))
-            control_buttons.addWidget(self.previous_button)
-            self.rewind_button = QPushButton("Rewind")
-            self.rewind_button.setFont(bold_font)
-            self.rewind_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-            self.rewind_button.clicked.connect(lambda: self.send_media_control_command("rewind"))
-            control_buttons.addWidget(self.rewind_button)
-            media_control_layout.addLayout(control_buttons)
-            media_control_group.setLayout(media_control_layout)
-            layout.addWidget(media_control_group)
-        layout.addStretch(1)
-        widget = QWidget()
-        widget.setLayout(layout)
-        return widget
-
-    def create_opp_profile_ui(self, device_address):
-        """Builds and returns the OPP (Object Push Profile) panel for Bluetooth file transfer."""
-        bold_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        layout = QVBoxLayout()
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(15)
-        opp_label = QLabel("<b>OPP Functionality</b>")
-        opp_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        opp_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        layout.addWidget(opp_label)
-        is_connected = self.bluetooth_device_manager.is_device_connected(device_address)
-        if not is_connected:
-            warning_label = QLabel("Device is not connected. Connect to enable OPP profile.")
-            warning_label.setObjectName("WarningLabel")
-            warning_label.setFont(bold_font)
-            warning_label.setStyleSheet(styles.color_style_sheet)
-            layout.addWidget(warning_label)
-            layout.addStretch(1)
-            widget = QWidget()
-            widget.setLayout(layout)
-            widget.setStyleSheet(styles.device_tab_widget_style_sheet)
-            return widget
-        opp_group = QGroupBox("File Transfer")
-        opp_group.setStyleSheet(styles.bluetooth_profiles_groupbox_style)
-        opp_layout = QVBoxLayout()
-        opp_layout.setSpacing(10)
-        opp_layout.setContentsMargins(10, 10, 10, 10)
-        file_selection_layout = QHBoxLayout()
-        file_label = QLabel("Select File:")
-        file_label.setFont(bold_font)
-        file_selection_layout.addWidget(file_label)
-        self.opp_location_input = QLineEdit()
-        self.opp_location_input.setReadOnly(True)
-        self.opp_location_input.setFixedHeight(28)
-        file_selection_layout.addWidget(self.opp_location_input)
-        self.browse_opp_button = QPushButton("Browse")
-        self.browse_opp_button.setFont(bold_font)
-        self.browse_opp_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-        self.browse_opp_button.clicked.connect(self.select_opp_file)
-        file_selection_layout.addWidget(self.browse_opp_button)
-        opp_layout.addLayout(file_selection_layout)
-        button_layout = QHBoxLayout()
-        self.send_file_button = QPushButton("Send File")
-        self.send_file_button.setFont(bold_font)
-        self.send_file_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-        self.send_file_button.clicked.connect(self.send_file)
-        button_layout.addWidget(self.send_file_button)
-        self.receive_file_button = QPushButton("Receive File")
-        self.receive_file_button.setFont(bold_font)
-        self.receive_file_button.setStyleSheet(styles.bluetooth_profiles_button_style)
-        self.receive_file_button.clicked.connect(self.receive_file)
-        button_layout.addWidget(self.receive_file_button)
-        opp_layout.addLayout(button_layout)
-        opp_group.setLayout(opp_layout)
-        layout.addWidget(opp_group)
-        layout.addStretch(1)
-        widget = QWidget()
-        widget.setLayout(layout)
-        return widget
-
-    def send_media_control_command(self, command):
-        """Sends a media control command to the connected Bluetooth device.
+        self.executor.submit(
+            self.bluetooth_device_manager.unregister_agent, key="agent",
+            on_result=lambda _: QMessageBox.information(self, "Agent Unregistered", "Bluetooth agent was successfully unregistered."),
+            on_error=handle_error, buttons=[self.unregister_agent_button], busy_text="Unregistering...")
+
+    def handle_profile_tab_change(self, index):
+        """Show the cached panel of the selected profile tab, building it on first use.
 
         Args:
-            command: The media control command to send (e.g., "play", "pause", "next", "previous").
+            index: The index of the newly selected tab in the profile tab widget.
         """
-        self.bluetooth_device_manager.media_control(command, address=self.device_address_sink)
-        self.log.info("Media command %s sent to device %s.", command, self.device_address_sink)
-
-    def start_a2dp_streaming(self):
-        """Start A2DP streaming to a selected Bluetooth sink device."""
-        audio_path = self.audio_location_input.text().strip()
-        if not audio_path or not os.path.exists(audio_path):
-            QMessageBox.warning(self, "Invalid Audio File", "Please select a valid audio file to stream.")
-            return
-        self.log.info("Selected device address for streaming:%s", self.device_address_source)
-        if not self.device_address_source:
-            QMessageBox.warning(self, "No Device", "Please select a Bluetooth sink device to stream.")
+        if not self.device_tab_widget or index < 0:
             return
-        self.start_streaming_button.setEnabled(False)
-        self.stop_streaming_button.setEnabled(True)
-        success = self.bluetooth_device_manager.start_a2dp_stream(self.device_address_source, audio_path)
-        if success:
-            self.log.info("A2DP streaming successfully started with file: %s", audio_path)
-        else:
-            self.log.error("Failed to start A2DP streaming with file: %s", audio_path)
-            QMessageBox.critical(self, "Streaming Failed", "Failed to start streaming.")
-            self.start_streaming_button.setEnabled(True)
-            self.stop_streaming_button.setEnabled(False)
+        page = self.device_tab_widget.widget(index)
+        state = self.bluetooth_device_manager.get_device_state(self.device_address)
+        panel = self.profile_panels.get(self.device_address, PROFILE_PANELS[index], state)
+        panel_widget = panel.get_widget()
+        if panel_widget.parent() is not page:
+            page.layout().addWidget(panel_widget)
 
-    def stop_a2dp_streaming(self):
-        """Stop active A2DP streaming session."""
-        try:
-            self.bluetooth_device_manager.stop_a2dp_stream()
-        except Exception as error:
-            self.log.error("Failed to stop A2DP streaming for device: %s. Error: %s", self.device_address_source, error)
-            QMessageBox.critical(self, "Stop Streaming Failed", "Failed to stop A2DP streaming.")
+    def handle_device_state_change(self, device_address):
+        """Refresh the device view once the connection or UUIDs of the shown device changed.
+
+        Cached panels are rebuilt lazily by the panel cache when their state is stale; the
+        panels of a removed device are dropped.
+
+        Args:
+            device_address: Bluetooth address of remote device.
+        """
+        if not self.bluetooth_device_manager.find_device_path(device_address):
+            self.profile_panels.remove(device_address)
+        if device_address != self.device_address:
             return
-        self.log.info("A2DP streaming stopped for device: %s", self.device_address_source)
-        self.start_streaming_button.setEnabled(True)
-        self.stop_streaming_button.setEnabled(False)
-
-    def select_audio_file(self):
-        """Open a file dialog for selecting an audio file."""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(caption="Select Audio File", filter="WAV files (*.wav)")
-        if file_path:
-            if os.path.exists(file_path) and file_path.lower().endswith('.wav'):
-                self.audio_location_input.setText(file_path)
-                self.log.info("Audio file selected.")
-            else:
-                self.log.warning(f"Selected file is invalid or not a WAV file: {file_path}")
-                QMessageBox.warning(self, "Invalid File", "The selected file does not exist or is not a valid WAV file.")
-
-    def select_opp_file(self):
-        """Open a file dialog to select a file to send via OPP."""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(None, "Select File to Send via OPP", "", "All Files (*)")
-        if file_path:
-            if not os.path.exists(file_path):
-                QMessageBox.critical(None, "Invalid File", "The selected file does not exist.")
-                self.log.error("Selected OPP file does not exist: %s", file_path)
-                return
-            self.opp_location_input.setText(file_path)
-            self.log.info("File selected to send via OPP")
-
-    def send_file(self):
-        """Send a selected file to a remote device using OPP."""
-        file_path = self.opp_location_input.text()
-        if not file_path or not self.device_address:
-            QMessageBox.warning(None, "OPP", "Please select a device and a file.")
+        if self.bluetooth_device_manager.get_device_state(device_address) == self.device_view_state:
             return
-        self.send_file_button.setEnabled(False)
-        self.send_file_button.setText("Sending...")
-        try:
-            status = self.bluetooth_device_manager.send_file(self.device_address, file_path)
-        except Exception as error:
-            status = "error"
-            self.log.info("UI error:%s", error)
-        self.send_file_button.setEnabled(True)
-        self.send_file_button.setText("Send File")
-        if status == "complete":
-            QMessageBox.information(None, "OPP", "File sent successfully!")
-        elif status == "queued":
-            QMessageBox.information(None, "OPP", "File transfer is queued. Please wait...")
-        elif status == "unknown":
-            QMessageBox.warning(None, "OPP", "File transfer status is unknown.")
-        else:
-            QMessageBox.warning(None, "OPP", "File transfer failed or was rejected.")
+        index = self.device_tab_widget.currentIndex() if self.device_tab_widget else 0
+        self.load_device_profile_tabs(device_address, index)
 
-    def receive_file(self):
-        """Start OPP receiver and handle file transfer."""
-        try:
-            received_file_path = self.bluetooth_device_manager.receive_file(user_confirm_callback=self.prompt_file_transfer_confirmation)
-            if received_file_path:
-                QMessageBox.information(None, "File Received", f"File received successfully:\n{received_file_path}")
-            else:
-                QMessageBox.warning(None, "File Transfer", "No file received or user declined the transfer.")
-        except Exception as error:
-            QMessageBox.critical(None, "Error", f"An error occurred during file reception:\n{str(error)}")
+    def release_device_tabs(self):
+        """Delete the profile tab widget, keeping the cached panels alive for the next time."""
+        if not self.device_tab_widget:
+            return
+        self.device_tab_widget.currentChanged.disconnect(self.handle_profile_tab_change)
+        self.profile_panels.detach()
+        self.profile_methods_layout.removeWidget(self.device_tab_widget)
+        self.device_tab_widget.hide()
+        self.device_tab_widget.setParent(None)
+        self.device_tab_widget.deleteLater()
+        self.device_tab_widget = None
 
-    def handle_profile_tab_change(self, index):
-        """Handles actions to perform when the user switches between profile tabs in the UI.
+    def load_device_profile_tabs(self, device_address, tab_index=0):
+        """Loads and displays profile-related UI tabs for a specific Bluetooth device.
+
+        The device state comes from the device index and the tab panels from the panel
+        cache, so switching devices makes no D-Bus calls.
 
         Args:
-            index: The index of the newly selected tab in the profile tab widget.
+            device_address: Bluetooth address of remote device.
+            tab_index: Index of the profile tab shown first.
         """
-        if not hasattr(self, 'device_tab_widget') or index < 0:
-            return
-        selected_tab = self.device_tab_widget.tabText(index)
-        if selected_tab == "A2DP" :
-            self.clear_layout(self.a2dp_tab_placeholder)
-            layout = QVBoxLayout()
-            a2dp_panel = self.create_a2dp_profile_ui(self.device_address)
-            self.log.info(self.device_address)
-            layout.addWidget(a2dp_panel)
-            self.a2dp_tab_placeholder.setLayout(layout)
-            self.a2dp_tab_placeholder.update()
-        elif selected_tab == "OPP":
-            self.clear_layout(self.opp_tab_placeholder)
-            layout = QVBoxLayout()
-            opp_tab = self.create_opp_profile_ui(self.device_address)
-            layout.addWidget(opp_tab)
-            self.opp_tab_placeholder.setLayout(layout)
-            self.opp_tab_placeholder.update()
-
-    def load_device_profile_tabs(self, device_address):
-        """Loads and displays profile-related UI tabs for a specific Bluetooth device."""
         bold_font = QFont()
         bold_font.setBold(True)
-        is_connected = self.bluetooth_device_manager.is_device_connected(device_address)
+        self.device_view_state = self.bluetooth_device_manager.get_device_state(device_address)
+        is_connected, _ = self.device_view_state
         self.device_address = device_address
+        self.release_device_tabs()
+        self.clear_layout(self.profile_methods_layout)
         if not is_connected:
             warning_label = QLabel("Device is not connected. Connect to enable profile controls.")
             warning_label.setObjectName("WarningLabel")
             warning_label.setFont(bold_font)
             warning_label.setStyleSheet(styles.color_style_sheet)
-            self.clear_layout(self.profile_methods_layout)
             self.profile_methods_layout.addWidget(warning_label)
             self.add_device_connection_controls(self.profile_methods_layout, device_address)
             return
@@ -758,14 +637,14 @@ class TestApplication(QWidget):
         self.device_tab_widget.setMaximumWidth(600)
         self.device_tab_widget.setFont(bold_font)
         self.device_tab_widget.setStyleSheet(styles.device_tab_widget_style_sheet)
-        self.a2dp_tab_placeholder = QWidget()
-        self.a2dp_tab_placeholder.setMaximumWidth(600)
-        self.opp_tab_placeholder = QWidget()
-        self.opp_tab_placeholder.setMaximumWidth(600)
-        self.device_tab_widget.addTab(self.a2dp_tab_placeholder, "A2DP")
-        self.device_tab_widget.addTab(self.opp_tab_placeholder, "OPP")
+        for panel_class in PROFILE_PANELS:
+            page = QWidget()
+            page.setMaximumWidth(600)
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.device_tab_widget.addTab(page, panel_class.title)
+        self.device_tab_widget.setCurrentIndex(tab_index)
         self.device_tab_widget.currentChanged.connect(self.handle_profile_tab_change)
-        self.clear_layout(self.profile_methods_layout)
         self.profile_methods_layout.addWidget(self.device_tab_widget)
         self.handle_profile_tab_change(self.device_tab_widget.currentIndex())
         self.add_device_connection_controls(self.profile_methods_layout, device_address)
@@ -780,7 +659,7 @@ class TestApplication(QWidget):
         bold_font = QFont()
         bold_font.setBold(True)
         button_layout = QHBoxLayout()
-        self.is_connected = self.bluetooth_device_manager.is_device_connected(device_address)
+        self.is_connected, _ = self.bluetooth_device_manager.get_device_state(device_address)
         self.is_paired = device_address in self.bluetooth_device_manager.get_paired_devices()
         self.connect_button = QPushButton("Connect")
         self.connect_button.setFont(bold_font)
@@ -805,45 +684,89 @@ class TestApplication(QWidget):
         button_layout.addWidget(self.unpair_button)
         layout.addLayout(button_layout)
 
+    def handle_discovery_action(self, action, device_address):
+        """Run a PAIR or CONNECT click of the discovery table and show the device's row busy.
+
+        Args:
+            action: 'pair' or 'connect'.
+            device_address: The Bluetooth address of the device.
+        """
+        self.perform_device_action(action, device_address, load_profiles=False)
+        self.discovery_model.refresh_actions(device_address)
+
     def perform_device_action(self, action, device_address, load_profiles):
-        """Performs a Bluetooth device action and updates the UI.
+        """Runs a Bluetooth device action on a worker thread and updates the UI with its result.
+
+        Actions on the same device run one after the other; the device's buttons show a
+        busy state until the action finishes.
 
         Args:
             action: One of 'pair', 'connect', 'disconnect', or 'unpair'.
             device_address: The Bluetooth address of the device.
+            load_profiles: Whether the action came from the device view, whose buttons show the busy state.
         """
+        manager = self.bluetooth_device_manager
+        operations = {
+            'pair': (lambda: None if manager.is_device_paired(device_address) else manager.pair(device_address), "Pairing..."),
+            'connect': (lambda: manager.connect(device_address), "Connecting..."),
+            'disconnect': (lambda: manager.disconnect(device_address), "Disconnecting..."),
+            'unpair': (lambda: manager.unpair_device(device_address), "Unpairing..."),
+        }
+        if action not in operations:
+            self.log.error("Unknown action:%s", action)
+            return
         if action == 'pair':
             self.log.info("Attempting to pair with %s", device_address)
-            if self.bluetooth_device_manager.is_device_paired(device_address):
+        operation, busy_text = operations[action]
+        buttons = []
+        if load_profiles:
+            for button in (getattr(self, "connect_button", None), getattr(self, "disconnect_button", None),
+                           getattr(self, "unpair_button", None)):
+                try:
+                    if button is not None and button.isEnabled():
+                        buttons.append(button)
+                except RuntimeError:
+                    pass
+        self.executor.submit(
+            operation, key=device_address,
+            on_result=lambda success: self.handle_device_action_result(action, device_address, load_profiles, success),
+            on_error=lambda error: QMessageBox.warning(self, "Operation Failed", f"{action} {device_address} failed:\n{error}"),
+            buttons=buttons, busy_text=busy_text)
+
+    def handle_device_action_result(self, action, device_address, load_profiles, success):
+        """Report the result of a device action and refresh the device view.
+
+        Args:
+            action: One of 'pair', 'connect', 'disconnect', or 'unpair'.
+            device_address: The Bluetooth address of the device.
+            load_profiles: Whether the action came from the device view; the view itself is
+                refreshed by handle_device_state_change.
+            success: OperationResult of the action, or None when pairing found the device already paired.
+        """
+        if action == 'pair':
+            if success is None:
                 QMessageBox.information(self, "Already Paired", f"{device_address} is already paired.")
                 self.add_paired_device_to_list(device_address)
                 return
-            success = self.bluetooth_device_manager.pair(device_address)
+            self.log.info("Pairing with %s finished in %s s", device_address, success.latency)
             if success:
                 QMessageBox.information(self, "Pairing Successful", f"{device_address} was paired.")
                 self.add_paired_device_to_list(device_address)
             else:
-                time.sleep(120)
                 QMessageBox.information(self, "Pairing Failed", f"Pairing with {device_address} failed.")
         elif action == 'connect':
-            success = self.bluetooth_device_manager.connect(device_address)
             if success:
                 QMessageBox.information(self, "Connection Successful", f"{device_address} was connected.")
                 self.log.info("%s connected successfully", device_address)
-                if load_profiles:
-                    self.load_device_profile_tabs(device_address)
             else:
                 QMessageBox.warning(self, "Connection Failed", f"Failed to connect to {device_address}")
         elif action == 'disconnect':
-            success = self.bluetooth_device_manager.disconnect(device_address)
             if success:
                 QMessageBox.information(self, "Disconnection Successful", f"{device_address} was disconnected.")
                 self.log.info("Disconnected from %s", device_address)
             else:
                 QMessageBox.warning(self, "Disconnection Failed", f"Could not disconnect from {device_address}")
-            self.load_device_profile_tabs(device_address)
         elif action == 'unpair':
-            success = self.bluetooth_device_manager.unpair_device(device_address)
             if success:
                 QMessageBox.information(self, "Unpair Successful", f"{device_address} was unpaired.")
                 self.log.info("Unpaired %s", device_address)
@@ -852,11 +775,6 @@ class TestApplication(QWidget):
             self.remove_device_from_list(device_address)
             if self.profiles_list_widget.count() == 1:
                 self.profiles_list_widget.itemSelectionChanged.connect(self.handle_profile_selection)
-            else:
-                self.load_device_profile_tabs(device_address)
-        else:
-            self.log.error("Unknown action:%s", action)
-
 
     def remove_device_from_list(self, unpaired_device_address):
         """Removes a specific unpaired device from the profiles list (if present)."""
@@ -867,16 +785,20 @@ class TestApplication(QWidget):
                 break
 
     def register_bluetooth_agent(self):
-        """Register bluetooth pairing agent"""
+        """Register bluetooth pairing agent on a worker thread."""
         self.selected_capability = self.capability_combobox.currentText()
-        self.log.info("Attempting to register agent with capability:%s", self.selected_capability)
-        try:
-            self.bluetooth_device_manager.register_agent(capability=self.selected_capability, ui_callback = self.pairing_ui_callback)
-            QMessageBox.information(self, "Agent Registered", f"Agent registered with capability: {self.selected_capability}")
-        except Exception as error:
+        capability = self.selected_capability
+        self.log.info("Attempting to register agent with capability:%s", capability)
+
+        def handle_error(error):
             self.log.info("Failed to register agent:%s", error)
             QMessageBox.critical(self, "Registration Failed", f"Could not register agent.\n{error}")
 
+        self.executor.submit(
+            self.bluetooth_device_manager.register_agent, capability, self.pairing_ui_callback, key="agent",
+            on_result=lambda _: QMessageBox.information(self, "Agent Registered", f"Agent registered with capability: {capability}"),
+            on_error=handle_error, buttons=[self.register_agent_button], busy_text="Registering...")
+
     def initialize_host_ui(self):
         """Create and display the main testing application GUI."""
         self.main_grid_layout = QGridLayout()
@@ -919,20 +841,27 @@ class TestApplication(QWidget):
         controller_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
         controller_label.setStyleSheet(styles.color_style_sheet)
         controller_layout.addWidget(controller_label)
-        details = get_controller_interface_details(self.log, interface=self.interface, detail_level='extended_info')
+        # Name and address come from the cached Adapter1 properties; the HCI/LMP fields need
+        # the external controller tool and are filled in by a worker thread when ready.
+        extended_details = TestApplication.controller_details_cache.get(self.interface)
+        details = dict(extended_details or {})
+        details.update(self.bluetooth_device_manager.get_controller_details())
         self.grid = QGridLayout()
         self.grid.setHorizontalSpacing(10)
         self.grid.setVerticalSpacing(12)
         self.grid.setColumnStretch(0, 1)
         self.grid.setColumnStretch(1, 2)
-        self.add_controller_details_row(0, "Controller Name", details.get("Name", "N/A"))
-        self.add_controller_details_row(1, "Controller Address", details.get("BD_ADDR", "N/A"))
-        self.add_controller_details_row(2, "Link Mode", details.get("Link mode", "N/A"))
-        self.add_controller_details_row(3, "Link Policy", details.get("Link policy", "N/A"))
-        self.add_controller_details_row(4, "HCI Version", details.get("HCI Version", "N/A"))
-        self.add_controller_details_row(5, "LMP Version", details.get("LMP Version", "N/A"))
-        self.add_controller_details_row(6, "Manufacturer", details.get("Manufacturer", "N/A"))
+        for row, (key, label) in enumerate(self.controller_detail_fields):
+            default = "N/A" if extended_details is not None else "Loading..."
+            self.controller_detail_labels[key] = self.add_controller_details_row(row, label, details.get(key, default))
         controller_layout.addLayout(self.grid)
+        if extended_details is None:
+            threading.Thread(target=self.load_extended_controller_details, name="controller-details", daemon=True).start()
+        manager = self.bluetooth_device_manager
+        adapter_listener = manager.add_adapter_listener(self.controller_details_loaded.emit)
+        self.destroyed.connect(lambda: manager.remove_adapter_listener(adapter_listener))
+        device_state_listener = manager.add_device_state_listener(self.device_state_changed.emit)
+        self.destroyed.connect(lambda: manager.remove_device_state_listener(device_state_listener))
         self.main_grid_layout.addWidget(controller_details_widget, 5, 0, 8, 2)
         # Grid2: Profile description
         profile_description_label = QLabel("Profile Methods or Procedures:")
@@ -957,7 +886,7 @@ class TestApplication(QWidget):
         back_button = QPushButton("Back")
         back_button.setFixedSize(100, 40)
         back_button.setStyleSheet(styles.back_button_style_sheet)
-        back_button.clicked.connect(lambda:self.back_callback())
+        back_button.clicked.connect(self.leave_host_ui)
         back_layout = QHBoxLayout()
         back_layout.addWidget(back_button)
         back_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -968,6 +897,13 @@ class TestApplication(QWidget):
         self.setLayout(self.main_grid_layout)
         self.load_paired_devices()
 
+    def leave_host_ui(self):
+        """Drop the cached profile panels and return to the previous screen."""
+        self.release_device_tabs()
+        self.profile_panels.clear()
+        self.device_address = None
+        self.back_callback()
+
     def prompt_file_transfer_confirmation(self, file_path):
         """Prompt user to confirm a file transfer and return their decision."""
         file_name = os.path.basename(file_path)
@@ -1023,7 +959,7 @@ class TestApplication(QWidget):
                 return True
             elif reply == QMessageBox.StandardButton.No:
                 self.log.warning("User denied service authorization for device %s", device_address)
-                self.bluetooth_device_manager.disconnect(device_address)
+                self.executor.submit(self.bluetooth_device_manager.disconnect, device_address, key=device_address)
 
         elif request_type == "display_pin":
             QMessageBox.information(self, "Display PIN", f"Enter this PIN on {device_address}: {uuid}")
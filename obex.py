@@ -0,0 +1,669 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections import deque
+
+import dbus
+from gi.repository import GLib
+
+from libraries.bluetooth import constants
+from libraries.bluetooth.dbus_dispatch import is_dispatch_thread
+from libraries.bluetooth.device_index import DeviceIndex
+
+
+def wait_event(event, timeout=None):
+    """Block until a threading.Event is set while keeping D-Bus signals flowing.
+
+    On the D-Bus dispatch thread the default GLib main context is iterated while
+    waiting; any other thread only waits on the event and never touches the context.
+
+    Args:
+        event: threading.Event to wait for.
+        timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+
+    Returns:
+        True if the event is set, False on timeout.
+    """
+    if not is_dispatch_thread():
+        return event.wait(timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    context = GLib.MainContext.default()
+    while not event.is_set():
+        remaining = 0.05 if deadline is None else min(0.05, deadline - time.monotonic())
+        if remaining <= 0:
+            return False
+        DeviceIndex._iterate(context, remaining)
+    return True
+
+
+class ObexTransfer:
+    """Handle of one non-blocking OBEX Object Push transfer.
+
+    The handle is returned before the OBEX session is even connected. It follows the
+    Status, Size and Transferred properties of the org.bluez.obex.Transfer1 object,
+    derives instantaneous and average throughput from them, and can cancel the transfer
+    at any stage. Callbacks run on the thread dispatching D-Bus signals.
+    """
+
+    final_states = ("complete", "error", "cancelled")
+
+    def __init__(self, session_bus, device_address, file_path, on_progress=None, log=None, source=None):
+        """Initialize the handle.
+
+        Args:
+            session_bus: Session bus connection obexd lives on.
+            device_address: Bluetooth address of the receiving device.
+            file_path: Path of the file being sent.
+            on_progress: Callable receiving the handle on every progress or status update.
+            log: Logger instance.
+            source: Bluetooth address of the local adapter to send from; obexd picks the
+                default adapter if not given.
+        """
+        self.session_bus = session_bus
+        self.device_address = device_address
+        self.source = source
+        self.file_path = file_path
+        self.on_progress = on_progress
+        self.log = log
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self.done_callbacks = []
+        self.path = None
+        self.session_path = None
+        self.status = "connecting"
+        self.error = None
+        self.size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        self.transferred = 0
+        self.started = time.monotonic()
+        self.active_since = None
+        self.ended = None
+        self.last_sample = (self.started, 0)
+        self.instant_rate = 0.0
+        self.cancel_requested = False
+        self.send_pending = False
+
+    def __repr__(self):
+        return f"ObexTransfer({self.device_address}, {os.path.basename(self.file_path)}, {self.status})"
+
+    @property
+    def is_finished(self):
+        """True once the transfer completed, failed or was cancelled."""
+        return self.finished.is_set()
+
+    @property
+    def progress(self):
+        """Fraction of the file transferred, between 0.0 and 1.0."""
+        if self.status == "complete":
+            return 1.0
+        return min(1.0, self.transferred / self.size) if self.size else 0.0
+
+    @property
+    def elapsed(self):
+        """Seconds since the handle was created, frozen once the transfer is finished."""
+        return (self.ended or time.monotonic()) - self.started
+
+    @property
+    def average_rate(self):
+        """Average throughput in bytes per second since the transfer became active."""
+        start = self.active_since or self.started
+        duration = (self.ended or time.monotonic()) - start
+        return self.transferred / duration if duration > 0 else 0.0
+
+    def add_done_callback(self, callback):
+        """Call callback(handle) once the transfer is finished, immediately if it already is."""
+        with self.lock:
+            if not self.finished.is_set():
+                self.done_callbacks.append(callback)
+                return
+        callback(self)
+
+    def attach(self, transfer_path, properties):
+        """Bind the handle to the Transfer1 object created by SendFile.
+
+        Args:
+            transfer_path: D-Bus object path of the transfer.
+            properties: Initial Transfer1 properties returned by SendFile.
+        """
+        self.path = str(transfer_path)
+        if self.log:
+            self.log.info("Started transfer: %s", self.path)
+        self.update(properties)
+        if self.cancel_requested and not self.is_finished:
+            self._cancel_transfer()
+
+    def update(self, changed):
+        """Apply changed Transfer1 properties and report progress.
+
+        Args:
+            changed: Dictionary of changed properties (Status, Size, Transferred).
+        """
+        if self.is_finished:
+            return
+        now = time.monotonic()
+        if "Size" in changed:
+            self.size = int(changed["Size"])
+        if "Transferred" in changed:
+            self.transferred = int(changed["Transferred"])
+            sample_time, sample_bytes = self.last_sample
+            if now > sample_time:
+                self.instant_rate = (self.transferred - sample_bytes) / (now - sample_time)
+            self.last_sample = (now, self.transferred)
+        if "Status" in changed:
+            self.status = str(changed["Status"])
+            if self.status == "active" and self.active_since is None:
+                self.active_since = now
+                self.last_sample = (now, self.transferred)
+        if self.on_progress:
+            try:
+                self.on_progress(self)
+            except Exception as error:
+                if self.log:
+                    self.log.warning("OBEX progress callback failed: %s", error)
+        if self.status in self.final_states:
+            self._finish(self.status)
+
+    def fail(self, error):
+        """Finish the transfer with an error, e.g. when the session could not be created."""
+        self.error = str(error)
+        if self.log:
+            self.log.error("OBEX send to %s failed: %s", self.device_address, error)
+        self._finish("cancelled" if self.cancel_requested else "error")
+
+    def cancel(self):
+        """Cancel the transfer.
+
+        A transfer still waiting for its session or its turn in the queue finishes
+        immediately; while SendFile is in flight the cancellation is deferred until the
+        Transfer1 object exists.
+        """
+        if self.is_finished:
+            return
+        self.cancel_requested = True
+        if self.path:
+            self._cancel_transfer()
+        elif not self.send_pending:
+            self._finish("cancelled")
+
+    def wait(self, timeout=None):
+        """Block until the transfer is finished.
+
+        Transfer signals keep arriving even when waiting on the dispatching thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The final status, or the current one on timeout.
+        """
+        wait_event(self.finished, timeout)
+        return self.status
+
+    def _cancel_transfer(self):
+        """Ask obexd to abort the transfer without blocking."""
+        transfer = dbus.Interface(self.session_bus.get_object(constants.obex_service, self.path, introspect=False),
+                                  constants.obex_object_transfer)
+        transfer.Cancel(reply_handler=lambda: None,
+                        error_handler=lambda error: self.log and self.log.warning("Failed to cancel %s: %s", self.path, error))
+
+    def _finish(self, status):
+        """Record the final status and run the done callbacks once."""
+        with self.lock:
+            if self.finished.is_set():
+                return
+            self.status = status
+            self.ended = time.monotonic()
+            self.finished.set()
+            callbacks, self.done_callbacks = self.done_callbacks, []
+        if self.log:
+            self.log.info("Transfer %s finished with status %s: %d bytes in %.2fs (%.2f MB/s)", self.path, status,
+                          self.transferred, self.elapsed, self.average_rate / 1e6)
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as error:
+                if self.log:
+                    self.log.warning("OBEX done callback failed: %s", error)
+
+
+class ObexTransferMonitor:
+    """Routes Transfer1 PropertiesChanged signals of the session bus to transfer handles.
+
+    A single signal receiver is registered for all transfers before any SendFile call, so
+    updates emitted before a handle is attached are buffered rather than lost.
+    """
+
+    def __init__(self, session_bus, log=None, max_unclaimed=64):
+        """Register the signal receiver.
+
+        Args:
+            session_bus: Session bus connection obexd lives on.
+            log: Logger instance.
+            max_unclaimed: Number of unknown transfer paths whose updates are buffered.
+        """
+        self.log = log
+        self.lock = threading.Lock()
+        self.transfers = {}
+        self.unclaimed = OrderedDict()
+        self.max_unclaimed = max_unclaimed
+        self.signal_match = session_bus.add_signal_receiver(
+            self.properties_changed,
+            dbus_interface=constants.properties_interface,
+            signal_name="PropertiesChanged",
+            arg0=constants.obex_object_transfer,
+            path_keyword="path")
+
+    def register(self, transfer, transfer_path, properties):
+        """Attach a handle to its Transfer1 object and replay buffered updates.
+
+        Args:
+            transfer: ObexTransfer handle.
+            transfer_path: D-Bus object path returned by SendFile.
+            properties: Initial properties returned by SendFile.
+        """
+        transfer_path = str(transfer_path)
+        with self.lock:
+            self.transfers[transfer_path] = transfer
+            buffered = self.unclaimed.pop(transfer_path, {})
+        transfer.add_done_callback(lambda handle: self.unregister(transfer_path))
+        transfer.attach(transfer_path, dict(properties, **buffered))
+
+    def unregister(self, transfer_path):
+        """Stop routing updates for a transfer path."""
+        with self.lock:
+            self.transfers.pop(transfer_path, None)
+
+    def properties_changed(self, interface, changed, invalidated, path=None):
+        """Handle PropertiesChanged of any Transfer1 object."""
+        with self.lock:
+            transfer = self.transfers.get(path)
+            if transfer is None:
+                self.unclaimed.setdefault(path, {}).update(changed)
+                self.unclaimed.move_to_end(path)
+                while len(self.unclaimed) > self.max_unclaimed:
+                    self.unclaimed.popitem(last=False)
+                return
+        transfer.update(changed)
+
+    def close(self):
+        """Remove the signal receiver."""
+        if self.signal_match:
+            self.signal_match.remove()
+            self.signal_match = None
+
+
+class ObexSession:
+    """State of one pooled OBEX OPP session and its FIFO transfer queue."""
+
+    def __init__(self, device_address, source=None):
+        """Initialize an unconnected session.
+
+        Args:
+            device_address: Bluetooth address of the remote device.
+            source: Bluetooth address of the local adapter, or None for the default one.
+        """
+        self.device_address = device_address
+        self.source = source
+        self.key = (source, device_address)
+        self.path = None
+        self.queue = deque()
+        self.active = None
+        self.idle_source = None
+        self.transfers_sent = 0
+
+
+class ObexSessionPool:
+    """Keeps one OBEX OPP session per device and pushes queued files over it back to back.
+
+    A session is created on the first transfer to a device and reused by every following
+    transfer, so the RFCOMM/L2CAP connect and OBEX CONNECT are paid once. Transfers to the
+    same device run one after another in submission order; a session that stays idle for
+    idle_timeout seconds is removed.
+    """
+
+    def __init__(self, session_bus, obex_client, monitor, idle_timeout=30, call_timeout=30, log=None):
+        """Initialize the pool.
+
+        Args:
+            session_bus: Session bus connection obexd lives on.
+            obex_client: org.bluez.obex.Client1 interface.
+            monitor: ObexTransferMonitor routing Transfer1 signals to handles.
+            idle_timeout: Seconds an idle session is kept before it is removed.
+            call_timeout: Timeout in seconds of CreateSession and SendFile calls.
+            log: Logger instance.
+        """
+        self.session_bus = session_bus
+        self.obex_client = obex_client
+        self.monitor = monitor
+        self.idle_timeout = idle_timeout
+        self.call_timeout = call_timeout
+        self.log = log
+        self.lock = threading.RLock()
+        self.sessions = {}
+
+    def submit(self, transfer):
+        """Queue a transfer behind earlier transfers to the same device.
+
+        Args:
+            transfer: ObexTransfer handle of the file to send.
+        """
+        with self.lock:
+            key = (transfer.source, transfer.device_address)
+            session = self.sessions.get(key)
+            if session is None:
+                session = self.sessions[key] = ObexSession(transfer.device_address, transfer.source)
+                self._create_session(session)
+            session.queue.append(transfer)
+            if session.idle_source is not None:
+                GLib.source_remove(session.idle_source)
+                session.idle_source = None
+            self._start_next(session)
+
+    def get_session_paths(self):
+        """Return a mapping of (source, device address) to the path of its connected session."""
+        with self.lock:
+            return {key: session.path for key, session in self.sessions.items() if session.path}
+
+    def close_session(self, device_address, source=None):
+        """Remove the session of a device and cancel the transfers queued on it.
+
+        Args:
+            device_address: Bluetooth address of the remote device.
+            source: Bluetooth address of the local adapter the session was created from.
+        """
+        with self.lock:
+            session = self.sessions.pop((source, device_address), None)
+            if session is None:
+                return
+            if session.idle_source is not None:
+                GLib.source_remove(session.idle_source)
+                session.idle_source = None
+            pending = list(session.queue)
+            session.queue.clear()
+        for transfer in pending:
+            transfer.cancel()
+        if session.active:
+            session.active.cancel()
+        self._remove_session(session)
+
+    def close(self):
+        """Remove every pooled session."""
+        with self.lock:
+            keys = list(self.sessions)
+        for source, address in keys:
+            self.close_session(address, source)
+
+    def _create_session(self, session):
+        """Connect a new OPP session to the device. Caller holds the lock."""
+        def created(path):
+            with self.lock:
+                session.path = str(path)
+                if self.log:
+                    self.log.info("Created OBEX OPP session: %s", session.path)
+                if self.sessions.get(session.key) is not session:
+                    self._remove_session(session)
+                    return
+                self._start_next(session)
+
+        def failed(error):
+            with self.lock:
+                if self.sessions.get(session.key) is session:
+                    del self.sessions[session.key]
+                pending = list(session.queue)
+                session.queue.clear()
+            if self.log:
+                self.log.error("OBEX session creation failed for device %s: %s", session.device_address, error)
+            for transfer in pending:
+                transfer.fail(error)
+
+        options = {"Target": dbus.String("opp")}
+        if session.source:
+            options["Source"] = dbus.String(session.source)
+        self.obex_client.CreateSession(session.device_address, options, reply_handler=created,
+                                       error_handler=failed, timeout=self.call_timeout)
+
+    def _start_next(self, session):
+        """Start the next queued transfer if the session is connected and idle. Caller holds the lock."""
+        if session.path is None or session.active is not None:
+            return
+        while session.queue:
+            transfer = session.queue.popleft()
+            if transfer.is_finished:
+                continue
+            session.active = transfer
+            transfer.add_done_callback(lambda handle: self._transfer_done(session, handle))
+            self.send_on_session(session.path, transfer,
+                                 error_handler=lambda error: self._send_failed(session, transfer, error))
+            return
+        session.idle_source = GLib.timeout_add_seconds(self.idle_timeout, self._expire, session)
+
+    def send_on_session(self, session_path, transfer, error_handler=None):
+        """Issue SendFile for a transfer on a given session without blocking.
+
+        Args:
+            session_path: D-Bus object path of a connected OPP session.
+            transfer: ObexTransfer handle of the file to send.
+            error_handler: Callable receiving the SendFile error; fails the transfer if not given.
+        """
+        def started(transfer_path, properties):
+            transfer.send_pending = False
+            self.monitor.register(transfer, transfer_path, properties)
+
+        def failed(error):
+            transfer.send_pending = False
+            (error_handler or transfer.fail)(error)
+
+        transfer.session_path = str(session_path)
+        transfer.status = "queued"
+        transfer.send_pending = True
+        opp_interface = dbus.Interface(self.session_bus.get_object(constants.obex_service, session_path,
+                                                                   introspect=False),
+                                       constants.obex_object_push)
+        opp_interface.SendFile(transfer.file_path, reply_handler=started, error_handler=failed,
+                               timeout=self.call_timeout)
+
+    def _send_failed(self, session, transfer, error):
+        """SendFile error handler; the session is assumed broken and reconnected for the rest of the queue."""
+        with self.lock:
+            if self.sessions.get(session.key) is session:
+                del self.sessions[session.key]
+            pending = list(session.queue)
+            session.queue.clear()
+        self._remove_session(session)
+        transfer.fail(error)
+        for queued in pending:
+            self.submit(queued)
+
+    def _transfer_done(self, session, transfer):
+        """Done callback of the active transfer starting the next one."""
+        with self.lock:
+            if session.active is not transfer:
+                return
+            session.active = None
+            session.transfers_sent += 1
+            if self.sessions.get(session.key) is session:
+                self._start_next(session)
+
+    def _expire(self, session):
+        """Idle timeout removing a session nothing was queued on."""
+        with self.lock:
+            session.idle_source = None
+            if session.queue or session.active or self.sessions.get(session.key) is not session:
+                return False
+            del self.sessions[session.key]
+        if self.log:
+            self.log.info("OBEX session %s idle for %ss after %d transfers, removing it", session.path,
+                          self.idle_timeout, session.transfers_sent)
+        self._remove_session(session)
+        return False
+
+    def _remove_session(self, session):
+        """Remove a session from obexd without blocking."""
+        if session.path is None:
+            return
+        path, session.path = session.path, None
+        self.obex_client.RemoveSession(dbus.ObjectPath(path), reply_handler=lambda: None,
+                                       error_handler=lambda error: self.log and self.log.warning(
+                                           "Failed to remove session %s: %s", path, error))
+
+
+class ParallelPush:
+    """Pushes one file to many devices with a bounded number of concurrent transfers.
+
+    Transfers are started from done callbacks, so the push runs on the D-Bus dispatch
+    thread without any worker threads; transfers to the same device additionally queue
+    behind each other in the session pool.
+    """
+
+    def __init__(self, start_transfer, targets, file_path, parallelism=4, on_finished=None, log=None):
+        """Initialize the push.
+
+        Args:
+            start_transfer: Callable receiving a target and returning its ObexTransfer.
+            targets: Targets passed to start_transfer, e.g. device addresses; duplicates
+                are pushed once.
+            file_path: Path of the file pushed to every target.
+            parallelism: Maximum number of transfers running at the same time.
+            on_finished: Callable receiving the report dictionary once every target is done.
+            log: Logger instance.
+        """
+        self.start_transfer = start_transfer
+        self.targets = list(dict.fromkeys(targets))
+        self.file_path = file_path
+        self.parallelism = max(1, parallelism)
+        self.on_finished = on_finished
+        self.log = log
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self.pending = deque(self.targets)
+        self.transfers = {}
+        self.start_errors = {}
+        self.running = 0
+        self.cancelled = False
+        self.started = None
+        self.ended = None
+
+    def start(self):
+        """Start the first batch of transfers.
+
+        Returns:
+            The push itself.
+        """
+        self.started = time.monotonic()
+        if self.log:
+            self.log.info("Pushing %s to %d targets, %d at a time", self.file_path, len(self.targets), self.parallelism)
+        if not self.targets:
+            self._complete()
+        self._start_more()
+        return self
+
+    def cancel(self):
+        """Drop targets not started yet and cancel the running transfers."""
+        with self.lock:
+            self.cancelled = True
+            self.pending.clear()
+            transfers = list(self.transfers.values())
+            done = not self.running
+        for transfer in transfers:
+            transfer.cancel()
+        if done:
+            self._complete()
+
+    def wait(self, timeout=None):
+        """Block until every target is done.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The report dictionary, partial on timeout.
+        """
+        wait_event(self.finished, timeout)
+        return self.get_report()
+
+    def get_report(self):
+        """Aggregate per-target status, duration and throughput.
+
+        Returns:
+            Dictionary with the totals and a "targets" list of per-target results; targets
+            that never started are reported with status "skipped".
+        """
+        with self.lock:
+            transfers = dict(self.transfers)
+            start_errors = dict(self.start_errors)
+        results = []
+        total_bytes = 0
+        for target in self.targets:
+            transfer = transfers.get(target)
+            if transfer is None:
+                results.append({"target": target, "status": "error" if target in start_errors else "skipped",
+                                "bytes": 0, "duration": 0.0, "throughput": 0.0, "error": start_errors.get(target)})
+                continue
+            total_bytes += transfer.transferred
+            results.append({"target": target, "status": transfer.status, "bytes": transfer.transferred,
+                            "duration": transfer.elapsed, "throughput": transfer.average_rate,
+                            "error": transfer.error})
+        duration = ((self.ended or time.monotonic()) - self.started) if self.started else 0.0
+        return {
+            "file": self.file_path,
+            "parallelism": self.parallelism,
+            "complete": sum(1 for result in results if result["status"] == "complete"),
+            "failed": sum(1 for result in results if result["status"] not in ("complete", "skipped")),
+            "bytes": total_bytes,
+            "duration": duration,
+            "throughput": total_bytes / duration if duration > 0 else 0.0,
+            "targets": results,
+        }
+
+    def _start_more(self):
+        """Start pending targets until the parallelism limit is reached."""
+        while True:
+            with self.lock:
+                if self.cancelled or not self.pending or self.running >= self.parallelism:
+                    return
+                target = self.pending.popleft()
+                self.running += 1
+            try:
+                transfer = self.start_transfer(target)
+            except Exception as error:
+                if self.log:
+                    self.log.error("Failed to start push to %s: %s", target, error)
+                with self.lock:
+                    self.start_errors[target] = str(error)
+                    self.running -= 1
+                    done = not self.running and not self.pending
+                if done:
+                    self._complete()
+                continue
+            with self.lock:
+                self.transfers[target] = transfer
+            transfer.add_done_callback(self._transfer_done)
+
+    def _transfer_done(self, transfer):
+        """Done callback of a transfer freeing its slot."""
+        with self.lock:
+            self.running -= 1
+            done = not self.running and not self.pending
+        if done:
+            self._complete()
+        else:
+            self._start_more()
+
+    def _complete(self):
+        """Record the end time and deliver the report once."""
+        with self.lock:
+            if self.finished.is_set():
+                return
+            self.ended = time.monotonic()
+            self.finished.set()
+        report = self.get_report()
+        if self.log:
+            self.log.info("Pushed %s: %d/%d complete, %d bytes in %.2fs (%.2f MB/s)", self.file_path,
+                          report["complete"], len(self.targets), report["bytes"], report["duration"],
+                          report["throughput"] / 1e6)
+        if self.on_finished:
+            try:
+                self.on_finished(report)
+            except Exception as error:
+                if self.log:
+                    self.log.warning("Push report callback failed: %s", error)
@@ -0,0 +1,174 @@
+import threading
+import time
+
+
+class OperationResult:
+    """Outcome of a device operation together with its measured completion latency.
+
+    Evaluates as a boolean so callers that only check for success keep working.
+    """
+
+    def __init__(self, success, latency=None, error=None):
+        """Initialize the result.
+
+        Args:
+            success: True if the operation reached its target state.
+            latency: Seconds from issuing the operation until completion was observed.
+            error: D-Bus error or description of why the operation failed.
+        """
+        self.success = success
+        self.latency = latency
+        self.error = error
+
+    def __bool__(self):
+        return bool(self.success)
+
+    def __repr__(self):
+        return f"OperationResult(success={self.success}, latency={self.latency}, error={self.error!r})"
+
+
+class OperationHandle:
+    """A manager operation in flight, with its own deadline and a cancel() method.
+
+    The handle finishes exactly once with an OperationResult: when the operation
+    completes or fails, when cancel() is called, or when its deadline passes. Cancelling
+    and expiring run the cancel callback, which asks BlueZ to abort the operation where
+    it supports that (Device1.CancelPairing, Disconnect of a pending connection,
+    Transfer1.Cancel, stopping a stream).
+    """
+
+    def __init__(self, name, timeout=None, cancel_callback=None, wait=None, log=None):
+        """Initialize a running operation.
+
+        Args:
+            name: Description used in logs, e.g. "pair AA:BB:CC:DD:EE:FF".
+            timeout: Seconds until the operation is abandoned, or None for no deadline.
+            cancel_callback: Callable asking BlueZ to abort the operation, without blocking.
+            wait: Callable(event, timeout) returning True once the event is set; lets
+                result() keep D-Bus signals flowing while it blocks. threading.Event.wait
+                is used if not given.
+            log: Logger instance.
+        """
+        self.name = name
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.deadline = None if timeout is None else self.started + timeout
+        self.cancel_callback = cancel_callback
+        self.wait_function = wait
+        self.log = log
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self.outcome = None
+        self.cancelled = False
+        self.done_callbacks = []
+
+    def __repr__(self):
+        return f"OperationHandle({self.name!r}, outcome={self.outcome!r})"
+
+    @classmethod
+    def from_result(cls, name, result):
+        """Return a handle that is already finished with the given OperationResult."""
+        handle = cls(name)
+        handle.outcome = result
+        handle.finished.set()
+        return handle
+
+    @property
+    def is_finished(self):
+        """True once the outcome is known."""
+        return self.finished.is_set()
+
+    @property
+    def elapsed(self):
+        """Seconds since the operation was issued."""
+        return time.monotonic() - self.started
+
+    @property
+    def remaining(self):
+        """Seconds left until the deadline, or None without a deadline."""
+        return None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+
+    def add_done_callback(self, callback):
+        """Call callback(handle) once the operation is finished, immediately if it already is."""
+        with self.lock:
+            if not self.finished.is_set():
+                self.done_callbacks.append(callback)
+                return
+        callback(self)
+
+    def finish(self, success, error=None, cancelled=False):
+        """Record the outcome; only the first call has an effect.
+
+        Args:
+            success: True if the operation reached its target state.
+            error: D-Bus error or description of why the operation failed.
+            cancelled: True when the operation was cancelled or expired; set before the
+                done callbacks run.
+
+        Returns:
+            True if this call finished the operation.
+        """
+        with self.lock:
+            if self.finished.is_set():
+                return False
+            self.cancelled = cancelled
+            self.outcome = OperationResult(success, self.elapsed, error)
+            self.finished.set()
+            callbacks, self.done_callbacks = self.done_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as callback_error:
+                if self.log:
+                    self.log.warning("Done callback of %s failed: %s", self.name, callback_error)
+        return True
+
+    def cancel(self, reason="Cancelled"):
+        """Abandon the operation and ask BlueZ to abort it.
+
+        Args:
+            reason: Error recorded in the OperationResult.
+
+        Returns:
+            True if the operation was still running.
+        """
+        if not self.finish(False, reason, cancelled=True):
+            return False
+        if self.cancel_callback:
+            try:
+                self.cancel_callback()
+            except Exception as error:
+                if self.log:
+                    self.log.warning("Failed to cancel %s: %s", self.name, error)
+        return True
+
+    def expire(self):
+        """Cancel the operation if it is still running at its deadline."""
+        if self.is_finished:
+            return
+        if self.log:
+            self.log.warning("%s timed out after %ss", self.name, self.timeout)
+        self.cancel(f"Timed out after {self.timeout}s")
+
+    def result(self, timeout=None):
+        """Block until the operation is finished or its deadline passes.
+
+        Args:
+            timeout: Maximum number of seconds to wait in this call; the operation keeps
+                running if it ends first.
+
+        Returns:
+            The OperationResult, or None if timeout ended the wait before the deadline.
+        """
+        wait = self.wait_function or (lambda event, seconds: event.wait(seconds))
+        end = None if timeout is None else time.monotonic() + timeout
+        while not self.finished.is_set():
+            remaining = self.remaining
+            if remaining == 0:
+                self.expire()
+                break
+            limits = [limit for limit in (remaining, None if end is None else end - time.monotonic()) if limit is not None]
+            if limits and min(limits) <= 0:
+                return None
+            wait(self.finished, min(limits) if limits else None)
+        return self.outcome
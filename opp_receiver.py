@@ -0,0 +1,322 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import subprocess
+import threading
+import time
+from collections import deque
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+DEFAULT_SAVE_DIRECTORY = "/tmp/bt_opp_inbox"
+
+_libc = None
+
+
+def _get_libc():
+    """Load libc once for the inotify calls."""
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    return _libc
+
+
+class ReceivedFile:
+    """A file obexpushd finished writing into the receive directory."""
+
+    def __init__(self, path, size, duration):
+        """Initialize the record.
+
+        Args:
+            path: Full path of the received file.
+            size: Size of the file in bytes.
+            duration: Seconds between the file being created and closed after writing.
+        """
+        self.path = path
+        self.name = os.path.basename(path)
+        self.size = size
+        self.duration = duration
+
+    def __repr__(self):
+        return f"ReceivedFile({self.path}, {self.size} bytes, {self.duration:.2f}s)"
+
+    @property
+    def throughput(self):
+        """Receive throughput in bytes per second."""
+        return self.size / self.duration if self.duration > 0 else 0.0
+
+
+class DirectoryWatcher:
+    """inotify watch reporting files of a directory once they are completely written.
+
+    A file is reported on IN_CLOSE_WRITE, or on IN_MOVED_TO when the writer renames a
+    temporary file into place, so callers never see partially received files. Waiting
+    blocks in select() and does not consume CPU.
+    """
+
+    def __init__(self, directory):
+        """Start watching a directory.
+
+        Args:
+            directory: Directory to watch; it must exist.
+        """
+        libc = _get_libc()
+        self.directory = directory
+        self.created = {}
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_init1 failed: {os.strerror(error)}")
+        watch = libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_CREATE | IN_CLOSE_WRITE | IN_MOVED_TO)
+        if watch < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, f"inotify_add_watch failed for {directory}: {os.strerror(error)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def read(self, timeout):
+        """Wait for completed files.
+
+        Args:
+            timeout: Maximum number of seconds to wait for an event.
+
+        Returns:
+            List of ReceivedFile completed since the previous call, empty on timeout.
+        """
+        readable, _, _ = select.select([self.fd], [], [], max(0, timeout))
+        if not readable:
+            return []
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        now = time.monotonic()
+        completed = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            _, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            name = buffer[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += EVENT_HEADER.size + length
+            name = os.fsdecode(name)
+            if not name:
+                continue
+            if mask & IN_CREATE:
+                self.created[name] = now
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                path = os.path.join(self.directory, name)
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    continue
+                completed.append(ReceivedFile(path, size, now - self.created.pop(name, now)))
+        return completed
+
+    def close(self):
+        """Stop watching the directory."""
+        if self.fd is not None and self.fd >= 0:
+            os.close(self.fd)
+            self.fd = None
+
+
+class OppReceiverService:
+    """Long-lived obexpushd server accepting inbound OPP pushes back to back.
+
+    obexpushd is started once and kept running across receives; a watcher thread
+    reports each completed file, applies the accept/reject policy (rejected files are
+    deleted) and notifies listeners with "accepted" or "rejected" events. obexpushd is
+    restarted with exponential backoff if it exits unexpectedly or fails to start.
+
+    Every file closed in save_directory is treated as a received push, so it must be a
+    directory used by nothing else.
+    """
+
+    restart_delay = 0.5
+    max_restart_delay = 60
+
+    def __init__(self, save_directory=DEFAULT_SAVE_DIRECTORY, policy=None, log=None, history_size=256):
+        """Initialize the service without starting it.
+
+        Args:
+            save_directory: Dedicated directory obexpushd stores received files in; it is
+                created if missing.
+            policy: Callable receiving a ReceivedFile and returning False to reject it;
+                every file is accepted if not given.
+            log: Logger instance.
+            history_size: Number of accepted files remembered for wait_for_files.
+        """
+        self.save_directory = save_directory
+        self.policy = policy
+        self.log = log
+        self.condition = threading.Condition()
+        self.listeners = []
+        self.accepted = deque(maxlen=history_size)
+        self.accepted_total = 0
+        self.process = None
+        self.spawned_at = 0
+        self.watcher = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    @property
+    def is_running(self):
+        """True while the watcher thread and obexpushd are up."""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start obexpushd and the watcher thread if not running yet."""
+        if self.is_running:
+            return
+        os.makedirs(self.save_directory, exist_ok=True)
+        self.stop_event.clear()
+        self.watcher = DirectoryWatcher(self.save_directory)
+        try:
+            self._spawn()
+        except OSError:
+            self.watcher.close()
+            self.watcher = None
+            raise
+        self.thread = threading.Thread(target=self._run, name="opp-receiver", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the watcher thread and obexpushd."""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+            if self.log:
+                self.log.info("OPP server stopped.")
+        self.process = None
+        if self.watcher:
+            self.watcher.close()
+            self.watcher = None
+
+    def set_policy(self, policy):
+        """Replace the accept/reject policy applied to files received from now on."""
+        self.policy = policy
+
+    def add_listener(self, callback):
+        """Register callback(event, received_file) for "accepted" and "rejected" events.
+
+        Callbacks run on the watcher thread.
+        """
+        with self.condition:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregister a listener added with add_listener."""
+        with self.condition:
+            if callback in self.listeners:
+                self.listeners.remove(callback)
+
+    def wait_for_files(self, count=1, timeout=20):
+        """Block until files are accepted after this call.
+
+        Args:
+            count: Number of accepted files to wait for, or None to wait for the whole timeout.
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            List of ReceivedFile accepted while waiting.
+        """
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            start = self.accepted_total
+            while count is None or self.accepted_total - start < count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+            received = self.accepted_total - start
+            return list(self.accepted)[-received:] if received else []
+
+    def reject(self, received):
+        """Delete an accepted file after the fact and report it as rejected."""
+        try:
+            os.remove(received.path)
+        except OSError as error:
+            if self.log:
+                self.log.warning("Failed to remove rejected file %s: %s", received.path, error)
+        self._notify("rejected", received)
+
+    def _spawn(self):
+        """Start the obexpushd process, raising OSError if it cannot be executed."""
+        self.process = subprocess.Popen(["obexpushd", "-B", "-o", self.save_directory, "-n"])
+        self.spawned_at = time.monotonic()
+        if self.log:
+            self.log.info("OPP server started in %s (pid %s)", self.save_directory, self.process.pid)
+
+    def _run(self):
+        """Watcher thread handling completed files and restarting obexpushd until stopped."""
+        delay = self.restart_delay
+        restart_at = None
+        while not self.stop_event.is_set():
+            for received in self.watcher.read(0.5):
+                self._handle(received)
+            if self.stop_event.is_set():
+                break
+            now = time.monotonic()
+            if self.process is not None and self.process.poll() is None:
+                if now - self.spawned_at > self.max_restart_delay:
+                    delay = self.restart_delay
+                continue
+            if restart_at is None:
+                if self.process is not None and self.log:
+                    self.log.warning("obexpushd exited with code %s, restarting it in %.1fs",
+                                     self.process.returncode, delay)
+                restart_at = now + delay
+                delay = min(delay * 2, self.max_restart_delay)
+                continue
+            if now < restart_at:
+                continue
+            restart_at = None
+            try:
+                self._spawn()
+            except OSError as error:
+                self.process = None
+                if self.log:
+                    self.log.warning("Failed to start obexpushd, retrying in %.1fs: %s", delay, error)
+
+    def _handle(self, received):
+        """Apply the policy to a completed file and notify listeners."""
+        if self.log:
+            self.log.info("Received file: %s (%d bytes in %.2fs)", received.path, received.size, received.duration)
+        try:
+            accept = self.policy is None or self.policy(received)
+        except Exception as error:
+            if self.log:
+                self.log.warning("OPP receive policy failed for %s: %s", received.path, error)
+            accept = False
+        if not accept:
+            self.reject(received)
+            return
+        with self.condition:
+            self.accepted.append(received)
+            self.accepted_total += 1
+            self.condition.notify_all()
+        self._notify("accepted", received)
+
+    def _notify(self, event, received):
+        """Invoke the listeners, isolating their failures from the watcher thread."""
+        with self.condition:
+            listeners = list(self.listeners)
+        for callback in listeners:
+            try:
+                callback(event, received)
+            except Exception as error:
+                if self.log:
+                    self.log.warning("OPP receiver listener failed: %s", error)
@@ -0,0 +1,489 @@
+import os
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtCore import Qt
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QFileDialog
+from PyQt6.QtWidgets import QGroupBox
+from PyQt6.QtWidgets import QHBoxLayout
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtWidgets import QLineEdit
+from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QProgressBar
+from PyQt6.QtWidgets import QPushButton
+from PyQt6.QtWidgets import QVBoxLayout
+from PyQt6.QtWidgets import QWidget
+
+import style_sheet as styles
+from libraries.bluetooth.audio_cache import AUDIO_FILE_FILTER
+
+PROFILE_PANELS = []
+
+
+def register_profile_panel(panel_class):
+    """Class decorator adding a ProfilePanel subclass to the device profile tabs, in registration order."""
+    PROFILE_PANELS.append(panel_class)
+    return panel_class
+
+
+class ProfilePanel(QObject):
+    """A profile tab of the device view, owning its widgets and their handlers.
+
+    Subclasses set title and implement build(). The widget is built on first use and kept
+    for the device state (connection and UUIDs) it was built for, so showing the tab again
+    costs no D-Bus calls.
+    """
+
+    title = None
+
+    def __init__(self, host, device_address, state):
+        """Initialize the panel without building its widgets.
+
+        Args:
+            host: TestApplication the panel is shown in.
+            device_address: Bluetooth address of remote device.
+            state: Device state the panel is built for, as returned by get_device_state.
+        """
+        super().__init__()
+        self.host = host
+        self.bluetooth_device_manager = host.bluetooth_device_manager
+        self.executor = host.executor
+        self.log = host.log
+        self.device_address = device_address
+        self.state = state
+        self.widget = None
+
+    @property
+    def is_connected(self):
+        """True if the device was connected when the panel was built."""
+        return self.state[0]
+
+    @property
+    def is_busy(self):
+        """True while the panel drives a running operation; busy panels are never rebuilt."""
+        return False
+
+    def get_widget(self):
+        """Return the panel widget, building it on first use."""
+        if self.widget is None:
+            self.widget = self.build()
+        return self.widget
+
+    def build(self):
+        """Build and return the panel widget."""
+        raise NotImplementedError
+
+    def detach(self):
+        """Take the widget out of its tab page without deleting it."""
+        if self.widget is not None and self.widget.parent() is not None:
+            self.widget.setParent(None)
+
+    def close(self):
+        """Delete the widget; the panel is rebuilt from scratch on next use."""
+        if self.widget is not None:
+            self.widget.setParent(None)
+            self.widget.deleteLater()
+            self.widget = None
+
+    def create_panel_layout(self):
+        """Return the panel layout holding the heading, and the not-connected warning if applicable."""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(15)
+        heading = QLabel(f"<b>{self.title} Functionality</b>")
+        heading.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        heading.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        layout.addWidget(heading)
+        if not self.is_connected:
+            warning_label = QLabel(f"Device is not connected. Connect to enable {self.title} profile.")
+            warning_label.setObjectName("WarningLabel")
+            warning_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+            warning_label.setStyleSheet(styles.color_style_sheet)
+            layout.addWidget(warning_label)
+        return layout
+
+    @staticmethod
+    def create_button(text, handler, font=None):
+        """Return a profile button connected to handler."""
+        button = QPushButton(text)
+        if font:
+            button.setFont(font)
+        button.setStyleSheet(styles.bluetooth_profiles_button_style)
+        if handler:
+            button.clicked.connect(handler)
+        return button
+
+    @staticmethod
+    def finish_panel(layout):
+        """Wrap a panel layout into its widget."""
+        layout.addStretch(1)
+        widget = QWidget()
+        widget.setLayout(layout)
+        return widget
+
+
+@register_profile_panel
+class A2dpPanel(ProfilePanel):
+    """A2DP panel combining source streaming and sink media control, based on the device's A2DP role."""
+
+    title = "A2DP"
+
+    def __init__(self, host, device_address, state):
+        super().__init__(host, device_address, state)
+        self.audio_location_input = None
+        self.start_streaming_button = None
+        self.stop_streaming_button = None
+        self.streaming = False
+
+    @property
+    def is_busy(self):
+        """True while the stream started from this panel is still running."""
+        return self.streaming and self.bluetooth_device_manager.get_a2dp_stream_stats() is not None
+
+    def build(self):
+        """Build the streaming controls for a sink device, or the media controls for a source device."""
+        bold_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        layout = self.create_panel_layout()
+        if not self.is_connected:
+            return self.finish_panel(layout)
+        role = self.bluetooth_device_manager.get_a2dp_role_for_device(self.device_address)
+        if role == "sink":
+            streaming_group = QGroupBox("Streaming Audio (A2DP Source)")
+            streaming_group.setStyleSheet(styles.bluetooth_profiles_groupbox_style)
+            streaming_layout = QVBoxLayout()
+            streaming_layout.setSpacing(10)
+            streaming_layout.setContentsMargins(10, 10, 10, 10)
+            audio_layout = QHBoxLayout()
+            audio_label = QLabel("Audio File:")
+            audio_label.setFont(bold_font)
+            audio_layout.addWidget(audio_label)
+            self.audio_location_input = QLineEdit()
+            self.audio_location_input.setReadOnly(True)
+            self.audio_location_input.setFixedHeight(28)
+            audio_layout.addWidget(self.audio_location_input)
+            audio_layout.addWidget(self.create_button("Browse... ", self.select_audio_file))
+            streaming_layout.addLayout(audio_layout)
+            streaming_buttons_layout = QHBoxLayout()
+            streaming_buttons_layout.setSpacing(12)
+            self.start_streaming_button = self.create_button("Start Streaming", self.start_a2dp_streaming)
+            streaming_buttons_layout.addWidget(self.start_streaming_button)
+            self.stop_streaming_button = self.create_button("Stop Streaming", self.stop_a2dp_streaming)
+            self.stop_streaming_button.setEnabled(False)
+            streaming_buttons_layout.addWidget(self.stop_streaming_button)
+            streaming_layout.addLayout(streaming_buttons_layout)
+            streaming_group.setLayout(streaming_layout)
+            layout.addWidget(streaming_group)
+        elif role == "source":
+            media_control_group = QGroupBox("Media Control (A2DP Sink)")
+            media_control_group.setFont(bold_font)
+            media_control_group.setStyleSheet(styles.bluetooth_profiles_groupbox_style)
+            media_control_layout = QVBoxLayout()
+            media_control_layout.setSpacing(12)
+            media_control_layout.setContentsMargins(10, 10, 10, 10)
+            control_buttons = QHBoxLayout()
+            control_buttons.setSpacing(12)
+            for text, command in (("Play", "play"), ("Pause", "pause"), ("Next", "next"),
+                                  ("Previous", "previous"), ("Rewind", "rewind")):
+                button = self.create_button(text, None, bold_font)
+                button.clicked.connect(lambda _, command=command, button=button: self.send_media_control_command(command, button))
+                control_buttons.addWidget(button)
+            media_control_layout.addLayout(control_buttons)
+            media_control_group.setLayout(media_control_layout)
+            layout.addWidget(media_control_group)
+        return self.finish_panel(layout)
+
+    def send_media_control_command(self, command, button=None):
+        """Sends a media control command to the connected Bluetooth device on a worker thread.
+
+        Args:
+            command: The media control command to send (e.g., "play", "pause", "next", "previous").
+            button: Button that issued the command, shown busy until it is sent.
+        """
+        self.executor.submit(
+            self.bluetooth_device_manager.media_control, command, self.device_address, key=self.device_address,
+            on_result=lambda _: self.log.info("Media command %s sent to device %s.", command, self.device_address),
+            buttons=[button] if button else [])
+
+    def start_a2dp_streaming(self):
+        """Start A2DP streaming to the sink device."""
+        audio_path = self.audio_location_input.text().strip()
+        if not audio_path or not os.path.exists(audio_path):
+            QMessageBox.warning(self.host, "Invalid Audio File", "Please select a valid audio file to stream.")
+            return
+        self.log.info("Selected device address for streaming:%s", self.device_address)
+        self.executor.submit(
+            self.bluetooth_device_manager.start_a2dp_stream, self.device_address, audio_path, key=self.device_address,
+            on_result=lambda success: self.handle_streaming_started(success, audio_path),
+            on_error=lambda _: self.handle_streaming_started(False, audio_path),
+            buttons=[self.start_streaming_button], busy_text="Starting...")
+
+    def handle_streaming_started(self, success, audio_path):
+        """Update the streaming buttons once start_a2dp_stream returned.
+
+        Args:
+            success: Whether streaming started.
+            audio_path: Streamed audio file.
+        """
+        if success:
+            self.log.info("A2DP streaming successfully started with file: %s", audio_path)
+            self.streaming = True
+            self.start_streaming_button.setEnabled(False)
+            self.stop_streaming_button.setEnabled(True)
+        else:
+            self.log.error("Failed to start A2DP streaming with file: %s", audio_path)
+            QMessageBox.critical(self.host, "Streaming Failed", "Failed to start streaming.")
+
+    def stop_a2dp_streaming(self):
+        """Stop active A2DP streaming session on a worker thread."""
+        def handle_error(error):
+            self.log.error("Failed to stop A2DP streaming for device: %s. Error: %s", self.device_address, error)
+            QMessageBox.critical(self.host, "Stop Streaming Failed", "Failed to stop A2DP streaming.")
+
+        def handle_stopped(_):
+            self.log.info("A2DP streaming stopped for device: %s", self.device_address)
+            self.streaming = False
+            self.start_streaming_button.setEnabled(True)
+            self.stop_streaming_button.setEnabled(False)
+
+        self.executor.submit(self.bluetooth_device_manager.stop_a2dp_stream, key=self.device_address,
+                             on_result=handle_stopped, on_error=handle_error,
+                             buttons=[self.stop_streaming_button], busy_text="Stopping...")
+
+    def select_audio_file(self):
+        """Open a file dialog for selecting an audio file."""
+        file_dialog = QFileDialog()
+        file_path, _ = file_dialog.getOpenFileName(caption="Select Audio File", filter=AUDIO_FILE_FILTER)
+        if file_path:
+            if os.path.exists(file_path):
+                self.audio_location_input.setText(file_path)
+                self.log.info("Audio file selected.")
+            else:
+                self.log.warning(f"Selected file does not exist: {file_path}")
+                QMessageBox.warning(self.host, "Invalid File", "The selected file does not exist.")
+
+
+@register_profile_panel
+class OppPanel(ProfilePanel):
+    """OPP (Object Push Profile) panel for Bluetooth file transfer."""
+
+    title = "OPP"
+    transfer_progress = pyqtSignal(object)
+    transfer_finished = pyqtSignal(object)
+
+    def __init__(self, host, device_address, state):
+        super().__init__(host, device_address, state)
+        self.active_transfer = None
+        self.opp_location_input = None
+        self.send_file_button = None
+        self.receive_file_button = None
+        self.cancel_transfer_button = None
+        self.transfer_progress_bar = None
+        self.transfer_rate_label = None
+        self.transfer_progress.connect(self.update_transfer_progress)
+        self.transfer_finished.connect(self.handle_transfer_finished)
+
+    @property
+    def is_busy(self):
+        """True while an OPP transfer started from this panel is running."""
+        return self.active_transfer is not None
+
+    def build(self):
+        """Build the file selection, send/receive buttons and transfer progress."""
+        bold_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        layout = self.create_panel_layout()
+        if not self.is_connected:
+            widget = self.finish_panel(layout)
+            widget.setStyleSheet(styles.device_tab_widget_style_sheet)
+            return widget
+        opp_group = QGroupBox("File Transfer")
+        opp_group.setStyleSheet(styles.bluetooth_profiles_groupbox_style)
+        opp_layout = QVBoxLayout()
+        opp_layout.setSpacing(10)
+        opp_layout.setContentsMargins(10, 10, 10, 10)
+        file_selection_layout = QHBoxLayout()
+        file_label = QLabel("Select File:")
+        file_label.setFont(bold_font)
+        file_selection_layout.addWidget(file_label)
+        self.opp_location_input = QLineEdit()
+        self.opp_location_input.setReadOnly(True)
+        self.opp_location_input.setFixedHeight(28)
+        file_selection_layout.addWidget(self.opp_location_input)
+        file_selection_layout.addWidget(self.create_button("Browse", self.select_opp_file, bold_font))
+        opp_layout.addLayout(file_selection_layout)
+        button_layout = QHBoxLayout()
+        self.send_file_button = self.create_button("Send File", self.send_file, bold_font)
+        button_layout.addWidget(self.send_file_button)
+        self.receive_file_button = self.create_button("Receive File", self.receive_file, bold_font)
+        button_layout.addWidget(self.receive_file_button)
+        self.cancel_transfer_button = self.create_button("Cancel", self.cancel_file_transfer, bold_font)
+        self.cancel_transfer_button.setEnabled(False)
+        button_layout.addWidget(self.cancel_transfer_button)
+        opp_layout.addLayout(button_layout)
+        self.transfer_progress_bar = QProgressBar()
+        self.transfer_progress_bar.setRange(0, 100)
+        self.transfer_progress_bar.setValue(0)
+        opp_layout.addWidget(self.transfer_progress_bar)
+        self.transfer_rate_label = QLabel("")
+        self.transfer_rate_label.setFont(bold_font)
+        opp_layout.addWidget(self.transfer_rate_label)
+        opp_group.setLayout(opp_layout)
+        layout.addWidget(opp_group)
+        return self.finish_panel(layout)
+
+    def select_opp_file(self):
+        """Open a file dialog to select a file to send via OPP."""
+        file_dialog = QFileDialog()
+        file_path, _ = file_dialog.getOpenFileName(None, "Select File to Send via OPP", "", "All Files (*)")
+        if file_path:
+            if not os.path.exists(file_path):
+                QMessageBox.critical(None, "Invalid File", "The selected file does not exist.")
+                self.log.error("Selected OPP file does not exist: %s", file_path)
+                return
+            self.opp_location_input.setText(file_path)
+            self.log.info("File selected to send via OPP")
+
+    def send_file(self):
+        """Start sending the selected file to the remote device using OPP without blocking the UI."""
+        file_path = self.opp_location_input.text()
+        if not file_path:
+            QMessageBox.warning(None, "OPP", "Please select a device and a file.")
+            return
+        self.send_file_button.setEnabled(False)
+        self.send_file_button.setText("Sending...")
+        self.cancel_transfer_button.setEnabled(True)
+        self.transfer_progress_bar.setValue(0)
+        self.transfer_rate_label.setText("Connecting...")
+        try:
+            self.active_transfer = self.bluetooth_device_manager.send_file_async(
+                self.device_address, file_path, on_progress=self.transfer_progress.emit,
+                on_finished=self.transfer_finished.emit)
+        except Exception as error:
+            self.log.info("UI error:%s", error)
+            self.active_transfer = None
+            self.reset_transfer_controls()
+            QMessageBox.warning(None, "OPP", "File transfer failed or was rejected.")
+
+    def cancel_file_transfer(self):
+        """Cancel the running OPP transfer."""
+        if self.active_transfer:
+            self.log.info("Cancelling OPP transfer to %s", self.active_transfer.device_address)
+            self.active_transfer.cancel()
+
+    def update_transfer_progress(self, transfer):
+        """Show the progress and throughput of the running OPP transfer.
+
+        Args:
+            transfer: ObexTransfer handle reporting progress.
+        """
+        if transfer is not self.active_transfer:
+            return
+        try:
+            self.transfer_progress_bar.setValue(int(transfer.progress * 100))
+            self.transfer_rate_label.setText(
+                f"{transfer.transferred / 1e6:.2f} / {transfer.size / 1e6:.2f} MB  "
+                f"{transfer.instant_rate / 1e6:.2f} MB/s (avg {transfer.average_rate / 1e6:.2f} MB/s)")
+        except (AttributeError, RuntimeError):
+            pass
+
+    def handle_transfer_finished(self, transfer):
+        """Report the final status of an OPP transfer and re-enable the controls.
+
+        Args:
+            transfer: Finished ObexTransfer handle.
+        """
+        if transfer is not self.active_transfer:
+            return
+        self.update_transfer_progress(transfer)
+        self.active_transfer = None
+        self.reset_transfer_controls()
+        if transfer.status == "complete":
+            QMessageBox.information(None, "OPP", "File sent successfully!")
+        elif transfer.status == "cancelled":
+            QMessageBox.information(None, "OPP", "File transfer was cancelled.")
+        else:
+            QMessageBox.warning(None, "OPP", "File transfer failed or was rejected.")
+
+    def reset_transfer_controls(self):
+        """Return the OPP buttons to the idle state; the panel may have been closed."""
+        try:
+            self.send_file_button.setEnabled(True)
+            self.send_file_button.setText("Send File")
+            self.cancel_transfer_button.setEnabled(False)
+        except (AttributeError, RuntimeError):
+            pass
+
+    def receive_file(self):
+        """Wait for an inbound OPP push on a worker thread; the user confirms the file on the GUI thread."""
+        def confirm(file_path):
+            return self.executor.run_on_gui_thread(self.host.prompt_file_transfer_confirmation, file_path)
+
+        def handle_received(received_file_path):
+            if received_file_path:
+                QMessageBox.information(None, "File Received", f"File received successfully:\n{received_file_path}")
+            else:
+                QMessageBox.warning(None, "File Transfer", "No file received or user declined the transfer.")
+
+        self.executor.submit(
+            lambda: self.bluetooth_device_manager.receive_file(user_confirm_callback=confirm), key="opp-receive",
+            on_result=handle_received,
+            on_error=lambda error: QMessageBox.critical(None, "Error", f"An error occurred during file reception:\n{str(error)}"),
+            buttons=[self.receive_file_button], busy_text="Receiving...")
+
+
+class ProfilePanelCache:
+    """Profile panels of the device view, cached per device and tab.
+
+    A cached panel is reused as long as the device state it was built for is unchanged;
+    it is rebuilt only when the device's Connected or UUIDs property differs, or after
+    invalidate() is called for the device. A busy panel (a stream or transfer is running)
+    is kept until its operation ends, so its controls and handle survive the rebuild.
+    """
+
+    def __init__(self, host):
+        """Initialize an empty cache.
+
+        Args:
+            host: TestApplication the panels are shown in.
+        """
+        self.host = host
+        self.panels = {}
+
+    def get(self, device_address, panel_class, state):
+        """Return the panel of a device and tab, creating it if missing or built for another state.
+
+        Args:
+            device_address: Bluetooth address of remote device.
+            panel_class: Registered ProfilePanel subclass.
+            state: Current device state, as returned by get_device_state.
+        """
+        key = (device_address, panel_class.title)
+        panel = self.panels.get(key)
+        if panel is not None and panel.state != state and not panel.is_busy:
+            self.panels.pop(key).close()
+            panel = None
+        if panel is None:
+            panel = panel_class(self.host, device_address, state)
+            self.panels[key] = panel
+        return panel
+
+    def invalidate(self, device_address):
+        """Drop the idle cached panels of a device."""
+        for key in [key for key, panel in self.panels.items() if key[0] == device_address and not panel.is_busy]:
+            self.panels.pop(key).close()
+
+    def remove(self, device_address):
+        """Drop every cached panel of a device, busy or not; used once the device is gone."""
+        for key in [key for key in self.panels if key[0] == device_address]:
+            self.panels.pop(key).close()
+
+    def detach(self):
+        """Take every cached widget out of its tab page so the tab widget can be deleted."""
+        for panel in self.panels.values():
+            panel.detach()
+
+    def clear(self):
+        """Drop every cached panel."""
+        for panel in self.panels.values():
+            panel.close()
+        self.panels = {}
@@ -0,0 +1,81 @@
+import threading
+from collections import OrderedDict
+
+import dbus
+
+from libraries.bluetooth import constants
+
+
+class DeviceProxies:
+    """D-Bus proxy of a single BlueZ device object together with its wrapped interfaces."""
+
+    def __init__(self, bus, path):
+        """Create the object proxy without runtime introspection.
+
+        Args:
+            bus: D-Bus system bus connection.
+            path: D-Bus object path of the device.
+        """
+        self.path = path
+        self.proxy = bus.get_object(constants.bluez_service, path, introspect=False)
+        self.device = dbus.Interface(self.proxy, constants.device_interface)
+        self.properties = dbus.Interface(self.proxy, constants.properties_interface)
+        self.media_control = dbus.Interface(self.proxy, constants.media_control_interface)
+
+
+class DeviceProxyPool:
+    """Bounded least-recently-used pool of per-device D-Bus proxies."""
+
+    def __init__(self, bus, max_size=64, log=None):
+        """Initialize an empty pool.
+
+        Args:
+            bus: D-Bus system bus connection.
+            max_size: Maximum number of devices whose proxies are kept alive.
+            log: Logger instance.
+        """
+        self.bus = bus
+        self.max_size = max_size
+        self.log = log
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, path):
+        """Return the pooled proxies for a device, creating them on first use.
+
+        Args:
+            path: D-Bus object path of the device.
+
+        Returns:
+            DeviceProxies instance for the path.
+        """
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None:
+                self.entries.move_to_end(path)
+                return entry
+            entry = DeviceProxies(self.bus, path)
+            self.entries[path] = entry
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+            return entry
+
+    def evict(self, path):
+        """Drop the proxies of a device, e.g. after its object was removed from BlueZ.
+
+        Args:
+            path: D-Bus object path of the device.
+        """
+        with self.lock:
+            if self.entries.pop(path, None) is not None and self.log:
+                self.log.debug("Evicted D-Bus proxies for %s", path)
+
+    def clear(self):
+        """Drop every pooled proxy."""
+        with self.lock:
+            self.entries.clear()
+
+    def handle_index_event(self, event, path, interface, properties):
+        """Device index listener evicting proxies of objects that lost their Device1 interface."""
+        if event == "removed" and interface == constants.device_interface:
+            self.evict(path)
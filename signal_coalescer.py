@@ -0,0 +1,98 @@
+import threading
+
+from gi.repository import GLib
+
+
+class PropertyCoalescer:
+    """Merges high-rate property updates per key and flushes them at a fixed rate.
+
+    Updates for the same key (e.g. a device address) arriving between two flushes are
+    merged so only the latest value of every property is delivered. Consumers such as the
+    discovery table or a logger therefore see at most one batch per flush interval no
+    matter how fast RSSI or ManufacturerData signals arrive.
+    """
+
+    def __init__(self, on_flush, flush_interval=0.05, max_pending=5000, log=None):
+        """Initialize the coalescer.
+
+        Args:
+            on_flush: Callable receiving a list of (event, values) tuples per flush, where
+                values is the merged dictionary of the key.
+            flush_interval: Seconds between flushes.
+            max_pending: Maximum number of distinct keys buffered between flushes; updates
+                for new keys beyond this limit are dropped.
+            log: Logger instance.
+        """
+        self.on_flush = on_flush
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.log = log
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.source_id = None
+        self.counters = {"received": 0, "merged": 0, "dropped": 0, "flushed": 0, "flushes": 0}
+
+    def push(self, key, event, values):
+        """Queue an update, merging it with a pending update of the same key.
+
+        Args:
+            key: Merge key, e.g. a device address.
+            event: "added", "changed" or "removed". A removal replaces any pending update,
+                as does an addition following a pending removal, and an addition is not
+                downgraded by later changes.
+            values: Dictionary of property values.
+        """
+        with self.lock:
+            self.counters["received"] += 1
+            pending = self.pending.get(key)
+            if pending is None:
+                if len(self.pending) >= self.max_pending:
+                    self.counters["dropped"] += 1
+                    return
+                self.pending[key] = (event, dict(values))
+            else:
+                self.counters["merged"] += 1
+                pending_event, pending_values = pending
+                if event == "removed":
+                    self.pending[key] = (event, dict(values))
+                elif event == "added" and pending_event == "removed":
+                    # The key came back within one interval; the removed payload is stale.
+                    self.pending[key] = (event, dict(values))
+                else:
+                    pending_values.update(values)
+                    self.pending[key] = ("added" if pending_event in ("added", "removed") else event, pending_values)
+            if self.source_id is None:
+                self.source_id = GLib.timeout_add(max(1, int(self.flush_interval * 1000)), self.flush)
+
+    def flush(self):
+        """Deliver all pending updates as one batch.
+
+        Returns:
+            False so the GLib timeout source is removed; the next push re-arms it.
+        """
+        with self.lock:
+            batch = list(self.pending.values())
+            self.pending = {}
+            self.source_id = None
+            self.counters["flushed"] += len(batch)
+            self.counters["flushes"] += 1 if batch else 0
+        if batch:
+            try:
+                self.on_flush(batch)
+            except Exception as error:
+                if self.log:
+                    self.log.warning("Coalesced flush failed: %s", error)
+        return False
+
+    def get_counters(self):
+        """Return a copy of the received, merged, dropped and flushed event counters."""
+        with self.lock:
+            return dict(self.counters)
+
+    def close(self):
+        """Cancel the pending flush and drop buffered updates."""
+        with self.lock:
+            if self.source_id is not None:
+                GLib.source_remove(self.source_id)
+                self.source_id = None
+            self.pending = {}
@@ -0,0 +1,173 @@
+import threading
+from collections import deque
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QRunnable
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtCore import pyqtSignal
+
+
+class UiJob(QRunnable):
+    """A blocking call run on the worker pool; its outcome is reported through the executor."""
+
+    def __init__(self, executor, function, args, key, on_result, on_error, buttons, busy_text):
+        """Initialize the job.
+
+        Args:
+            executor: UiExecutor that runs the job.
+            function: Callable to run off the GUI thread.
+            args: Positional arguments of function.
+            key: Serialization key (e.g., a device address), or None.
+            on_result: Callable receiving the return value, on the GUI thread.
+            on_error: Callable receiving the raised exception, on the GUI thread.
+            buttons: Buttons shown busy while the job is queued or running.
+            busy_text: Text shown on the buttons while busy, or None to keep it.
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.executor = executor
+        self.function = function
+        self.args = args
+        self.key = key
+        self.on_result = on_result
+        self.on_error = on_error
+        self.buttons = [(button, button.text()) for button in buttons]
+        self.busy_text = busy_text
+
+    def run(self):
+        """Worker thread body."""
+        try:
+            result = self.function(*self.args)
+        except Exception as error:
+            self.executor.job_finished.emit(self, None, error)
+            return
+        self.executor.job_finished.emit(self, result, None)
+
+
+class UiExecutor(QObject):
+    """Runs blocking BluetoothDeviceManager calls on a QThreadPool instead of the GUI thread.
+
+    Results and errors are delivered through a queued signal, so callbacks always run on
+    the GUI thread. Jobs sharing a key (usually the device address) run one at a time in
+    submission order; jobs with different keys run in parallel. Buttons passed with a job
+    are disabled until it finishes.
+    """
+
+    job_finished = pyqtSignal(object, object, object)
+    gui_call_requested = pyqtSignal(object)
+
+    def __init__(self, parent=None, max_threads=4, log=None):
+        """Initialize the executor.
+
+        Args:
+            parent: Parent QObject living on the GUI thread.
+            max_threads: Maximum number of worker threads.
+            log: Logger instance.
+        """
+        super().__init__(parent)
+        self.log = log
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.queues = {}
+        self.running = set()
+        self.gui_thread = threading.get_ident()
+        self.job_finished.connect(self._handle_finished)
+        self.gui_call_requested.connect(self._run_gui_call)
+
+    def submit(self, function, *args, key=None, on_result=None, on_error=None, buttons=(), busy_text=None):
+        """Run function(*args) on the worker pool.
+
+        Args:
+            function: Blocking callable to run off the GUI thread.
+            args: Positional arguments of function.
+            key: Jobs with the same key are serialized; None runs the job unordered.
+            on_result: Callable receiving the return value, on the GUI thread.
+            on_error: Callable receiving the raised exception, on the GUI thread.
+            buttons: Buttons to disable (and relabel with busy_text) until the job finishes.
+            busy_text: Text shown on the buttons while busy, e.g. "Connecting...".
+
+        Returns:
+            The queued UiJob.
+        """
+        job = UiJob(self, function, args, key, on_result, on_error, buttons, busy_text)
+        for button, _ in job.buttons:
+            button.setEnabled(False)
+            if busy_text:
+                button.setText(busy_text)
+        if key is None:
+            self._start(job)
+            return job
+        queue = self.queues.setdefault(key, deque())
+        queue.append(job)
+        if len(queue) == 1:
+            self._start(job)
+        return job
+
+    def is_busy(self, key):
+        """True while a job with the given key is queued or running."""
+        return bool(self.queues.get(key))
+
+    def run_on_gui_thread(self, function, *args):
+        """Run function(*args) on the GUI thread and wait for its result.
+
+        Lets a worker job ask the user something (e.g., to confirm a received file)
+        without touching widgets from the worker thread.
+        """
+        if threading.get_ident() == self.gui_thread:
+            return function(*args)
+        call = {"function": function, "args": args, "done": threading.Event()}
+        self.gui_call_requested.emit(call)
+        call["done"].wait()
+        if "error" in call:
+            raise call["error"]
+        return call.get("result")
+
+    def wait_for_done(self, timeout_ms=-1):
+        """Wait for every running job; used on shutdown."""
+        return self.pool.waitForDone(timeout_ms)
+
+    def _start(self, job):
+        """Hand a job to the worker pool."""
+        self.running.add(job)
+        self.pool.start(job)
+
+    def _handle_finished(self, job, result, error):
+        """Deliver a job's outcome on the GUI thread and start the next job of its key."""
+        self.running.discard(job)
+        if job.key is not None:
+            queue = self.queues.get(job.key)
+            if queue and queue[0] is job:
+                queue.popleft()
+            if queue:
+                self._start(queue[0])
+            else:
+                self.queues.pop(job.key, None)
+        for button, text in job.buttons:
+            try:
+                button.setText(text)
+                button.setEnabled(True)
+            except RuntimeError:
+                pass
+        try:
+            if error is not None:
+                if self.log:
+                    self.log.error("Background operation failed: %s", error)
+                if job.on_error:
+                    job.on_error(error)
+            elif job.on_result:
+                job.on_result(result)
+        except Exception as callback_error:
+            # An exception escaping a slot aborts a PyQt6 application; the widgets the
+            # callback updates may also have been deleted while the job was running.
+            if self.log:
+                self.log.warning("Background operation callback failed: %s", callback_error)
+
+    @staticmethod
+    def _run_gui_call(call):
+        """Run a call requested by run_on_gui_thread."""
+        try:
+            call["result"] = call["function"](*call["args"])
+        except Exception as error:
+            call["error"] = error
+        finally:
+            call["done"].set()